@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for loading the Pokemon data
+Compares parsing data_sources/pokemon_data.json with opening the binary
+catalog, both to a ready-to-query PokemonCatalog, plus a full lookup pass.
+"""
+
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data.pokemon_catalog import PokemonCatalog, build_catalog
+
+SOURCE_FILE = os.path.join(os.path.dirname(__file__), '..', 'data_sources', 'pokemon_data.json')
+RUNS = 50
+
+
+def load_json():
+    with open(SOURCE_FILE, 'r', encoding='utf-8') as f:
+        return PokemonCatalog.from_dict(json.load(f))
+
+
+def time_runs(load):
+    """Return load times in milliseconds, closing each catalog afterwards"""
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        catalog = load()
+        samples.append((time.perf_counter() - start) * 1000)
+        catalog.close()
+    return samples
+
+
+def lookup_pass(catalog):
+    """Touch every field of every Pokemon, as a full filter pass would"""
+    start = time.perf_counter()
+    for pokemon_id in range(len(catalog)):
+        catalog.sprite_url(pokemon_id)
+        catalog.variant(pokemon_id)
+        catalog.generation(pokemon_id)
+    return (time.perf_counter() - start) * 1000
+
+
+def report(label, samples):
+    print(f"  {label:<16} mean {statistics.mean(samples):>7.2f} ms   p50 {statistics.median(samples):>7.2f} ms   min {min(samples):>7.2f} ms")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog_path = os.path.join(tmp, 'pokemon_catalog.bin')
+        count = build_catalog(SOURCE_FILE, catalog_path)
+
+        print("=" * 70)
+        print("    POKEMON DATA STARTUP")
+        print("=" * 70)
+        print(f"\n📊 {count} Pokémon - JSON {os.path.getsize(SOURCE_FILE) / 1024:.0f} KB, "
+              f"catalog {os.path.getsize(catalog_path) / 1024:.0f} KB")
+
+        report("json.load", time_runs(load_json))
+        report("mmap catalog", time_runs(lambda: PokemonCatalog.open(catalog_path, SOURCE_FILE)))
+        report("mmap (no check)", time_runs(lambda: PokemonCatalog.open(catalog_path)))
+
+        json_catalog = load_json()
+        mapped_catalog = PokemonCatalog.open(catalog_path)
+        print(f"\n  lookup pass      json {lookup_pass(json_catalog):.2f} ms   mmap {lookup_pass(mapped_catalog):.2f} ms")
+        mapped_catalog.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Throughput of the headless game engine
+Plays batches of simulated matches for each strategy pairing, first in this
+process and then across a process pool, and reports games per second.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.engine import simulate
+
+GAMES = 50_000
+PAIRINGS = [('random', 'random'), ('halving', 'halving'), ('random', 'halving')]
+
+
+def describe(stats):
+    games = stats['games']
+    reasons = ", ".join(f"{reason} {count / games:.0%}" for reason, count in sorted(stats['reasons'].items()))
+    return (f"{stats['games_per_second']:9,.0f} games/s   P1 wins {stats['wins'][1] / games:.0%}   "
+            f"avg {stats['turns'] / games:.1f} turns   {reasons}")
+
+
+def main():
+    workers = os.cpu_count() or 1
+    print(f"Simulated matches ({GAMES:,} per run)")
+    for pairing in PAIRINGS:
+        label = " vs ".join(pairing)
+        print(f"  {label:18} 1 worker  {describe(simulate(GAMES, pairing, workers=1, seed=1))}")
+        if workers > 1:
+            print(f"  {label:18} {workers} workers {describe(simulate(GAMES, pairing, workers=workers, seed=1, chunk_size=5000))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Grids dealt per second from the real roster
+Compares the copy / remove / sample dealing generate_grids used to do on names
+with GridSampler on catalog ids, unconstrained and with dealing rules.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data.pokemon_data_manager import PokemonDataManager
+
+GRIDS = 20_000
+
+
+def copy_remove_sample(pokemon_list, chosen):
+    """generate_grids before the sampler: copy the list, remove the chosen name, sample 23"""
+    available_pokemon = pokemon_list.copy()
+    if chosen in available_pokemon:
+        available_pokemon.remove(chosen)
+    grid = random.sample(available_pokemon, 23)
+    grid.append(chosen)
+    random.shuffle(grid)
+    return grid
+
+
+def grids_per_second(deal):
+    start = time.perf_counter()
+    for _ in range(GRIDS):
+        deal()
+    return GRIDS / (time.perf_counter() - start)
+
+
+def main():
+    data_manager = PokemonDataManager()
+    names = data_manager.filter_pokemon_by_settings(
+        {str(generation) for generation in range(1, 10)}, data_manager.get_all_variants()
+    )
+    print(f"Dealing {GRIDS:,} grids from {len(names):,} Pokémon")
+
+    rate = grids_per_second(lambda: copy_remove_sample(names, random.choice(names)))
+    print(f"  names: copy + remove + sample        {rate:9,.0f} grids/s")
+
+    for label, rules in (("no rules", {}),
+                         ("one per species", {'unique_species': True}),
+                         ("one per species, <= 2 variants", {'unique_species': True, 'max_variants': 2})):
+        sampler = data_manager.grid_sampler(names, rng=1, **rules)
+        rate = grids_per_second(lambda: sampler.deal(sampler.random_id()))
+        print(f"  ids: {label:32} {rate:9,.0f} grids/s")
+
+
+if __name__ == "__main__":
+    main()
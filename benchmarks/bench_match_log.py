@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Match log size and speed
+Records simulated matches to one log, then reads the log back and replays
+every match on the headless engine, reporting bytes per match and matches/s.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.engine import GameEngine, GridSampler, MatchRecorder, read_matches, replay, STRATEGIES
+
+MATCHES = 20_000
+
+
+def main():
+    rng = random.Random(1)
+    sampler = GridSampler(range(1025), rng=rng)
+    strategies = (None, STRATEGIES['halving'], STRATEGIES['random'])
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'matches.wyplog')
+
+        start = time.perf_counter()
+        recorder = MatchRecorder(path)
+        for seed in range(MATCHES):
+            chosen1, chosen2 = sampler.random_id(), sampler.random_id()
+            engine = GameEngine(sampler.deal(chosen1), sampler.deal(chosen2), chosen1, chosen2)
+            recorder.start(engine, seed)
+            while not engine.finished:
+                strategies[engine.current_player](engine, rng)
+        recorder.close()
+        record_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matches = read_matches(path)
+        read_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        for match in matches:
+            replay(match)
+        replay_seconds = time.perf_counter() - start
+
+        size = os.path.getsize(path)
+        events = sum(len(match.events) for match in matches)
+        print(f"{MATCHES:,} matches, {events / MATCHES:.1f} events each, {size / MATCHES:.0f} bytes each")
+        print(f"  play + record  {MATCHES / record_seconds:9,.0f} matches/s")
+        print(f"  read log       {MATCHES / read_seconds:9,.0f} matches/s")
+        print(f"  replay         {MATCHES / replay_seconds:9,.0f} matches/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Computer opponent thinking time and strength
+Times QuestioningPlayer.plan_turn with the real catalog's questions (the part
+that runs on the Tk thread) and plays it against the scripted strategies.
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data.pokemon_data_manager import PokemonDataManager
+from src.engine import GameEngine, GridSampler, QuestioningPlayer, simulate
+
+TURNS = 5_000
+GAMES = 2_000
+
+
+def main():
+    data_manager = PokemonDataManager()
+    bank = data_manager.question_bank()
+    pool_ids = list(range(len(data_manager.pokemon_list)))
+    player = QuestioningPlayer(bank)
+    print(f"{len(bank)} questions over {len(pool_ids):,} Pokémon")
+
+    # First-turn planning on fresh grids, including narrowing the questions to each grid
+    rng = random.Random(1)
+    sampler = GridSampler(pool_ids, rng=rng)
+    times = []
+    for _ in range(TURNS):
+        chosen1, chosen2 = sampler.random_id(), sampler.random_id()
+        engine = GameEngine(sampler.deal(chosen1), sampler.deal(chosen2), chosen1, chosen2)
+        start = time.perf_counter()
+        player.plan_turn(engine, rng)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    print(f"  plan_turn  median {statistics.median(times) * 1e6:6.0f} µs   "
+          f"p99 {times[int(len(times) * 0.99)] * 1e6:6.0f} µs   budget {player.time_budget * 1e3:.0f} ms")
+
+    for opponent in ('random', 'halving'):
+        stats = simulate(GAMES, (player, opponent), pool_ids=pool_ids, workers=1, seed=1)
+        print(f"  vs {opponent:8} wins {stats['wins'][1] / GAMES:5.1%}   avg {stats['turns'] / GAMES:4.1f} turns   "
+              f"{stats['reasons']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Navigation benchmark for screen switching
+Plays the same screen sequence with retained screens and with the old
+destroy-and-rebuild behaviour (ScreenRegistry(retained=False)), and reports
+latency and widget allocations per navigation. Needs a display.
+"""
+
+import os
+import sys
+import time
+import tkinter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import PokemonGuessGame
+from src.screens import ScreenRegistry
+
+ROUNDS = 5
+
+
+def play_round(game):
+    """Settings and back, both player setups, a game and its results"""
+    game.show_settings()
+    game.return_to_startup()
+    game.start_game()
+    game.player1_name, game.player1_chosen = "Ash", game.filtered_pokemon_list[0]
+    game.setup_player(2)
+    game.player2_name, game.player2_chosen = "Gary", game.filtered_pokemon_list[1]
+    game.create_game_screen()
+    game.end_game("Ash Wins!", "Ash guessed it!")
+    game.new_game()
+
+
+def measure(retained):
+    game = PokemonGuessGame()
+    for screen in game.screens.screens.values():
+        screen.destroy()  # Swap in a registry in the mode being measured
+    game.screens = ScreenRegistry(game.root, game, retained=retained, count_widgets=True)
+    game.show_startup_screen()
+    game.ensure_data_ready()
+    play_round(game)  # Warm-up: first builds, imports and sprite decodes
+
+    game.screens.reset_stats()
+    painted_ms = 0.0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        play_round(game)
+        game.root.update_idletasks()  # Include the layout pass the switches queued
+        painted_ms += (time.perf_counter() - start) * 1000
+    stats = game.screens.stats()
+    game.root.destroy()
+    return stats, painted_ms / ROUNDS
+
+
+def main():
+    try:
+        tkinter.Tk().destroy()
+    except tkinter.TclError:
+        print("❌ No display available - this benchmark drives the real Tk UI")
+        return
+
+    print(f"Screen switching over {ROUNDS} rounds of 8 navigations (after one warm-up round)")
+    for label, retained in (("rebuild on show", False), ("retained", True)):
+        stats, round_ms = measure(retained)
+        per_navigation = stats['widgets_created'] / max(stats['navigations'], 1)
+        print(f"  {label:16} {stats['avg_ms']:7.2f} ms/navigation  {stats['max_ms']:7.2f} ms max  "
+              f"{per_navigation:7.1f} widgets/navigation  {round_ms:8.1f} ms/round incl. layout")
+
+
+if __name__ == "__main__":
+    main()
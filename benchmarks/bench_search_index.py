@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for autocomplete search latency
+Compares the prebuilt PokemonSearchIndex against a linear scan of the roster
+at 1k, 10k and 100k names, replaying the keystrokes of a few typed queries.
+"""
+
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data.search_index import PokemonSearchIndex
+
+TYPED_QUERIES = ["pikachu", "charizard-mega-x", "mew", "iron", "zz", "bulb"]
+ROSTER_SIZES = [1_000, 10_000, 100_000]
+
+
+def linear_search(query, items, limit=8):
+    """Per-keystroke scan of every name, ranked exact > prefix > substring > subsequence"""
+    query = query.lower()
+    tiers = ([], [], [], [])
+    for item in items:
+        item_lower = item.lower()
+        if item_lower == query:
+            tiers[0].append(item)
+        elif item_lower.startswith(query):
+            tiers[1].append(item)
+        elif query in item_lower:
+            tiers[2].append(item)
+        else:
+            remaining = iter(item_lower)
+            if all(char in remaining for char in query):
+                tiers[3].append(item)
+    return [item for tier in tiers for item in tier][:limit]
+
+
+def load_roster():
+    """Load the real roster names from the data file"""
+    with open(os.path.join(os.path.dirname(__file__), '..', 'data_sources', 'pokemon_data.json'), 'r', encoding='utf-8') as f:
+        return list(json.load(f).keys())
+
+
+def synthetic_roster(base_names, size):
+    """Grow the real roster to `size` names by adding numbered custom forms"""
+    names = []
+    suffix = 0
+    while len(names) < size:
+        for name in base_names:
+            names.append(name if suffix == 0 else f"{name}-Custom{suffix}")
+            if len(names) >= size:
+                break
+        suffix += 1
+    return names
+
+
+def keystrokes():
+    """Every prefix of every typed query, as the entry would see them"""
+    for query in TYPED_QUERIES:
+        for end in range(1, len(query) + 1):
+            yield query[:end]
+
+
+def time_per_keystroke(search):
+    """Return per-keystroke latencies in microseconds"""
+    samples = []
+    for query in keystrokes():
+        start = time.perf_counter()
+        search(query)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def report(label, samples):
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"  {label:<8} mean {statistics.mean(samples):>10.1f} us   p50 {statistics.median(samples):>10.1f} us   p99 {p99:>10.1f} us")
+
+
+def main():
+    base_names = load_roster()
+    print("=" * 70)
+    print("    AUTOCOMPLETE SEARCH LATENCY (per keystroke)")
+    print("=" * 70)
+
+    for size in ROSTER_SIZES:
+        names = synthetic_roster(base_names, size)
+
+        start = time.perf_counter()
+        index = PokemonSearchIndex(names)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        # Both implementations must agree before timing them
+        for query in keystrokes():
+            assert index.search(query) == linear_search(query, names), query
+
+        print(f"\n📊 {size:,} names (index built in {build_ms:.1f} ms)")
+        report("linear", time_per_keystroke(lambda q: linear_search(q, names)))
+        report("index", time_per_keystroke(lambda q: index.search(q)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Per-click and per-turn latency on the game screen
+Times toggle_pokemon on the first and last tile of a grid and end_turn, against
+the tile scan, sprite reload and handler rebinding they replaced. Needs a display.
+"""
+
+import os
+import statistics
+import sys
+import time
+import tkinter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import PokemonGuessGame
+
+REPEATS = 400
+
+
+def scan_toggle(game, pokemon, target_player_grid):
+    """toggle_pokemon's redraw before the tile index: scan the grid, reload the sprite on restore"""
+    buttons = game.player1_buttons if target_player_grid == 1 else game.player2_buttons
+    eliminated = game.engine.toggle(game.data_manager.get_pokemon_id(pokemon))
+    for row in buttons:
+        for tile in row:
+            if tile and tile.pokemon_name == pokemon:
+                if eliminated:
+                    image = game.image_loader.get_x_icon()
+                else:
+                    sprite_url = game.data_manager.get_pokemon_sprite_url(pokemon)
+                    image = game.image_loader.load_pokemon_image(pokemon, sprite_url)
+                tile.image_label.configure(image=image)
+                tile.image_label.image = image
+    game.update_remaining_count()
+
+
+def rebind_turn(game):
+    """update_grid_clickability before the click dispatch: rebind three handlers on all 48 tiles"""
+    for row in game.player1_buttons + game.player2_buttons:
+        for tile in row:
+            clickable = tile.player != game.current_player
+            tile.configure(cursor='hand2' if clickable else '')
+            for widget in (tile, tile.image_label, tile.name_label):
+                if clickable:
+                    widget.bind("<Button-1>", lambda e, p=tile.pokemon_name, t=tile.player: game.toggle_pokemon(p, t))
+                else:
+                    widget.unbind("<Button-1>")
+
+
+def median_us(action):
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        action()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e6
+
+
+def main():
+    try:
+        tkinter.Tk().destroy()
+    except tkinter.TclError:
+        print("❌ No display available - this benchmark drives the real Tk UI")
+        return
+
+    game = PokemonGuessGame()
+    game.ensure_data_ready()
+    game.player1_name, game.player1_chosen = "Ash", game.filtered_pokemon_list[0]
+    game.player2_name, game.player2_chosen = "Gary", game.filtered_pokemon_list[1]
+    game.start_main_game()
+    game.root.update()
+
+    # Player 1 clicks on grid 2; avoid the chosen Pokemon so end_turn never ends the game
+    grid = [name for name in game.player2_grid if name != game.player2_chosen]
+    first, last = grid[0], grid[-1]
+
+    print(f"Game screen interactions (median of {REPEATS})")
+    for label, position in (("first tile", first), ("last tile", last)):
+        indexed = median_us(lambda: game.toggle_pokemon(position, 2))
+        scanned = median_us(lambda: scan_toggle(game, position, 2))
+        print(f"  toggle {label:10}  indexed {indexed:7.1f} µs   scan + reload {scanned:7.1f} µs")
+
+    game.engine.eliminated[1] = game.engine.eliminated[2] = 0
+    dispatched = median_us(game.end_turn)
+    rebound = median_us(lambda: (game.end_turn(), rebind_turn(game)))
+    print(f"  end turn           dispatch {dispatched:6.1f} µs   rebind 48 tiles {rebound:7.1f} µs")
+    game.root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,11 @@ def build_app():
     
     print("🔨 Building Who's Your Pokemon Mac Application...")
     
+    # Generate derived assets (sprite atlas) before bundling
+    sys.path.insert(0, str(script_dir / "build_tools"))
+    from build_assets import prepare_assets, get_asset_data_args, get_hidden_import_args
+    prepare_assets()
+    
     # PyInstaller command with all necessary options
     cmd = [
         "pyinstaller",
@@ -26,7 +31,8 @@ def build_app():
         "--onedir",  # Create a directory with all files
         "--icon=assets/question_mark.icns",  # Use question mark as app icon
         "--add-data=data_sources/pokemon_data.json:data_sources",  # Include Pokemon data in data_sources folder
-        "--add-data=assets:assets",  # Include all assets (logos, icons, etc.)
+        *get_asset_data_args(),  # Include assets (logos, icons, sprite atlas)
+        *get_hidden_import_args(),  # Lazily imported screens
         "--clean",  # Clean cache before building
         "--noconfirm",  # Overwrite without asking
         "main.py"  # Main Python file
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Build-time asset preparation for Who's Your Pokemon
+Generates derived assets before PyInstaller runs and lists what to bundle
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# Project root, so the game's own packing code can be reused
+project_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(project_dir))
+
+from src.utils.sprite_atlas import build_sprite_atlas, ATLAS_FILE, ATLAS_SIZES
+from src.data.pokemon_catalog import build_catalog as build_pokemon_catalog, CATALOG_FILE, SOURCE_FILE
+from src.utils.logo_cache import build_scaled_logos, SCALED_LOGO_DIR, LOGO_SIZES
+
+SPRITE_DIR = "assets/pokemon_images"
+
+
+def build_atlas():
+    """Pack every sprite in assets/pokemon_images into the sprite atlas"""
+    print(f"🧩 Packing sprites into {ATLAS_FILE}...")
+    try:
+        start_time = time.time()
+        count = build_sprite_atlas(SPRITE_DIR, ATLAS_FILE, ATLAS_SIZES)
+        size_mb = os.path.getsize(ATLAS_FILE) / (1024 * 1024)
+        sizes = ', '.join(f"{w}x{h}" for w, h in ATLAS_SIZES)
+        print(f"✅ Packed {count} sprites at {sizes} ({size_mb:.1f} MB) in {time.time() - start_time:.1f}s")
+        return True
+    except Exception as e:
+        print(f"❌ Failed to build sprite atlas: {e}")
+        return False
+
+
+def build_logos():
+    """Pre-scale logos and icons to the sizes the screens display them at"""
+    print(f"🖼️  Pre-scaling logos into {SCALED_LOGO_DIR}...")
+    try:
+        start_time = time.time()
+        count = build_scaled_logos("assets", SCALED_LOGO_DIR, LOGO_SIZES)
+        print(f"✅ Wrote {count} scaled logos for {len(LOGO_SIZES)} images in {time.time() - start_time:.1f}s")
+        return True
+    except Exception as e:
+        print(f"❌ Failed to pre-scale logos: {e}")
+        return False
+
+
+def build_catalog():
+    """Convert data_sources/pokemon_data.json into the binary catalog"""
+    print(f"📇 Building {CATALOG_FILE}...")
+    try:
+        start_time = time.time()
+        count = build_pokemon_catalog(SOURCE_FILE, CATALOG_FILE)
+        size_kb = os.path.getsize(CATALOG_FILE) / 1024
+        print(f"✅ Wrote {count} Pokémon ({size_kb:.0f} KB) in {time.time() - start_time:.2f}s")
+        return True
+    except Exception as e:
+        print(f"❌ Failed to build Pokémon catalog: {e}")
+        return False
+
+
+def prepare_assets():
+    """Generate all derived assets, returning True if everything was built"""
+    os.chdir(project_dir)
+    results = [build_atlas(), build_logos(), build_catalog()]
+    return all(results)
+
+
+def get_asset_data_args():
+    """
+    PyInstaller --add-data arguments for the game's assets
+    When the sprite atlas exists the individual sprite PNGs are left out
+    """
+    if Path(ATLAS_FILE).exists():
+        args = [
+            "--add-data=assets/*.png:assets",  # Logos, icons and overlays
+            f"--add-data={ATLAS_FILE}:assets",  # All Pokemon sprites in one file
+        ]
+        if Path(SCALED_LOGO_DIR).exists():
+            args.append(f"--add-data={SCALED_LOGO_DIR}:{SCALED_LOGO_DIR}")  # Pre-scaled logos
+    else:
+        args = ["--add-data=assets:assets"]  # Include all assets
+    
+    if Path(CATALOG_FILE).exists():
+        # The JSON stays bundled as the fallback and to detect a stale catalog
+        args.append(f"--add-data={CATALOG_FILE}:data_sources")
+    return args
+
+
+def get_hidden_import_args():
+    """Modules imported lazily at runtime, which PyInstaller can't see statically"""
+    return ["--collect-submodules=src.screens"]  # Screens are created through ScreenRegistry
+
+
+if __name__ == "__main__":
+    sys.exit(0 if prepare_assets() else 1)
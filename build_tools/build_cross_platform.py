@@ -37,6 +37,11 @@ def build_for_platform(target_platform='current'):
     print(f"🔨 Building Who's Your Pokemon for {target_platform.title()}...")
     print(f"Current system: {current_system.title()}")
     
+    # Generate derived assets (sprite atlas) before bundling
+    sys.path.insert(0, str(script_dir / "build_tools"))
+    from build_assets import prepare_assets, get_asset_data_args, get_hidden_import_args
+    prepare_assets()
+    
     # Base PyInstaller command
     cmd = [
         "pyinstaller",
@@ -44,7 +49,8 @@ def build_for_platform(target_platform='current'):
         "--windowed",  # No console window
         "--onedir",  # Create a directory with all files
         "--add-data=data_sources/pokemon_data.json:data_sources",  # Include Pokemon data
-        "--add-data=assets:assets",  # Include all assets
+        *get_asset_data_args(),  # Include assets (logos, icons, sprite atlas)
+        *get_hidden_import_args(),  # Lazily imported screens
         "--clean",  # Clean cache before building
         "--noconfirm",  # Overwrite without asking
     ]
@@ -24,13 +24,23 @@ fi
 
 echo "🔨 Building Who's Your Pokemon for Linux..."
 
+# Pack sprites into the atlas, pre-scale logos into assets/scaled and build the binary catalog
+python3 build_tools/build_assets.py || echo "⚠️  Some derived assets not built, falling back to source files"
+
+CATALOG_ARG=""
+if [ -f "data_sources/pokemon_catalog.bin" ]; then
+    CATALOG_ARG="--add-data=data_sources/pokemon_catalog.bin:data_sources"
+fi
+
 # Run PyInstaller with Linux-specific settings
 pyinstaller \
     --name="Whos Your Pokemon" \
     --windowed \
     --onedir \
     --add-data="data_sources/pokemon_data.json:data_sources" \
+    $CATALOG_ARG \
     --add-data="assets:assets" \
+    --collect-submodules=src.screens \
     --clean \
     --noconfirm \
     main.py
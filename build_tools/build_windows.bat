@@ -32,6 +32,13 @@ if not exist "assets\question_mark.ico" (
 
 echo 🔨 Building Who's Your Pokemon for Windows...
 
+REM Pack sprites into the atlas, pre-scale logos into assets\scaled and build the binary catalog
+python build_tools\build_assets.py
+if errorlevel 1 echo ⚠️  Some derived assets not built, falling back to source files
+
+set CATALOG_ARG=
+if exist "data_sources\pokemon_catalog.bin" set CATALOG_ARG=--add-data="data_sources/pokemon_catalog.bin;data_sources"
+
 REM Run PyInstaller with Windows-specific settings
 pyinstaller ^
     --name="Whos Your Pokemon" ^
@@ -39,7 +46,9 @@ pyinstaller ^
     --onedir ^
     --icon=assets/question_mark.ico ^
     --add-data="data_sources/pokemon_data.json;data_sources" ^
+    %CATALOG_ARG% ^
     --add-data="assets;assets" ^
+    --collect-submodules=src.screens ^
     --clean ^
     --noconfirm ^
     main.py
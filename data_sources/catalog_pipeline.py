@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Catalog build pipeline - builds pokemon_data.json in a single streaming pass
+Replaces running pokemon_data_service.py, add_variants.py and fix_generations.py
+one after the other, each loading and rewriting the full JSON file
+
+Records flow through pluggable stages as a generator chain:
+fetch → normalize name → classify variant → resolve generation → localize sprite
+and are written out as they arrive, so memory doesn't grow with the roster size
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import requests
+
+from fix_generations import load_generation_mappings, remember_base_generation, resolve_generation
+from pokemon_data_service import API_ROOT, PokemonDataService
+from response_cache import ResponseCache, DEFAULT_CACHE_DIR, DEFAULT_TTL
+from sprite_downloader import sprite_filename
+from variant_classifier import classify_variant
+
+DATA_SOURCES_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(DATA_SOURCES_DIR, "pokemon_data.json")
+DEFAULT_IMAGE_DIR = os.path.join(DATA_SOURCES_DIR, "..", "assets", "pokemon_images")
+LOCAL_IMAGE_PREFIX = "assets/pokemon_images"
+CATALOG_FIELDS = ("sprite_url", "generation", "variant", "local_image")
+
+
+class PipelineStage:
+    """
+    One step of the build. Subclasses implement process(), which returns the
+    (updated) record or None to drop it. stream() may be overridden instead
+    when a stage needs to see several records at once.
+    """
+    name = "stage"
+
+    def process(self, record: Dict) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def stream(self, records: Iterable[Dict]) -> Iterator[Dict]:
+        for record in records:
+            record = self.process(record)
+            if record is not None:
+                yield record
+
+
+class ParallelStage(PipelineStage):
+    """
+    Stage whose slow part (work) runs on a thread pool over a bounded window of
+    records; finish() then runs on the pipeline thread in input order
+    """
+
+    def __init__(self, max_workers: int = 8, window: Optional[int] = None):
+        self.max_workers = max_workers
+        self.window = window or max_workers * 4
+
+    def work(self, record: Dict):
+        raise NotImplementedError
+
+    def finish(self, record: Dict, result) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def stream(self, records: Iterable[Dict]) -> Iterator[Dict]:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            for record in records:
+                pending.append((record, executor.submit(self.work, record)))
+                if len(pending) >= self.window:
+                    record, future = pending.popleft()
+                    record = self.finish(record, future.result())
+                    if record is not None:
+                        yield record
+            while pending:
+                record, future = pending.popleft()
+                record = self.finish(record, future.result())
+                if record is not None:
+                    yield record
+
+
+class FetchStage(ParallelStage):
+    """Fetch each listing entry's /pokemon/{id} record into record['details']"""
+    name = "fetch"
+
+    def __init__(self, service: PokemonDataService, window: Optional[int] = None):
+        super().__init__(service.max_workers, window)
+        self.service = service
+
+    def work(self, record: Dict) -> Optional[Dict]:
+        try:
+            return self.service.client.get_json(record['url'])
+        except requests.RequestException as e:
+            print(f"❌ Error fetching details for {record['api_name']}: {e}")
+            return None
+
+    def finish(self, record: Dict, details: Optional[Dict]) -> Optional[Dict]:
+        if details is None:
+            return None
+        record['details'] = details
+        return record
+
+
+class NormalizeNameStage(PipelineStage):
+    """Curated display name, best sprite URL and species link; the raw record is dropped here"""
+    name = "normalize"
+
+    def __init__(self, service: PokemonDataService):
+        self.service = service
+
+    def process(self, record: Dict) -> Optional[Dict]:
+        details = record.pop('details')
+        record['name'] = self.service.format_pokemon_name(record['api_name'])
+        try:
+            record['sprite_url'] = self.service.get_best_sprite_url(details['sprites'])
+            species = details.get('species') or {}
+            record['species_url'] = species.get('url') or f"{self.service.species_url}/{details['id']}/"
+        except KeyError as e:
+            print(f"❌ Missing data field for {record['api_name']}: {e}")
+            return None
+
+        # Skip Pokémon without any sprites
+        if not record['sprite_url']:
+            print(f"⚠️  No sprite for {record['name']}, skipping...")
+            return None
+        return record
+
+
+class ClassifyVariantStage(PipelineStage):
+    """Variant category from the shared classifier"""
+    name = "classify"
+
+    def __init__(self, classifier: Callable[[str], Optional[str]] = classify_variant):
+        self.classifier = classifier
+
+    def process(self, record: Dict) -> Dict:
+        record['variant'] = self.classifier(record['name'])
+        return record
+
+
+class ResolveGenerationStage(ParallelStage):
+    """
+    Generation from the species record (one request per species). When that
+    fails, fall back to the base Pokémon's generation as fix_generations.py does;
+    base forms come first in the listing, so they are known by then
+    """
+    name = "generation"
+
+    def __init__(self, service: PokemonDataService, window: Optional[int] = None):
+        super().__init__(service.max_workers, window)
+        self.service = service
+        self.discovered_generations = {}
+        self.known_generations = load_generation_mappings()
+        self.fixed = 0
+
+    def work(self, record: Dict) -> int:
+        return self.service.get_species_generation(record['species_url'])
+
+    def finish(self, record: Dict, generation: int) -> Dict:
+        del record['species_url']
+        if generation == -1:
+            resolved = resolve_generation(record['name'], self.discovered_generations)
+            if resolved is None:
+                resolved = resolve_generation(record['name'], self.known_generations)
+            if resolved is not None:
+                generation = resolved
+                self.fixed += 1
+        remember_base_generation(self.discovered_generations, record['name'], generation)
+        record['generation'] = generation
+        return record
+
+
+class LocalizeSpriteStage(PipelineStage):
+    """Point records at sprites already downloaded to assets/pokemon_images"""
+    name = "localize"
+
+    def __init__(self, image_dir: str = DEFAULT_IMAGE_DIR):
+        try:
+            self.local_files = set(os.listdir(image_dir))
+        except FileNotFoundError:
+            self.local_files = set()
+
+    def process(self, record: Dict) -> Dict:
+        filename = sprite_filename(record['name'])
+        record['local_image'] = filename in self.local_files
+        if record['local_image']:
+            record['sprite_url'] = f"{LOCAL_IMAGE_PREFIX}/{filename}"
+        return record
+
+
+def listing_source(service: PokemonDataService) -> Iterator[Dict]:
+    """One record per entry of the PokéAPI listing"""
+    for pokemon in service.fetch_pokemon_list():
+        yield {'api_name': pokemon['name'], 'url': pokemon['url']}
+
+
+def default_stages(service: PokemonDataService, image_dir: str = DEFAULT_IMAGE_DIR) -> List[PipelineStage]:
+    return [
+        FetchStage(service),
+        NormalizeNameStage(service),
+        ClassifyVariantStage(),
+        ResolveGenerationStage(service),
+        LocalizeSpriteStage(image_dir)
+    ]
+
+
+class CatalogPipeline:
+    """
+    Chains stages over a record source and writes the result once
+    `timings` holds each stage's own time in seconds (time spent waiting on
+    the stages before it is not counted) and `counts` the records it emitted
+    """
+
+    def __init__(self, source: Iterable[Dict], stages: List[PipelineStage]):
+        self.source = source
+        self.stages = stages
+        self.timings: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._inclusive: List[float] = []
+
+    def _timed(self, index: int, records: Iterable[Dict]) -> Iterator[Dict]:
+        """Add the time spent producing each record to slot `index`"""
+        iterator = iter(records)
+        while True:
+            start = time.perf_counter()
+            try:
+                record = next(iterator)
+            except StopIteration:
+                self._inclusive[index] += time.perf_counter() - start
+                return
+            self._inclusive[index] += time.perf_counter() - start
+            self.counts[self._names[index]] += 1
+            yield record
+
+    def records(self) -> Iterator[Dict]:
+        """Lazily run every stage; records come out one at a time"""
+        self._names = ["source"] + [stage.name for stage in self.stages]
+        self._inclusive = [0.0] * len(self._names)
+        self.counts = {name: 0 for name in self._names}
+
+        records = self._timed(0, self.source)
+        for index, stage in enumerate(self.stages, start=1):
+            records = self._timed(index, stage.stream(records))
+        yield from records
+
+        # Each generator's time includes the stages feeding it
+        self.timings = {
+            name: self._inclusive[index] - (self._inclusive[index - 1] if index else 0.0)
+            for index, name in enumerate(self._names)
+        }
+
+    def build(self, output_path: str) -> int:
+        """
+        Stream the records into `output_path` as the catalog JSON, in the same
+        format as json.dump(indent=2); the file is replaced only once complete
+        Returns the number of Pokémon written
+        """
+        temp_path = f"{output_path}.tmp"
+        seen = set()
+        written = 0
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write("{")
+                for record in self.records():
+                    if record['name'] in seen:
+                        print(f"⚠️  Duplicate name {record['name']}, keeping the first entry")
+                        continue
+                    seen.add(record['name'])
+                    entry = {field: record[field] for field in CATALOG_FIELDS}
+                    body = json.dumps(entry, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+                    f.write(f"{',' if written else ''}\n  {json.dumps(record['name'], ensure_ascii=False)}: {body}")
+                    written += 1
+                f.write("\n}" if written else "}")
+            os.replace(temp_path, output_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return written
+
+    def report(self):
+        """Print per-stage timing and record counts"""
+        print("⏱️  Stage timing:")
+        for name, seconds in self.timings.items():
+            print(f"  {name:<10} {seconds * 1000:9.1f} ms  {self.counts[name]:>6} records out")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build pokemon_data.json from PokéAPI in one pass")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Catalog JSON to write")
+    parser.add_argument("--image-dir", default=DEFAULT_IMAGE_DIR, help="Directory of downloaded sprites")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent requests (default: 8)")
+    parser.add_argument("--rate", type=float, default=20.0, help="Requests per second limit (default: 20)")
+    parser.add_argument("--api-root", default=API_ROOT, help="PokéAPI base URL")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Raw response cache directory")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_TTL / 3600,
+                        help="Hours before cached responses are revalidated (default: 168)")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the response cache")
+    parser.add_argument("--offline", action="store_true", help="Build from cached responses only")
+    args = parser.parse_args()
+
+    if args.offline and args.no_cache:
+        print("❌ --offline replays the response cache, so it can't be combined with --no-cache")
+        return 1
+
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(args.cache_dir, ttl=args.cache_ttl * 3600, offline=args.offline)
+    service = PokemonDataService(args.api_root, max_workers=args.workers, requests_per_second=args.rate, cache=cache)
+
+    print("🔄 Building the Pokémon catalog...")
+    start_time = time.time()
+    try:
+        pipeline = CatalogPipeline(listing_source(service), default_stages(service, args.image_dir))
+        written = pipeline.build(args.output)
+    except requests.RequestException as e:
+        print(f"❌ Error fetching Pokémon list: {e}")
+        return 1
+    finally:
+        service.client.close()
+
+    print(f"✅ Wrote {written} Pokémon to {args.output} in {time.time() - start_time:.1f}s")
+    pipeline.report()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -72,6 +72,15 @@ def load_generation_mappings():
         'Iron': 9, 'Roaring': 9, 'Walking': 9, 'Gouging': 9, 'Raging': 9,
     }
 
+def remember_base_generation(known_generations, name, generation):
+    """Record the generation of a Pokemon's base name, keeping the first one seen"""
+    if generation != -1:
+        known_generations.setdefault(get_base_pokemon_name(name), generation)
+
+def resolve_generation(name, known_generations):
+    """Generation for a Pokemon whose species lookup failed, taken from its base Pokemon, or None"""
+    return known_generations.get(get_base_pokemon_name(name))
+
 def fix_pokemon_generations():
     """Fix generation assignments for Pokemon with generation -1"""
     
@@ -86,10 +95,7 @@ def fix_pokemon_generations():
     # Build a reverse lookup for Pokemon already in the data with correct generations
     base_generations = {}
     for name, data in pokemon_data.items():
-        if data['generation'] != -1:
-            base_name = get_base_pokemon_name(name)
-            if base_name not in base_generations:
-                base_generations[base_name] = data['generation']
+        remember_base_generation(base_generations, name, data['generation'])
     
     # Combine manual mappings with discovered mappings
     all_mappings = {**generation_mappings, **base_generations}
@@ -99,9 +105,9 @@ def fix_pokemon_generations():
     for name, data in pokemon_data.items():
         if data['generation'] == -1:
             base_name = get_base_pokemon_name(name)
+            new_generation = resolve_generation(name, all_mappings)
             
-            if base_name in all_mappings:
-                new_generation = all_mappings[base_name]
+            if new_generation is not None:
                 data['generation'] = new_generation
                 fixed_count += 1
                 print(f"Fixed {name} -> Generation {new_generation} (base: {base_name})")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+PokéAPI HTTP client - pooled connections, rate limiting and retries
+Shared by the data service so many workers can fetch without hammering the API
+"""
+
+import json
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class OfflineCacheMiss(requests.RequestException):
+    """Raised in offline mode for a URL that was never cached"""
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` requests per second with bursts up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def refund(self):
+        """Give back a token taken for a request that turned out to cost the server nothing"""
+        with self.lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+
+class PokeApiClient:
+    """
+    requests.Session wrapper with a connection pool sized for the worker count,
+    a token-bucket rate limit, and exponential backoff on transient failures
+    Conditional requests answered 304 Not Modified don't count against the rate
+    limit, so revalidating an unchanged dataset is limited only by the workers
+    With a ResponseCache, get_json reads through it and successful responses are stored
+    """
+
+    def __init__(self, max_connections: int = 8, requests_per_second: Optional[float] = 20.0,
+                 retries: int = 3, backoff: float = 0.5, timeout: float = 15.0, cache=None):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache
+
+        self.stats = {"requests": 0, "retries": 0, "failures": 0, "not_modified": 0}
+        self.stats_lock = threading.Lock()
+
+    def _count(self, key: str):
+        with self.stats_lock:
+            self.stats[key] += 1
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """
+        GET a URL, retrying connection errors, timeouts, 429 and 5xx responses
+        Raises requests.RequestException once the retries are used up
+        """
+        if self.cache and self.cache.offline:
+            raise OfflineCacheMiss(f"Offline mode: not requesting {url}")
+
+        for attempt in range(self.retries + 1):
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            self._count("requests")
+
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+                if response.status_code == 304:
+                    self._count("not_modified")
+                    if self.rate_limiter:
+                        self.rate_limiter.refund()
+                    return response
+                if response.status_code not in RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    if self.cache and response.status_code == 200:
+                        self.cache.store(url, response.content, response.headers.get("ETag"),
+                                         response.headers.get("Last-Modified"))
+                    return response
+                error = requests.HTTPError(f"{response.status_code} for {url}", response=response)
+                retry_after = response.headers.get("Retry-After")
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+                retry_after = None
+
+            if attempt == self.retries:
+                break
+
+            self._count("retries")
+            delay = self.backoff * (2 ** attempt) * (1 + random.random() * 0.25)
+            if retry_after and retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            time.sleep(delay)
+
+        self._count("failures")
+        raise error
+
+    def get_json(self, url: str) -> dict:
+        """
+        GET a URL and decode its JSON body, reading through the response cache
+        Fresh cache entries are used as-is, stale ones are revalidated with a
+        conditional request, and offline mode serves whatever is cached
+        """
+        if not self.cache:
+            return self.get(url).json()
+
+        entry = self.cache.lookup(url)
+        body = self.cache.read(url) if entry else None
+        if body is not None and (self.cache.offline or self.cache.is_fresh(entry)):
+            self.cache.count("hits")
+            return json.loads(body)
+        if self.cache.offline:
+            self.cache.count("misses")
+            raise OfflineCacheMiss(f"Offline mode: {url} is not cached")
+
+        headers = {}
+        if body is not None:
+            self.cache.count("stale")
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        else:
+            self.cache.count("misses")
+
+        response = self.get(url, headers=headers)
+        if response.status_code == 304 and body is not None:
+            self.cache.revalidated(url)
+            return json.loads(body)
+        return response.json()
+
+    def close(self):
+        self.session.close()
+        if self.cache:
+            self.cache.close()
@@ -5,54 +5,46 @@ Creates a local data file with names, sprite URLs, generation info, and variant
 Now includes ALL Pokémon from the PokéAPI with proper variant categorization
 """
 
+import argparse
 import requests
 import json
+import threading
 import time
 import re
-from typing import Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from pokeapi_client import PokeApiClient
+from response_cache import ResponseCache, DEFAULT_CACHE_DIR, DEFAULT_TTL
+from refresh_journal import RefreshJournal
+from variant_classifier import VARIANT_PATTERNS, classify_variant
+
+API_ROOT = "https://pokeapi.co/api/v2"
+
+ROMAN_TO_GENERATION = {
+    "generation-i": 1, "generation-ii": 2, "generation-iii": 3,
+    "generation-iv": 4, "generation-v": 5, "generation-vi": 6,
+    "generation-vii": 7, "generation-viii": 8, "generation-ix": 9
+}
 
 class PokemonDataService:
-    def __init__(self):
-        self.base_url = "https://pokeapi.co/api/v2/pokemon"
-        self.species_url = "https://pokeapi.co/api/v2/pokemon-species"
+    def __init__(self, api_root: str = API_ROOT, max_workers: int = 8, requests_per_second: Optional[float] = 20.0,
+                 cache: Optional[ResponseCache] = None):
+        self.base_url = f"{api_root}/pokemon"
+        self.species_url = f"{api_root}/pokemon-species"
+        self.max_workers = max_workers
+        self.client = PokeApiClient(max_connections=max_workers, requests_per_second=requests_per_second, cache=cache)
+        # Species URL -> Future[int]; forms of one species share a single request
+        self.species_generations = {}
+        self.species_lock = threading.Lock()
         self.pokemon_data = {}
         self.data_file = "pokemon_data.json"
-        self.variant_patterns = {
-            "Regional - Alolan": ["alolan", "alola"],
-            "Regional - Galarian": ["galarian", "galar"],
-            "Regional - Hisuian": ["hisuian", "hisui"],
-            "Regional - Paldean": ["paldean", "paldea"],
-            "Gigantamax": ["gigantamax", "gmax"],
-            "Mega": ["mega"],
-            "Special Pikachus": ["pikachu-cosplay", "pikachu-rock-star", "pikachu-belle", 
-                               "pikachu-pop-star", "pikachu-phd", "pikachu-libre", 
-                               "pikachu-original-cap", "pikachu-hoenn-cap", "pikachu-sinnoh-cap",
-                               "pikachu-unova-cap", "pikachu-kalos-cap", "pikachu-alola-cap",
-                               "pikachu-partner-cap", "pikachu-world-cap"],
-            "Totem Pokemon": ["totem"],
-            "Paradox Pokemon": ["walking-wake", "iron-leaves", "roaring-moon", "iron-valiant",
-                              "flutter-mane", "slither-wing", "sandy-shocks", "scream-tail",
-                              "brute-bonnet", "iron-treads", "iron-moth", "iron-hands",
-                              "iron-jugulis", "iron-thorns", "iron-bundle", "iron-crown",
-                              "iron-boulder", "gouging-fire", "raging-bolt"]
-        }
+        self.journal_file = "refresh_journal.jsonl"
+        self.variant_patterns = VARIANT_PATTERNS
     
     def classify_variant(self, pokemon_name: str) -> Optional[str]:
         """Classify a Pokémon as a variant based on its name"""
-        name_lower = pokemon_name.lower()
-        
-        for variant_type, patterns in self.variant_patterns.items():
-            for pattern in patterns:
-                if pattern in name_lower:
-                    return variant_type
-        
-        # Additional variant detection for forms and other patterns
-        if any(form in name_lower for form in ["-altered", "-origin", "-sky", "-land", "-attack", "-defense", "-speed"]):
-            return "Form Variants"
-        if any(size in name_lower for size in ["-small", "-large", "-super", "-average"]):
-            return "Size Variants"
-        
-        return None
+        return classify_variant(pokemon_name)
     
     def get_best_sprite_url(self, sprites_data: dict) -> Optional[str]:
         """Get the best available sprite URL from the sprites data"""
@@ -90,45 +82,111 @@ class PokemonDataService:
     
     def get_pokemon_generation(self, poke_id: int) -> int:
         """Get the generation number for a Pokémon"""
+        return self.get_species_generation(f"{self.species_url}/{poke_id}/")
+    
+    def get_species_generation(self, species_url: str) -> int:
+        """
+        Get the generation number for a species, fetching each species once
+        Concurrent callers asking for the same species wait on the first request,
+        and see its exception if it fails unexpectedly
+        """
+        with self.species_lock:
+            future = self.species_generations.get(species_url)
+            is_owner = future is None
+            if is_owner:
+                future = self.species_generations[species_url] = Future()
+        
+        if is_owner:
+            try:
+                generation = self._fetch_species_generation(species_url)
+            except BaseException as e:
+                # Never leave waiters blocked on an unresolved future
+                with self.species_lock:
+                    self.species_generations.pop(species_url, None)
+                future.set_exception(e)
+                raise
+            future.set_result(generation)
+            if generation == -1:
+                # Don't remember failures - a later form may succeed
+                with self.species_lock:
+                    self.species_generations.pop(species_url, None)
+        
+        return future.result()
+    
+    def _fetch_species_generation(self, species_url: str) -> int:
+        """Request a species record and convert its generation name to a number"""
         try:
-            species_url = f"{self.species_url}/{poke_id}/"
-            response = requests.get(species_url)
-            response.raise_for_status()
-            
-            species_data = response.json()
+            species_data = self.client.get_json(species_url)
             generation_name = species_data["generation"]["name"]
             
             # Convert Roman numerals to numbers
-            roman_to_num = {
-                "generation-i": 1, "generation-ii": 2, "generation-iii": 3, 
-                "generation-iv": 4, "generation-v": 5, "generation-vi": 6, 
-                "generation-vii": 7, "generation-viii": 8, "generation-ix": 9
-            }
-            
-            return roman_to_num.get(generation_name, -1)
+            return ROMAN_TO_GENERATION.get(generation_name, -1)
             
         except requests.RequestException as e:
-            print(f"❌ Error fetching generation for Pokémon ID {poke_id}: {e}")
+            print(f"❌ Error fetching generation from {species_url}: {e}")
             return -1
-        except KeyError as e:
-            print(f"❌ Missing generation data for Pokémon ID {poke_id}: {e}")
+        except (KeyError, TypeError) as e:
+            print(f"❌ Missing generation data in {species_url}: {e}")
             return -1
     
+    def fetch_pokemon_list(self) -> List[Dict]:
+        """Fetch the listing of every Pokémon (name and detail URL)"""
+        return self.client.get_json(f"{self.base_url}?limit=100000&offset=0")['results']
+    
+    def fetch_pokemon_record(self, pokemon: Dict) -> Optional[Tuple[str, Dict]]:
+        """
+        Fetch and classify one listing entry
+        Returns (pokemon_name, data), or None if it was skipped or failed
+        """
+        try:
+            details = self.client.get_json(pokemon['url'])
+            return self.parse_pokemon_details(pokemon, details)
+        except requests.RequestException as e:
+            print(f"❌ Error fetching details for {pokemon['name']}: {e}")
+        except KeyError as e:
+            print(f"❌ Missing data field for {pokemon['name']}: {e}")
+        return None
+    
+    def parse_pokemon_details(self, pokemon: Dict, details: Dict) -> Optional[Tuple[str, Dict]]:
+        """Turn a /pokemon/{id} record into (pokemon_name, data), or None if it has no sprite"""
+        pokemon_name = self.format_pokemon_name(pokemon['name'])
+        
+        # Get the best available sprite
+        sprite_url = self.get_best_sprite_url(details['sprites'])
+        
+        # Skip Pokémon without any sprites
+        if not sprite_url:
+            print(f"⚠️  No sprite for {pokemon_name}, skipping...")
+            return None
+        
+        # Alternate forms (ids 10001+) link to their base species
+        species = details.get('species') or {}
+        species_url = species.get('url') or f"{self.species_url}/{details['id']}/"
+        generation = self.get_species_generation(species_url)
+        
+        # Classify variant
+        variant = self.classify_variant(pokemon_name)
+        
+        return pokemon_name, {
+            "sprite_url": sprite_url,
+            "generation": generation,
+            "variant": variant
+        }
+    
     def fetch_all_pokemon(self) -> Dict[str, Dict]:
         """
         Fetch ALL Pokémon data from PokéAPI with names, sprite URLs, generation info, and variant classification
+        Records are fetched by up to max_workers threads, sharing the client's rate limit
         Returns a dictionary with pokemon_name: {sprite_url, generation, variant} pairs
         """
         print("🔄 Starting complete Pokémon data collection from PokéAPI...")
+        start_time = time.time()
         
         # Step 1: Get the complete list of all Pokémon
         print("📋 Fetching complete Pokémon list from PokéAPI...")
         try:
-            response = requests.get(f"{self.base_url}?limit=100000&offset=0")
-            response.raise_for_status()
-            pokemon_list = response.json()
-            
-            total_pokemon = len(pokemon_list['results'])
+            pokemon_list = self.fetch_pokemon_list()
+            total_pokemon = len(pokemon_list)
             print(f"📊 Found {total_pokemon} total Pokémon in API")
             
         except requests.RequestException as e:
@@ -137,60 +195,26 @@ class PokemonDataService:
         
         # Step 2: Process all Pokémon
         pokemon_data = {}
-        processed = 0
         
-        print(f"🎯 Processing all {total_pokemon} Pokémon...")
+        print(f"🎯 Processing all {total_pokemon} Pokémon with {self.max_workers} workers...")
         
-        for pokemon in pokemon_list['results']:
-            try:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # map() yields in listing order, so the data file keeps the API's ordering
+            for processed, record in enumerate(executor.map(self.fetch_pokemon_record, pokemon_list)):
                 # Show progress every 100 Pokémon
                 if processed % 100 == 0:
                     print(f"⏳ Processing {processed}/{total_pokemon} Pokémon...")
-                
-                # Get detailed data for this Pokémon
-                details_response = requests.get(pokemon['url'])
-                details_response.raise_for_status()
-                details = details_response.json()
-                
-                pokemon_name = self.format_pokemon_name(pokemon['name'])
-                pokemon_id = details['id']
-                
-                # Get the best available sprite
-                sprite_url = self.get_best_sprite_url(details['sprites'])
-                
-                # Skip Pokémon without any sprites
-                if not sprite_url:
-                    print(f"⚠️  No sprite for {pokemon_name}, skipping...")
-                    processed += 1
-                    continue
-                
-                # Get generation information
-                generation = self.get_pokemon_generation(pokemon_id)
-                
-                # Classify variant
-                variant = self.classify_variant(pokemon_name)
-                
-                pokemon_data[pokemon_name] = {
-                    "sprite_url": sprite_url,
-                    "generation": generation,
-                    "variant": variant
-                }
-                
-                processed += 1
-                
-                # Be nice to the API - small delay between requests
-                time.sleep(0.1)
-                
-            except requests.RequestException as e:
-                print(f"❌ Error fetching details for {pokemon['name']}: {e}")
-                processed += 1
-                continue
-            except KeyError as e:
-                print(f"❌ Missing data field for {pokemon['name']}: {e}")
-                processed += 1
-                continue
+                if record:
+                    pokemon_name, data = record
+                    pokemon_data[pokemon_name] = data
         
-        print(f"✅ Successfully collected data for {len(pokemon_data)} Pokémon")
+        print(f"✅ Successfully collected data for {len(pokemon_data)} Pokémon in {time.time() - start_time:.1f}s")
+        print(f"🌐 {self.client.stats['requests']} requests, {self.client.stats['retries']} retries, "
+              f"{len(self.species_generations)} species")
+        if self.client.cache:
+            cache_stats = self.client.cache.stats
+            print(f"🗄️  Response cache: {cache_stats['hits']} hits, {cache_stats['stale']} revalidated, "
+                  f"{cache_stats['misses']} misses")
         
         # Show variant distribution
         variant_counts = {}
@@ -246,6 +270,138 @@ class PokemonDataService:
             print(f"❌ Error loading data: {e}")
             return {}
     
+    def refresh_pokemon_record(self, pokemon: Dict, journal: RefreshJournal) -> str:
+        """
+        Bring one listing entry up to date in the journal
+        Returns 'resumed', 'unchanged', 'fetched' or 'failed'
+        """
+        url = pokemon['url']
+        if journal.done_this_run(url):
+            return 'resumed'
+        
+        previous = journal.records.get(url)
+        headers = {}
+        if previous:
+            if previous.get('etag'):
+                headers['If-None-Match'] = previous['etag']
+            if previous.get('last_modified'):
+                headers['If-Modified-Since'] = previous['last_modified']
+        
+        try:
+            response = self.client.get(url, headers=headers)
+            if response.status_code == 304 and previous:
+                journal.record(url, previous['etag'], previous['last_modified'], previous['name'], previous['data'])
+                return 'unchanged'
+            
+            record = self.parse_pokemon_details(pokemon, response.json())
+        except requests.RequestException as e:
+            print(f"❌ Error fetching details for {pokemon['name']}: {e}")
+            return 'failed'
+        except KeyError as e:
+            print(f"❌ Missing data field for {pokemon['name']}: {e}")
+            return 'failed'
+        
+        pokemon_name, data = record if record else (self.format_pokemon_name(pokemon['name']), None)
+        journal.record(url, response.headers.get('ETag'), response.headers.get('Last-Modified'), pokemon_name, data)
+        return 'fetched'
+    
+    def refresh_pokemon_data(self, journal_file: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Incremental refresh: conditional requests for every record, journaled as they
+        complete, then only changed entries are merged into the existing data file.
+        An interrupted refresh resumes from the journal on the next call.
+        """
+        print("🔄 Starting incremental Pokémon data refresh...")
+        start_time = time.time()
+        journal = RefreshJournal(journal_file or self.journal_file)
+        
+        if journal.start_or_resume():
+            done = sum(1 for url in journal.records if journal.done_this_run(url))
+            print(f"⏯️  Resuming interrupted refresh ({done} records already done)")
+        
+        # The listing itself is conditional too; keep using the journaled copy on 304
+        try:
+            headers = {}
+            if journal.listing and journal.listing.get('etag'):
+                headers['If-None-Match'] = journal.listing['etag']
+            response = self.client.get(f"{self.base_url}?limit=100000&offset=0", headers=headers)
+            if response.status_code == 304:
+                pokemon_list = journal.listing['results']
+            else:
+                pokemon_list = response.json()['results']
+                journal.record_listing(response.headers.get('ETag'), response.headers.get('Last-Modified'), pokemon_list)
+        except requests.RequestException as e:
+            print(f"❌ Error fetching Pokémon list: {e}")
+            return {}
+        
+        counts = {'resumed': 0, 'unchanged': 0, 'fetched': 0, 'failed': 0}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for outcome in executor.map(lambda pokemon: self.refresh_pokemon_record(pokemon, journal), pokemon_list):
+                counts[outcome] += 1
+        
+        print(f"📊 {len(pokemon_list)} records: {counts['fetched']} fetched, {counts['unchanged']} unchanged, "
+              f"{counts['resumed']} resumed, {counts['failed']} failed ({time.time() - start_time:.1f}s)")
+        
+        # Variants are reclassified on every refresh, so rule changes apply without refetching
+        fresh_data = {}
+        for pokemon in pokemon_list:
+            entry = journal.records.get(pokemon['url'])
+            if entry and entry['data']:
+                fresh_data[entry['name']] = dict(entry['data'], variant=self.classify_variant(entry['name']))
+        
+        failed_names = {
+            self.format_pokemon_name(pokemon['name']) for pokemon in pokemon_list
+            if not journal.done_this_run(pokemon['url'])
+        }
+        pokemon_data, changes = self.merge_pokemon_data(self.load_pokemon_data(), fresh_data, failed_names)
+        
+        if any(changes.values()):
+            print(f"✏️  {len(changes['added'])} added, {len(changes['changed'])} changed, {len(changes['removed'])} removed")
+            if not self.save_pokemon_data(pokemon_data):
+                return {}
+        else:
+            print("✅ No changes upstream - data file left untouched")
+        
+        if counts['failed']:
+            print(f"⚠️  {counts['failed']} records failed - run the refresh again to retry just those")
+        else:
+            journal.complete()
+        
+        return pokemon_data
+    
+    def merge_pokemon_data(self, existing: Dict[str, Dict], fresh: Dict[str, Dict], keep: set) -> Tuple[Dict[str, Dict], Dict[str, List[str]]]:
+        """
+        Diff freshly fetched entries against the current data file
+        Unchanged entries are kept as they are (including local sprite paths);
+        entries named in `keep` (failed this time) are carried over untouched.
+        """
+        merged = {}
+        changes = {'added': [], 'changed': [], 'removed': []}
+        
+        for pokemon_name, data in fresh.items():
+            current = existing.get(pokemon_name)
+            if current is None:
+                merged[pokemon_name] = dict(data, local_image=False)
+                changes['added'].append(pokemon_name)
+                continue
+            
+            updated = dict(current, generation=data['generation'], variant=data['variant'])
+            if not current.get('local_image'):
+                updated['sprite_url'] = data['sprite_url']  # Localized sprites keep their file path
+            if updated != current:
+                changes['changed'].append(pokemon_name)
+            merged[pokemon_name] = updated
+        
+        for pokemon_name, data in existing.items():
+            if pokemon_name in merged:
+                continue
+            if pokemon_name in keep:
+                merged[pokemon_name] = data
+            else:
+                changes['removed'].append(pokemon_name)
+        
+        return merged, changes
+    
     def update_pokemon_data(self) -> Dict[str, Dict]:
         """
         Main method to fetch fresh data from API and save it locally
@@ -267,7 +423,28 @@ class PokemonDataService:
 
 def main():
     """Main function to run the data collection"""
-    service = PokemonDataService()
+    parser = argparse.ArgumentParser(description="Fetch Pokémon data from PokéAPI")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent requests (default: 8)")
+    parser.add_argument("--rate", type=float, default=20.0, help="Requests per second limit (default: 20)")
+    parser.add_argument("--api-root", default=API_ROOT, help="PokéAPI base URL")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only refetch records that changed upstream, resuming an interrupted refresh")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Raw response cache directory")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_TTL / 3600,
+                        help="Hours before cached responses are revalidated (default: 168)")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the response cache")
+    parser.add_argument("--offline", action="store_true",
+                        help="Replay cached responses only, e.g. to reclassify variants without the network")
+    args = parser.parse_args()
+    
+    if args.offline and (args.incremental or args.no_cache):
+        print("❌ --offline replays the response cache, so it can't be combined with --incremental or --no-cache")
+        return {}
+    
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(args.cache_dir, ttl=args.cache_ttl * 3600, offline=args.offline)
+    service = PokemonDataService(args.api_root, max_workers=args.workers, requests_per_second=args.rate, cache=cache)
     
     print("=" * 70)
     print("    COMPLETE POKÉMON DATA COLLECTION SERVICE (WITH VARIANTS)")
@@ -281,7 +458,13 @@ def main():
         return {}
     
     # Fetch new data with generation and variant information
-    pokemon_data = service.update_pokemon_data()
+    try:
+        if args.incremental:
+            pokemon_data = service.refresh_pokemon_data()
+        else:
+            pokemon_data = service.update_pokemon_data()
+    finally:
+        service.client.close()
     
     if pokemon_data:
         print("\n🎮 Sample Pokémon data:")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Append-only journal of per-record fetch state for incremental data refreshes
+Every fetched listing entry is written as one JSON line as soon as it is processed,
+so an interrupted refresh can pick up where it stopped
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+
+
+class RefreshJournal:
+    """
+    JSONL journal of refresh runs
+
+    Lines are events:
+        {"type": "run", "run": id, "started": ts}
+        {"type": "listing", "run": id, "etag": ..., "last_modified": ..., "results": [...]}
+        {"type": "record", "run": id, "url": ..., "etag": ..., "last_modified": ..., "name": ..., "data": {...} | null}
+        {"type": "complete", "run": id, "finished": ts}
+    Replaying the file gives the latest state per URL and tells whether the
+    last run finished. Completed runs are compacted down to that state.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.run_id = None
+        self.last_run_complete = True
+        self.listing = None
+        self.records: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self):
+        """Replay the journal, skipping a torn last line from a crash"""
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                event_type = event.get('type')
+                if event_type == 'run':
+                    self.run_id = event['run']
+                    self.last_run_complete = False
+                elif event_type == 'listing':
+                    self.listing = event
+                elif event_type == 'record':
+                    self.records[event['url']] = event
+                elif event_type == 'complete' and event['run'] == self.run_id:
+                    self.last_run_complete = True
+
+    def _append(self, event: Dict):
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(event, ensure_ascii=False) + '\n')
+
+    def start_or_resume(self) -> bool:
+        """Start a new run unless the previous one was interrupted; returns True when resuming"""
+        if self.run_id and not self.last_run_complete:
+            return True
+
+        self.run_id = uuid.uuid4().hex
+        self.last_run_complete = False
+        self._append({'type': 'run', 'run': self.run_id, 'started': time.time()})
+        return False
+
+    def done_this_run(self, url: str) -> Optional[Dict]:
+        """The record for a URL if it was already processed in the current run"""
+        entry = self.records.get(url)
+        if entry and entry['run'] == self.run_id:
+            return entry
+        return None
+
+    def record_listing(self, etag: Optional[str], last_modified: Optional[str], results):
+        self.listing = {'type': 'listing', 'run': self.run_id, 'etag': etag,
+                        'last_modified': last_modified, 'results': results}
+        self._append(self.listing)
+
+    def record(self, url: str, etag: Optional[str], last_modified: Optional[str],
+               name: str, data: Optional[Dict]):
+        """Remember one processed listing entry (data is None for skipped entries)"""
+        entry = {'type': 'record', 'run': self.run_id, 'url': url, 'etag': etag,
+                 'last_modified': last_modified, 'name': name, 'data': data}
+        with self.lock:
+            self.records[url] = entry
+        self._append(entry)
+
+    def complete(self):
+        """Mark the run finished and compact the journal to the latest state"""
+        self.last_run_complete = True
+        events = [{'type': 'run', 'run': self.run_id, 'started': time.time()}]
+        records = list(self.records.values())
+        if self.listing:
+            events.append(self.listing)
+            # Forget entries that have dropped out of the listing
+            listed = {pokemon['url'] for pokemon in self.listing['results']}
+            records = [entry for entry in records if entry['url'] in listed]
+        events.extend(records)
+        events.append({'type': 'complete', 'run': self.run_id, 'finished': time.time()})
+
+        temp_path = f"{self.path}.tmp"
+        with self.lock:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for event in events:
+                    f.write(json.dumps(event, ensure_ascii=False) + '\n')
+            os.replace(temp_path, self.path)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Content-addressed on-disk cache of raw PokéAPI responses
+Lets the data service rerun over previously fetched data without the network
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from typing import Dict, Optional
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "api_cache")
+DEFAULT_TTL = 7 * 24 * 60 * 60        # PokéAPI data changes rarely
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # Compressed bodies on disk
+SAVE_EVERY = 100                        # Index writes are batched
+
+
+class ResponseCache:
+    """
+    Raw response bodies stored once per content hash (blobs/<sha256>.z, zlib
+    compressed) with an index mapping each URL to its body hash, validators
+    (ETag / Last-Modified) and fetch/access times.
+
+    Entries older than `ttl` seconds are stale: the client revalidates them
+    with a conditional request. When the blobs exceed `max_bytes`, the least
+    recently used URLs are evicted. In `offline` mode stale entries are served
+    as they are and nothing is fetched.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, ttl: Optional[float] = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES, offline: bool = False):
+        self.cache_dir = cache_dir
+        self.blob_dir = os.path.join(cache_dir, "blobs")
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict] = {}
+        self.pending_saves = 0
+        self.stats = {"hits": 0, "stale": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+        os.makedirs(self.blob_dir, exist_ok=True)
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except FileNotFoundError:
+            pass
+        except ValueError:
+            print(f"⚠️  Ignoring corrupt response cache index {self.index_path}")
+
+    def count(self, key: str):
+        with self.lock:
+            self.stats[key] += 1
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, f"{digest}.z")
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """Index entry for a URL, or None"""
+        with self.lock:
+            entry = self.entries.get(url)
+            return dict(entry) if entry else None
+
+    def is_fresh(self, entry: Dict) -> bool:
+        return self.ttl is None or time.time() - entry["fetched_at"] < self.ttl
+
+    def read(self, url: str) -> Optional[bytes]:
+        """Body cached for a URL, or None if it is missing or its blob is gone"""
+        entry = self.lookup(url)
+        if not entry:
+            return None
+        try:
+            with open(self._blob_path(entry["sha256"]), "rb") as f:
+                body = zlib.decompress(f.read())
+        except (OSError, zlib.error):
+            with self.lock:
+                self.entries.pop(url, None)
+            return None
+
+        with self.lock:
+            if url in self.entries:
+                self.entries[url]["accessed_at"] = time.time()
+        return body
+
+    def store(self, url: str, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Cache a response body; identical bodies share one blob"""
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not os.path.exists(blob_path):
+            temp_path = f"{blob_path}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(zlib.compress(body))
+            os.replace(temp_path, blob_path)
+
+        now = time.time()
+        with self.lock:
+            self.entries[url] = {
+                "sha256": digest,
+                "size": os.path.getsize(blob_path),
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": now,
+                "accessed_at": now
+            }
+            self.stats["stores"] += 1
+            self.pending_saves += 1
+            save_now = self.pending_saves >= SAVE_EVERY
+        if save_now:
+            self.save()
+
+    def revalidated(self, url: str):
+        """A conditional request said the cached body is still current"""
+        with self.lock:
+            if url in self.entries:
+                self.entries[url]["fetched_at"] = time.time()
+                self.pending_saves += 1
+
+    def total_bytes(self) -> int:
+        """Bytes used by the blobs referenced from the index"""
+        with self.lock:
+            blobs = {entry["sha256"]: entry["size"] for entry in self.entries.values()}
+        return sum(blobs.values())
+
+    def evict(self):
+        """Drop least recently used URLs until under max_bytes, then delete unreferenced blobs"""
+        with self.lock:
+            blob_sizes = {entry["sha256"]: entry["size"] for entry in self.entries.values()}
+            blob_users = {}
+            for entry in self.entries.values():
+                blob_users[entry["sha256"]] = blob_users.get(entry["sha256"], 0) + 1
+            total = sum(blob_sizes.values())
+
+            for url, entry in sorted(self.entries.items(), key=lambda item: item[1]["accessed_at"]):
+                if total <= self.max_bytes:
+                    break
+                del self.entries[url]
+                self.stats["evictions"] += 1
+                blob_users[entry["sha256"]] -= 1
+                if blob_users[entry["sha256"]] == 0:
+                    total -= blob_sizes[entry["sha256"]]
+
+            referenced = {entry["sha256"] for entry in self.entries.values()}
+
+        for filename in os.listdir(self.blob_dir):
+            digest = filename.split(".", 1)[0]
+            if digest not in referenced:
+                try:
+                    os.remove(os.path.join(self.blob_dir, filename))
+                except OSError:
+                    pass
+
+    def save(self):
+        """Write the index atomically"""
+        with self.lock:
+            snapshot = json.dumps(self.entries, separators=(",", ":"))
+            self.pending_saves = 0
+        temp_path = f"{self.index_path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(snapshot)
+        os.replace(temp_path, self.index_path)
+
+    def close(self):
+        """Evict down to the size budget and persist the index"""
+        self.evict()
+        self.save()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Streaming sprite downloader - pooled HTTP fetches feeding a separate PNG encode stage
+Finished sprites are appended to a resumable manifest as they land, so an
+interrupted download picks up where it stopped
+"""
+
+import hashlib
+import json
+import os
+import queue
+import threading
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from PIL import Image
+
+from pokeapi_client import PokeApiClient
+
+SPRITE_SIZE = (96, 96)
+MANIFEST_NAME = "sprite_manifest.jsonl"
+_STOP = object()
+
+
+def sprite_filename(pokemon_name: str) -> str:
+    """File name a sprite is stored under in assets/pokemon_images"""
+    return pokemon_name.replace('/', '_').replace('\\', '_').replace(':', '_') + ".png"
+
+
+def file_sha256(path: str) -> Tuple[str, int]:
+    """(sha256 hex digest, size in bytes) of a file"""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            digest.update(block)
+            size += len(block)
+    return digest.hexdigest(), size
+
+
+class SpriteManifest:
+    """
+    JSONL manifest of downloaded sprites, one line per finished file:
+        {"name": ..., "file": ..., "url": ..., "etag": ..., "sha256": ..., "size": ...}
+    The last line for a name wins; a torn last line from a crash is ignored.
+    compact() rewrites it down to one line per name.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict] = {}
+        torn = False
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    torn = not line.endswith('\n')
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.entries[entry['name']] = entry
+        self.file = open(path, 'a', encoding='utf-8')
+        if torn:
+            self.file.write('\n')  # Don't glue the next entry onto a partial line
+
+    def get(self, pokemon_name: str) -> Optional[Dict]:
+        return self.entries.get(pokemon_name)
+
+    def record(self, entry: Dict):
+        """Append an entry and flush it, so it survives an interruption"""
+        with self.lock:
+            self.entries[entry['name']] = entry
+            self.file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self.file.flush()
+
+    def compact(self):
+        """Rewrite the manifest with only the current entry per name"""
+        with self.lock:
+            self.file.close()
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for entry in self.entries.values():
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            os.replace(temp_path, self.path)
+            self.file = open(self.path, 'a', encoding='utf-8')
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+class SpriteDownloader:
+    """
+    Downloads sprites through three stages joined by bounded queues:
+      network  - `download_workers` threads sharing one pooled PokeApiClient session
+      encode   - `encode_workers` threads decoding, resizing to 96x96 RGBA and
+                 writing optimized PNGs, so slow encodes never hold a connection
+      manifest - the calling thread, recording each finished sprite as it arrives
+
+    Existing files are trusted when the manifest matches their size, or their
+    sha256 with `verify`. With `revalidate`, they are rechecked upstream with
+    a conditional request instead.
+    """
+
+    def __init__(self, output_dir: str, manifest_path: Optional[str] = None, client: Optional[PokeApiClient] = None,
+                 download_workers: int = 8, encode_workers: int = 2, queue_size: int = 32,
+                 verify: bool = False, revalidate: bool = False):
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        self.manifest = SpriteManifest(manifest_path or os.path.join(output_dir, MANIFEST_NAME))
+        self.client = client or PokeApiClient(max_connections=download_workers, requests_per_second=None)
+        self.download_workers = download_workers
+        self.encode_workers = encode_workers
+        self.queue_size = queue_size
+        self.verify = verify
+        self.revalidate = revalidate
+
+    def is_intact(self, pokemon_name: str, path: str, url: Optional[str]) -> bool:
+        """Whether an existing file is the one the manifest recorded; unrecorded files are adopted"""
+        entry = self.manifest.get(pokemon_name)
+        if entry is None or self.verify:
+            digest, size = file_sha256(path)
+            if entry is None:
+                self.manifest.record({'name': pokemon_name, 'file': os.path.basename(path), 'url': url,
+                                      'etag': None, 'sha256': digest, 'size': size})
+                return True
+            return digest == entry['sha256'] and size == entry['size']
+        return os.path.getsize(path) == entry['size']
+
+    def plan(self, sprites: Dict[str, Optional[str]]) -> Tuple[List[Tuple[str, str, Dict]], Dict[str, str]]:
+        """
+        Split sprites into downloads to run and outcomes already known
+        `sprites` maps names to remote URLs (None when only a local copy is known)
+        Returns ([(name, url, request headers)], {name: 'cached' | 'failed'})
+        """
+        tasks = []
+        outcomes = {}
+        for pokemon_name, url in sprites.items():
+            path = os.path.join(self.output_dir, sprite_filename(pokemon_name))
+            entry = self.manifest.get(pokemon_name)
+            url = url or (entry or {}).get('url')
+
+            if os.path.exists(path) and self.is_intact(pokemon_name, path, url):
+                entry = self.manifest.get(pokemon_name)
+                if not (self.revalidate and url and entry.get('etag')):
+                    outcomes[pokemon_name] = 'cached'
+                    continue
+                tasks.append((pokemon_name, url, {'If-None-Match': entry['etag']}))
+            elif url:
+                tasks.append((pokemon_name, url, {}))
+            else:
+                print(f"❌ {pokemon_name}: sprite missing or corrupt and no source URL is known")
+                outcomes[pokemon_name] = 'failed'
+        return tasks, outcomes
+
+    def _feed(self, tasks, task_queue):
+        for task in tasks:
+            task_queue.put(task)
+        for _ in range(self.download_workers):
+            task_queue.put(_STOP)
+
+    def _download(self, task_queue, encode_queue, results):
+        """Network stage: fetch bodies and hand them to the encoders"""
+        while True:
+            task = task_queue.get()
+            if task is _STOP:
+                return
+            pokemon_name, url, headers = task
+            try:
+                response = self.client.get(url, headers=headers)
+            except requests.RequestException as e:
+                results.put((pokemon_name, 'failed', str(e)))
+                continue
+            if response.status_code == 304:
+                results.put((pokemon_name, 'unchanged', None))
+            else:
+                encode_queue.put((pokemon_name, url, response.headers.get('ETag'), response.content))
+
+    def _encode(self, encode_queue, results):
+        """Encode stage: normalize to 96x96 RGBA, write the PNG atomically and hash it"""
+        while True:
+            item = encode_queue.get()
+            if item is _STOP:
+                return
+            pokemon_name, url, etag, body = item
+            try:
+                image = Image.open(BytesIO(body))
+                if image.size != SPRITE_SIZE:
+                    image = image.resize(SPRITE_SIZE, Image.Resampling.LANCZOS)
+                if image.mode != 'RGBA':
+                    image = image.convert('RGBA')
+                buffer = BytesIO()
+                image.save(buffer, 'PNG', optimize=True)
+                data = buffer.getvalue()
+
+                filename = sprite_filename(pokemon_name)
+                path = os.path.join(self.output_dir, filename)
+                temp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            except (OSError, ValueError) as e:
+                results.put((pokemon_name, 'failed', str(e)))
+                continue
+
+            results.put((pokemon_name, 'downloaded', {
+                'name': pokemon_name, 'file': filename, 'url': url, 'etag': etag,
+                'sha256': hashlib.sha256(data).hexdigest(), 'size': len(data)
+            }))
+
+    def run(self, sprites: Dict[str, Optional[str]], progress=None) -> Dict[str, str]:
+        """
+        Bring every sprite up to date
+        Returns {name: 'cached' | 'unchanged' | 'downloaded' | 'failed'}
+        `progress(name, outcome, done, total)` is called as each sprite finishes
+        """
+        tasks, outcomes = self.plan(sprites)
+        total = len(sprites)
+        done = len(outcomes)
+
+        task_queue = queue.Queue(self.queue_size)
+        encode_queue = queue.Queue(self.queue_size)
+        results = queue.Queue()
+        threads = [threading.Thread(target=self._feed, args=(tasks, task_queue), daemon=True)]
+        threads += [threading.Thread(target=self._download, args=(task_queue, encode_queue, results), daemon=True)
+                    for _ in range(self.download_workers)]
+        encoders = [threading.Thread(target=self._encode, args=(encode_queue, results), daemon=True)
+                    for _ in range(self.encode_workers)]
+        for thread in threads + encoders:
+            thread.start()
+
+        # Workers are daemons: if this loop is interrupted, everything recorded so far is kept
+        for _ in range(len(tasks)):
+            pokemon_name, outcome, detail = results.get()
+            if outcome == 'downloaded':
+                self.manifest.record(detail)
+            elif outcome == 'failed':
+                print(f"❌ {pokemon_name}: {detail}")
+            outcomes[pokemon_name] = outcome
+            done += 1
+            if progress:
+                progress(pokemon_name, outcome, done, total)
+
+        for thread in threads:
+            thread.join()
+        for _ in encoders:
+            encode_queue.put(_STOP)
+        for thread in encoders:
+            thread.join()
+
+        return outcomes
+
+    def close(self):
+        """Compact the manifest and release the HTTP session"""
+        self.manifest.compact()
+        self.manifest.close()
+        self.client.close()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Variant classification shared by the data service, the catalog pipeline and add_variants.py
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Checked in order; the first category with a matching pattern wins
+VARIANT_PATTERNS = {
+    "Regional - Alolan": ["alolan", "alola"],
+    "Regional - Galarian": ["galarian", "galar"],
+    "Regional - Hisuian": ["hisuian", "hisui"],
+    "Regional - Paldean": ["paldean", "paldea"],
+    "Gigantamax": ["gigantamax", "gmax"],
+    "Mega": ["mega"],
+    "Special Pikachus": ["pikachu-cosplay", "pikachu-rock-star", "pikachu-belle",
+                         "pikachu-pop-star", "pikachu-phd", "pikachu-libre",
+                         "pikachu-original-cap", "pikachu-hoenn-cap", "pikachu-sinnoh-cap",
+                         "pikachu-unova-cap", "pikachu-kalos-cap", "pikachu-alola-cap",
+                         "pikachu-partner-cap", "pikachu-world-cap"],
+    "Totem Pokemon": ["totem"],
+    "Paradox Pokemon": ["walking-wake", "iron-leaves", "roaring-moon", "iron-valiant",
+                        "flutter-mane", "slither-wing", "sandy-shocks", "scream-tail",
+                        "brute-bonnet", "iron-treads", "iron-moth", "iron-hands",
+                        "iron-jugulis", "iron-thorns", "iron-bundle", "iron-crown",
+                        "iron-boulder", "gouging-fire", "raging-bolt"]
+}
+
+FORM_MARKERS = ["-altered", "-origin", "-sky", "-land", "-attack", "-defense", "-speed"]
+SIZE_MARKERS = ["-small", "-large", "-super", "-average"]
+
+
+def _variant_rules() -> List[Tuple[str, str]]:
+    """(pattern, category) pairs in priority order"""
+    rules = [(pattern, variant_type) for variant_type, patterns in VARIANT_PATTERNS.items() for pattern in patterns]
+    rules += [(form, "Form Variants") for form in FORM_MARKERS]
+    rules += [(size, "Size Variants") for size in SIZE_MARKERS]
+    return rules
+
+
+def _trie_pattern(words) -> str:
+    """Regex matching any of `words`, factored into a prefix trie so the engine never backtracks across alternatives"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class VariantClassifier:
+    """
+    All variant patterns compiled once into trie-shaped regexes
+    One search finds the leftmost (longest) pattern in a name; if a
+    higher-priority category could still match, a second regex holding only
+    the patterns that outrank it searches again, until nothing better is
+    found. That keeps the priority order (regional > Gigantamax > Mega > ...)
+    while most names are settled by a single scan.
+    """
+
+    def __init__(self, rules: Optional[List[Tuple[str, str]]] = None):
+        rules = _variant_rules() if rules is None else rules
+        self.categories: List[str] = []
+        ranks: Dict[str, int] = {}
+        for pattern, variant_type in rules:
+            if variant_type not in self.categories:
+                self.categories.append(variant_type)
+            # A pattern listed twice keeps its first (higher priority) category
+            ranks.setdefault(pattern, self.categories.index(variant_type))
+
+        # A match also contains every shorter pattern that is its prefix
+        self.ranks = {
+            pattern: min(rank for prefix, rank in ranks.items() if pattern.startswith(prefix))
+            for pattern in ranks
+        }
+        self.search = re.compile(_trie_pattern(self.ranks)).search
+        # outranking[rank] finds the patterns of strictly better categories
+        self.outranking = [None] + [
+            re.compile(_trie_pattern([pattern for pattern, pattern_rank in self.ranks.items() if pattern_rank < rank])).search
+            for rank in range(1, len(self.categories))
+        ]
+
+    def __call__(self, pokemon_name: str) -> Optional[str]:
+        name_lower = pokemon_name.lower()
+        match = self.search(name_lower)
+        if match is None:
+            return None
+
+        rank = self.ranks[match.group()]
+        while rank:
+            match = self.outranking[rank](name_lower, match.start())
+            if match is None:
+                break
+            rank = self.ranks[match.group()]
+        return self.categories[rank]
+
+
+# classify_variant(name) -> variant category, or None for standard Pokémon
+classify_variant = VariantClassifier()
@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """
 Download and cache all Pokemon sprites locally
+Run with --stream for the pooled, resumable downloader in data_sources/sprite_downloader.py
 """
+import argparse
 import json
 import os
+import sys
 import requests
 from PIL import Image
 from io import BytesIO
@@ -11,6 +14,9 @@ import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "data_sources"))
+from sprite_downloader import SpriteDownloader, sprite_filename
+
 # Thread-safe counter for progress tracking
 class ProgressCounter:
     def __init__(self):
@@ -64,7 +70,81 @@ def download_pokemon_image(pokemon_name, sprite_url, output_dir, progress_counte
         print(f"[{current}/{total_count}] ❌ {pokemon_name}: {e}")
         return pokemon_name, False, sprite_url
 
+def stream_main(args):
+    """Pooled, two-stage download that records every sprite in a resumable manifest"""
+    print("🚀 Starting streaming Pokemon sprite download...")
+    
+    data_file = "data_sources/pokemon_data.json"
+    if not os.path.exists(data_file):
+        print(f"❌ Pokemon data file not found: {data_file}")
+        return
+    
+    with open(data_file, 'r', encoding='utf-8') as f:
+        pokemon_data = json.load(f)
+    
+    # Localized entries have lost their remote URL; the manifest remembers it
+    sprites = {}
+    for pokemon_name, data in pokemon_data.items():
+        sprite_url = data.get('sprite_url') or ''
+        sprites[pokemon_name] = sprite_url if sprite_url.startswith(('http://', 'https://')) else None
+    
+    output_dir = "assets/pokemon_images"
+    downloader = SpriteDownloader(output_dir, download_workers=args.workers, encode_workers=args.encoders,
+                                  verify=args.verify, revalidate=args.revalidate)
+    
+    def progress(pokemon_name, outcome, done, total):
+        if outcome == 'downloaded':
+            print(f"[{done}/{total}] ✅ {pokemon_name}")
+    
+    start_time = time.time()
+    try:
+        outcomes = downloader.run(sprites, progress)
+    finally:
+        downloader.close()
+    duration = time.time() - start_time
+    
+    counts = {}
+    for outcome in outcomes.values():
+        counts[outcome] = counts.get(outcome, 0) + 1
+    print(f"\n🎉 {len(outcomes)} sprites in {duration:.2f}s: {counts.get('downloaded', 0)} downloaded, "
+          f"{counts.get('cached', 0)} already cached, {counts.get('unchanged', 0)} unchanged, "
+          f"{counts.get('failed', 0)} failed")
+    
+    # Only rewrite the data file when a sprite's local status actually changed
+    updated_count = 0
+    for pokemon_name, data in pokemon_data.items():
+        if outcomes.get(pokemon_name) in ('downloaded', 'cached', 'unchanged'):
+            local_path = f"assets/pokemon_images/{sprite_filename(pokemon_name)}"
+            if data.get('sprite_url') != local_path or not data.get('local_image'):
+                data['sprite_url'] = local_path
+                data['local_image'] = True
+                updated_count += 1
+        elif 'local_image' not in data:
+            data['local_image'] = False
+            updated_count += 1
+    
+    if updated_count:
+        with open(data_file, 'w', encoding='utf-8') as f:
+            json.dump(pokemon_data, f, indent=2, ensure_ascii=False)
+        print(f"💾 Updated {updated_count} entries in {data_file}")
+    else:
+        print(f"✅ {data_file} already up to date")
+
 def main():
+    parser = argparse.ArgumentParser(description="Download Pokemon sprites to assets/pokemon_images")
+    parser.add_argument("--stream", action="store_true",
+                        help="Pooled downloader with separate encode workers and a resumable manifest")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent downloads in --stream mode (default: 8)")
+    parser.add_argument("--encoders", type=int, default=2, help="PNG encode workers in --stream mode (default: 2)")
+    parser.add_argument("--verify", action="store_true", help="Check existing files against the manifest's sha256")
+    parser.add_argument("--revalidate", action="store_true",
+                        help="Recheck existing sprites upstream with conditional requests")
+    args = parser.parse_args()
+    
+    if args.stream or args.verify or args.revalidate:
+        stream_main(args)
+        return
+    
     print("🚀 Starting Pokemon image download and caching process...")
     
     # Load Pokemon data
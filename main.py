@@ -4,23 +4,27 @@ Who's Your Pokémon! - A Python-based "Guess Who" inspired game
 A two-player game where players try to guess each other's chosen Pokémon.
 
 Main entry point for the application.
+Set WYP_LOG_LEVEL=DEBUG for detailed console output, or WARNING for less.
 """
+import logging
 
 from src import PokemonGuessGame
+from src.utils import configure_logging
+
+log = logging.getLogger(__name__)
 
 
 def main():
     """Main entry point for the application"""
+    configure_logging()
     try:
-        print("🎮 Starting Who's Your Pokemon...")
+        log.info("🎮 Starting Who's Your Pokemon...")
         game = PokemonGuessGame()
-        print("✅ Game instance created successfully")
+        log.info("✅ Game instance created successfully")
         game.run()
-        print("✅ Game finished normally")
+        log.info("✅ Game finished normally")
     except Exception as e:
-        print(f"❌ Error starting game: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception(f"❌ Error starting game: {e}")
         # Keep console open in case of error
         try:
             input("Press Enter to exit...")
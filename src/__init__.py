@@ -2,6 +2,12 @@
 Pokemon Guess Game - Main Package
 """
 
-from .game import PokemonGuessGame
-
 __all__ = ['PokemonGuessGame']
+
+
+def __getattr__(name):
+    # Imported on first use so headless subpackages (src.engine) don't load Tk
+    if name == 'PokemonGuessGame':
+        from .game import PokemonGuessGame
+        return PokemonGuessGame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
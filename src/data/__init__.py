@@ -3,5 +3,8 @@ Data package for Pokemon Guess Game
 """
 
 from .pokemon_data_manager import PokemonDataManager
+from .pokemon_catalog import PokemonCatalog
+from .filter_index import PokemonFilterIndex
+from .search_index import PokemonSearchIndex
 
-__all__ = ['PokemonDataManager']
+__all__ = ['PokemonDataManager', 'PokemonCatalog', 'PokemonFilterIndex', 'PokemonSearchIndex']
@@ -0,0 +1,172 @@
+"""
+Precomputed generation and variant filter index for the Pokemon Guess Game
+"""
+from itertools import compress
+from .pokemon_catalog import NO_STRING, GENERATION_UNKNOWN, GENERATION_NOT_RECORDED
+
+# Turns the ASCII digits of bin() output into 0/1 bytes for itertools.compress
+_BIT_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+
+# Variant categories whose members are species in their own right, not forms of another
+SPECIES_VARIANTS = ('Paradox Pokemon',)
+
+
+class PokemonFilterIndex:
+    """
+    Bitmasks over catalog rows, built once at load time.
+
+    Bit i of a mask is set when Pokemon i (in catalog order) belongs to the
+    group, with one mask per generation key and one per variant category.
+    Filtering by settings is then a few ORs and one AND, and the result of
+    the most recent selection is remembered.
+    """
+
+    def __init__(self, catalog):
+        self.names = catalog.names
+        self.index = catalog.index
+        generation_ids = {}  # generation column value -> ids
+        variant_ids = {}     # variant string id -> ids
+        standard_ids = []    # Pokemon with no variant
+
+        # Group rows by the raw column values, then name the groups once each
+        for pokemon_id, (generation, variant_id) in enumerate(zip(catalog.generations, catalog.variant_ids)):
+            generation_ids.setdefault(generation, []).append(pokemon_id)
+            if variant_id == NO_STRING:
+                standard_ids.append(pokemon_id)
+            else:
+                variant_ids.setdefault(variant_id, []).append(pokemon_id)
+
+        self.generation_masks = {}
+        for generation, ids in generation_ids.items():
+            key = self.generation_key(generation)
+            self.generation_masks[key] = self.generation_masks.get(key, 0) | self.mask_for_ids(ids)
+        self.variant_masks = {catalog.strings[variant_id]: self.mask_for_ids(ids) for variant_id, ids in variant_ids.items()}
+        self.standard_mask = self.mask_for_ids(standard_ids)
+
+        # Per-row tables for dealing grids: 1 for variant forms, and base species (filled on first use)
+        self.variant_flags = bytearray(b'\x01' * len(self.names))
+        for pokemon_id in standard_ids:
+            self.variant_flags[pokemon_id] = 0
+        self._species_ids = None
+
+        self._last_selection = None
+        self._last_mask = 0
+        self._last_result = None
+
+    @staticmethod
+    def generation_key(generation):
+        """Generation as compared against the selected generation strings"""
+        if generation == GENERATION_NOT_RECORDED:
+            return '1'  # Entries without a generation have always counted as Gen 1
+        if generation == GENERATION_UNKNOWN:
+            return 'Unknown'
+        return str(generation)
+
+    def generation_mask(self, selected_generations):
+        """Pokemon in any selected generation; 'Unknown' generations always pass"""
+        mask = self.generation_masks.get('Unknown', 0)
+        for generation in selected_generations:
+            mask |= self.generation_masks.get(generation, 0)
+        return mask
+
+    def variant_mask(self, selected_variants):
+        """Standard forms plus any selected variant category"""
+        mask = self.standard_mask
+        for variant in selected_variants:
+            mask |= self.variant_masks.get(variant, 0)
+        return mask
+
+    def filter(self, selected_generations, selected_variants=None):
+        """
+        Names passing both filters, in catalog order.
+        selected_variants=None skips the variant filter.
+        """
+        selection = (
+            frozenset(selected_generations),
+            None if selected_variants is None else frozenset(selected_variants)
+        )
+        if selection != self._last_selection:
+            mask = self.generation_mask(selection[0])
+            if selection[1] is not None:
+                mask &= self.variant_mask(selection[1])
+            self._last_selection = selection
+            self._last_mask = mask
+            self._last_result = self.names_for_mask(mask)
+
+        return list(self._last_result)
+
+    def filter_ids(self, selected_generations, selected_variants=None):
+        """Catalog rows passing both filters, in catalog order (see filter)"""
+        self.filter(selected_generations, selected_variants)
+        return self.ids_for_mask(self._last_mask)
+
+    def species_ids(self):
+        """
+        Base species of every Pokemon, as a catalog row of that species.
+        A form belongs to the species named by the longest hyphenated prefix of
+        its name (Charizard-Mega-X -> Charizard), else to the first species or
+        form sharing its first part (Deoxys-Speed -> Deoxys-Normal,
+        Shaymin-Sky -> Shaymin-Land).
+        """
+        if self._species_ids is None:
+            species_mask = self.standard_mask
+            for variant in SPECIES_VARIANTS:
+                species_mask |= self.variant_masks.get(variant, 0)
+            is_species = format(species_mask, 'b').zfill(len(self.names))[::-1]
+
+            stems = {}
+            for pokemon_id, name in enumerate(self.names):
+                if is_species[pokemon_id] == '1' and '-' in name:
+                    stems.setdefault(name.split('-', 1)[0], pokemon_id)
+
+            species_ids = list(range(len(self.names)))
+            for pokemon_id, name in enumerate(self.names):
+                if is_species[pokemon_id] == '1':
+                    continue
+                parts = name.split('-')
+                for length in range(len(parts) - 1, 0, -1):
+                    base_id = self.index.get('-'.join(parts[:length]))
+                    if base_id is not None and is_species[base_id] == '1':
+                        species_ids[pokemon_id] = base_id
+                        break
+                else:
+                    species_ids[pokemon_id] = stems.setdefault(parts[0], pokemon_id)
+            self._species_ids = species_ids
+        return self._species_ids
+
+    def question_masks(self):
+        """
+        Yes/no questions about a Pokemon's generation and variant category,
+        as text -> mask of the Pokemon the answer is "yes" for
+        """
+        questions = {}
+        generations = sorted((key for key in self.generation_masks if key.isdigit()), key=int)
+        for generation in generations:
+            questions[f"Is it from Generation {generation}?"] = self.generation_masks[generation]
+        earlier = 0
+        for generation in generations[:-1]:
+            earlier |= self.generation_masks[generation]
+            questions[f"Is it from Generation {generation} or earlier?"] = earlier
+
+        questions["Is it a variant form?"] = ((1 << len(self.names)) - 1) & ~self.standard_mask
+        for variant in sorted(self.variant_masks):
+            questions[f"Is it in the {variant} category?"] = self.variant_masks[variant]
+        return questions
+
+    def mask_for_ids(self, pokemon_ids):
+        """Mask with the bits of the given catalog rows set"""
+        digits = bytearray(b'0' * len(self.names))
+        for pokemon_id in pokemon_ids:
+            digits[-1 - pokemon_id] = ord('1')
+        return int(digits, 2) if digits else 0
+
+    def ids_for_mask(self, mask):
+        """Catalog rows whose bits are set, in order"""
+        bits = format(mask, 'b')[::-1].encode('ascii').translate(_BIT_DIGITS)
+        return list(compress(range(len(self.names)), bits))
+
+    def names_for_mask(self, mask):
+        """Names of the Pokemon whose bits are set, in catalog order"""
+        # Lowest bit first, so the digits line up with catalog order
+        bits = format(mask, 'b')[::-1].encode('ascii').translate(_BIT_DIGITS)
+        return list(compress(self.names, bits))
@@ -0,0 +1,296 @@
+"""
+Compact Pokemon catalog for the Pokemon Guess Game
+
+The catalog holds the same information as data_sources/pokemon_data.json in
+columns: every distinct string (names, sprite paths, variant names) is stored
+once in a string table, and each Pokemon is a row of small integers pointing
+into it. The binary form is generated at build time and read through mmap,
+so startup decodes the names and nothing else.
+
+File layout (little-endian):
+    header | string offsets (uint32 x strings + 1) | NUL-terminated strings (padded to 4)
+    | name ids (uint32) | sprite url ids (uint32) | variant ids (uint32)
+    | generations (int16, padded to 4) | local image flags (uint8)
+The header records the size, CRC-32 and modification time of the JSON it was
+built from, so a catalog that is older than the JSON is ignored. Startup only
+stats the JSON; it is read and checksummed only when its size matches but its
+modification time doesn't (a checkout or copy that touched it).
+"""
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from ..utils.resource_path import get_resource_path
+
+log = logging.getLogger(__name__)
+
+CATALOG_FILE = 'data_sources/pokemon_catalog.bin'
+SOURCE_FILE = 'data_sources/pokemon_data.json'
+CATALOG_MAGIC = b'WYPCATLG'
+CATALOG_VERSION = 2
+
+NO_STRING = 0xFFFFFFFF
+GENERATION_UNKNOWN = -1
+GENERATION_NOT_RECORDED = 0  # Entry has no 'generation' key at all
+
+_HEADER = struct.Struct('<8sHIIIIq')
+
+
+def _padding(length):
+    return -length % 4
+
+
+def _source_crc(path):
+    with open(path, 'rb') as f:
+        return zlib.crc32(f.read())
+
+
+def _source_signature(path):
+    """Size, CRC-32 and modification time (ns) of the JSON a catalog is built from"""
+    status = os.stat(path)
+    return status.st_size, _source_crc(path), status.st_mtime_ns
+
+
+def _source_is_current(path, size, crc, mtime_ns):
+    """Whether the JSON at `path` is the one a catalog was built from, reading it only if unsure"""
+    status = os.stat(path)
+    if status.st_size != size:
+        return False
+    if status.st_mtime_ns == mtime_ns:
+        return True
+    return _source_crc(path) == crc
+
+
+class _MappedStrings:
+    """String table that decodes entries from the mapped file on first use"""
+
+    def __init__(self, data, offsets, start):
+        self._data = data
+        self._offsets = offsets
+        self._start = start
+        self._decoded = {}
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, string_id):
+        value = self._decoded.get(string_id)
+        if value is None:
+            begin = self._start + self._offsets[string_id]
+            end = self._start + self._offsets[string_id + 1] - 1  # Drop the NUL terminator
+            value = self._decoded[string_id] = str(self._data[begin:end], 'utf-8')
+        return value
+
+    def leading(self, count):
+        """Decode strings 0..count-1 in one pass"""
+        end = self._start + self._offsets[count] - 1
+        return str(self._data[self._start:end], 'utf-8').split('\0') if count else []
+
+
+class PokemonCatalog:
+    """
+    Column-oriented view of the Pokemon data, backed either by the mapped
+    binary catalog or by columns built from the JSON file.
+    """
+
+    def __init__(self, strings, name_ids, url_ids, variant_ids, generations, local_images, source=None):
+        self.strings = strings
+        self.name_ids = name_ids
+        self.url_ids = url_ids
+        self.variant_ids = variant_ids
+        self.generations = generations
+        self.local_images = local_images
+        self.source = source
+        self._mapping = None
+        self._views = []
+
+        if isinstance(strings, _MappedStrings) and all(a == b for a, b in zip(name_ids, range(len(name_ids)))):
+            # Names are written first, so they decode as one block
+            self.names = strings.leading(len(name_ids))
+        else:
+            self.names = [strings[name_id] for name_id in name_ids]
+        self.index = {name: pokemon_id for pokemon_id, name in enumerate(self.names)}
+
+    @classmethod
+    def from_dict(cls, data, source=None):
+        """Build columns from pokemon_data.json contents, interning repeated strings"""
+        strings = []
+        string_ids = {}
+
+        def intern(value):
+            if value is None:
+                return NO_STRING
+            string_id = string_ids.get(value)
+            if string_id is None:
+                string_id = string_ids[value] = len(strings)
+                strings.append(value)
+            return string_id
+
+        name_ids = array('I')
+        url_ids = array('I')
+        variant_ids = array('I')
+        generations = array('h')
+        local_images = array('B')
+
+        # Names take the first string ids so a mapped catalog can decode them in one go
+        for pokemon_name in data:
+            name_ids.append(intern(pokemon_name))
+
+        for pokemon_info in data.values():
+            if isinstance(pokemon_info, dict):
+                url_ids.append(intern(pokemon_info.get('sprite_url')))
+                variant_ids.append(intern(pokemon_info.get('variant')))
+                generation = pokemon_info.get('generation', GENERATION_NOT_RECORDED)
+                generations.append(generation if isinstance(generation, int) else GENERATION_UNKNOWN)
+                local_images.append(1 if pokemon_info.get('local_image') else 0)
+            else:
+                # Old format: the value is just the sprite URL
+                url_ids.append(intern(pokemon_info))
+                variant_ids.append(NO_STRING)
+                generations.append(GENERATION_UNKNOWN)
+                local_images.append(0)
+
+        return cls(strings, name_ids, url_ids, variant_ids, generations, local_images, source)
+
+    @classmethod
+    def open(cls, path, source_path=None):
+        """Map a binary catalog file; raises ValueError if it is invalid or stale"""
+        if sys.byteorder != 'little':
+            raise ValueError("Binary catalog requires a little-endian machine")
+
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        views = []
+        try:
+            (magic, version, count, string_count,
+             source_size, source_crc, source_mtime_ns) = _HEADER.unpack_from(data, 0)
+            if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+                raise ValueError(f"Unsupported catalog format in {path}")
+            if source_path and os.path.exists(source_path):
+                if not _source_is_current(source_path, source_size, source_crc, source_mtime_ns):
+                    raise ValueError(f"Catalog is out of date with {os.path.basename(source_path)}")
+
+            view = memoryview(data)
+            views.append(view)
+            position = _HEADER.size
+
+            def column(typecode, length):
+                nonlocal position
+                size = length * struct.calcsize(typecode)
+                raw = view[position:position + size]
+                values = raw.cast(typecode)
+                views.extend([raw, values])
+                position += size + _padding(size)
+                return values
+
+            offsets = column('I', string_count + 1)
+            strings_start = position
+            position += offsets[-1] + _padding(offsets[-1])
+            strings = _MappedStrings(data, offsets, strings_start)
+
+            name_ids = column('I', count)
+            url_ids = column('I', count)
+            variant_ids = column('I', count)
+            generations = column('h', count)
+            local_images = column('B', count)
+            catalog = cls(strings, name_ids, url_ids, variant_ids, generations, local_images, path)
+        except Exception:
+            for mapped_view in reversed(views):
+                mapped_view.release()
+            data.close()
+            raise
+
+        catalog._mapping = data
+        catalog._views = views
+        return catalog
+
+    @classmethod
+    def load(cls, relative_path=CATALOG_FILE, source_relative_path=SOURCE_FILE):
+        """Open the bundled binary catalog, or return None so the caller can fall back to JSON"""
+        path = get_resource_path(relative_path)
+        if not os.path.exists(path):
+            return None
+        # A frozen build bundles the JSON the catalog was built from, so there is nothing to check
+        source_path = None if getattr(sys, 'frozen', False) else get_resource_path(source_relative_path)
+        try:
+            return cls.open(path, source_path)
+        except Exception as e:
+            log.warning(f"⚠️ Could not use binary catalog: {e}")
+            return None
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, pokemon_name):
+        return pokemon_name in self.index
+
+    def sprite_url(self, pokemon_id):
+        url_id = self.url_ids[pokemon_id]
+        return None if url_id == NO_STRING else self.strings[url_id]
+
+    def variant(self, pokemon_id):
+        variant_id = self.variant_ids[pokemon_id]
+        return None if variant_id == NO_STRING else self.strings[variant_id]
+
+    def generation(self, pokemon_id):
+        """Generation number, GENERATION_UNKNOWN or GENERATION_NOT_RECORDED"""
+        return self.generations[pokemon_id]
+
+    def local_image(self, pokemon_id):
+        return bool(self.local_images[pokemon_id])
+
+    def all_variants(self):
+        """Every distinct variant category in the catalog"""
+        return {self.strings[variant_id] for variant_id in set(self.variant_ids) if variant_id != NO_STRING}
+
+    def write(self, path, source_signature=(0, 0, 0)):
+        """Write the catalog in binary form"""
+        encoded = [self.strings[string_id].encode('utf-8') + b'\0' for string_id in range(len(self.strings))]
+        offsets = array('I', [0])
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+
+        columns = [
+            offsets.tobytes(),
+            b''.join(encoded),
+            array('I', self.name_ids).tobytes(),
+            array('I', self.url_ids).tobytes(),
+            array('I', self.variant_ids).tobytes(),
+            array('h', self.generations).tobytes(),
+            array('B', self.local_images).tobytes()
+        ]
+
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(_HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, len(self.names), len(encoded), *source_signature))
+            for column in columns:
+                f.write(column)
+                f.write(b'\0' * _padding(len(column)))
+        os.replace(temp_path, path)
+
+    def close(self):
+        """Release the memory map, if the catalog is file-backed"""
+        if self._mapping is None:
+            return
+        self.strings = self.name_ids = self.url_ids = self.variant_ids = None
+        self.generations = self.local_images = None
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mapping.close()
+        self._mapping = None
+
+
+def build_catalog(json_path, output_path):
+    """Convert pokemon_data.json into the binary catalog, returning the Pokemon count"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    catalog = PokemonCatalog.from_dict(data, json_path)
+    catalog.write(output_path, _source_signature(json_path))
+    return len(catalog)
@@ -2,113 +2,174 @@
 Pokemon data management for the Pokemon Guess Game
 """
 import json
+import logging
+import threading
 from ..utils.resource_path import get_resource_path
+from ..utils.instrumentation import timed
+from .pokemon_catalog import PokemonCatalog, GENERATION_UNKNOWN, GENERATION_NOT_RECORDED
+from .filter_index import PokemonFilterIndex
+from .search_index import PokemonSearchIndex
+from ..engine import GridSampler, QuestionBank, alphabetical_questions
+
+log = logging.getLogger(__name__)
 
 
 class PokemonDataManager:
     """Manages Pokemon data loading and filtering"""
     
-    def __init__(self):
-        self.pokemon_data = self.load_pokemon_data()
-        self.pokemon_list = list(self.pokemon_data.keys()) if self.pokemon_data else [
-            "Pikachu", "Bulbasaur", "Charmander", "Squirtle", "Caterpie", "Weedle",
-            "Pidgey", "Rattata", "Spearow", "Ekans", "Sandshrew", "Nidoran♀",
-            "Nidoran♂", "Clefairy", "Vulpix", "Jigglypuff", "Zubat", "Oddish",
-            "Paras", "Venonat", "Diglett", "Meowth", "Psyduck", "Mankey"
-        ]
+    def __init__(self, load_in_background=False):
+        self.catalog = None
+        self.pokemon_list = []
+        self._search_index = None
+        self.filter_index = None
+        self._loaded = threading.Event()
+        if load_in_background:
+            # The startup screen can be drawn while the catalog loads
+            threading.Thread(target=self._load, name="catalog-loader", daemon=True).start()
+        else:
+            self._load()
+    
+    def _load(self):
+        """Load the catalog and build the filter index"""
+        try:
+            catalog = self.load_catalog()
+            self.pokemon_list = list(catalog.names) if catalog else [
+                "Pikachu", "Bulbasaur", "Charmander", "Squirtle", "Caterpie", "Weedle",
+                "Pidgey", "Rattata", "Spearow", "Ekans", "Sandshrew", "Nidoran♀",
+                "Nidoran♂", "Clefairy", "Vulpix", "Jigglypuff", "Zubat", "Oddish",
+                "Paras", "Venonat", "Diglett", "Meowth", "Psyduck", "Mankey"
+            ]
+            # Generation/variant bitmasks so settings changes don't rescan the data
+            self.filter_index = PokemonFilterIndex(catalog) if catalog else None
+            self.catalog = catalog
+        finally:
+            self._loaded.set()
+    
+    def is_loaded(self):
+        return self._loaded.is_set()
+    
+    def wait_until_loaded(self):
+        """Block until the catalog is available (returns at once when already loaded)"""
+        self._loaded.wait()
+    
+    def load_catalog(self):
+        """Load the prebuilt binary catalog, falling back to parsing the JSON file"""
+        catalog = PokemonCatalog.load()
+        if catalog:
+            log.info(f"✅ Loaded {len(catalog)} Pokémon from catalog")
+            return catalog
+        
+        data = self.load_pokemon_data()
+        return PokemonCatalog.from_dict(data) if data else None
     
     def load_pokemon_data(self):
         """Load Pokémon data from the JSON file"""
         try:
             with open(get_resource_path('data_sources/pokemon_data.json'), 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            print(f"✅ Loaded {len(data)} Pokémon from data file")
+            log.info(f"✅ Loaded {len(data)} Pokémon from data file")
             return data
         except FileNotFoundError:
-            print("⚠️  Pokémon data file not found, using fallback list")
+            log.warning("⚠️  Pokémon data file not found, using fallback list")
             return None
         except Exception as e:
-            print(f"❌ Error loading Pokémon data: {e}")
+            log.error(f"❌ Error loading Pokémon data: {e}")
             return None
     
+    def get_search_index(self):
+        """Get the name search index, building it on first use"""
+        self.wait_until_loaded()
+        if self._search_index is None:
+            self._search_index = PokemonSearchIndex(self.pokemon_list)
+        return self._search_index
+    
     def get_pokemon_generation(self, pokemon_name):
         """Get the generation information for a Pokémon"""
-        if pokemon_name not in self.pokemon_data:
+        pokemon_id = self._pokemon_id(pokemon_name)
+        if pokemon_id is None:
             return "Unknown"
         
-        pokemon_info = self.pokemon_data[pokemon_name]
-        if isinstance(pokemon_info, dict):
-            return pokemon_info.get('generation', 'Unknown')
-        else:
-            return "Unknown"  # Old format doesn't have generation info
+        generation = self.catalog.generation(pokemon_id)
+        if generation in (GENERATION_UNKNOWN, GENERATION_NOT_RECORDED):
+            return "Unknown"
+        return generation
     
     def get_pokemon_sprite_url(self, pokemon_name):
         """Get the sprite URL for a Pokémon"""
-        if pokemon_name not in self.pokemon_data:
+        pokemon_id = self._pokemon_id(pokemon_name)
+        if pokemon_id is None:
             return None
-        
-        pokemon_info = self.pokemon_data[pokemon_name]
-        if isinstance(pokemon_info, dict):
-            return pokemon_info.get('sprite_url')
-        else:
-            return pokemon_info  # Old format is just the URL
+        return self.catalog.sprite_url(pokemon_id)
     
     def get_pokemon_variant(self, pokemon_name):
         """Get the variant information for a Pokémon"""
-        if pokemon_name not in self.pokemon_data:
+        pokemon_id = self._pokemon_id(pokemon_name)
+        if pokemon_id is None:
             return None
-        
-        pokemon_info = self.pokemon_data[pokemon_name]
-        if isinstance(pokemon_info, dict):
-            return pokemon_info.get('variant')
-        else:
-            return None  # Old format doesn't have variant info
+        return self.catalog.variant(pokemon_id)
+    
+    def get_all_variants(self):
+        """Get every variant category present in the data"""
+        self.wait_until_loaded()
+        if not self.catalog:
+            return set()
+        return self.catalog.all_variants()
+    
+    def _pokemon_id(self, pokemon_name):
+        """Row of a Pokémon in the catalog, or None"""
+        self.wait_until_loaded()
+        if not self.catalog:
+            return None
+        return self.catalog.index.get(pokemon_name)
+    
+    def get_pokemon_id(self, pokemon_name):
+        """Integer id the game engine uses for a Pokémon (its position in pokemon_list), or None"""
+        pokemon_id = self._pokemon_id(pokemon_name)
+        if pokemon_id is None and not self.catalog and pokemon_name in self.pokemon_list:
+            pokemon_id = self.pokemon_list.index(pokemon_name)  # Fallback roster
+        return pokemon_id
+    
+    def get_pokemon_name(self, pokemon_id):
+        """Name of the Pokémon with a game engine id"""
+        self.wait_until_loaded()
+        return self.pokemon_list[pokemon_id]
     
     def filter_pokemon_by_generation(self, selected_generations):
         """Filter Pokémon list based on selected generations (legacy method)"""
-        if not self.pokemon_data:
+        self.wait_until_loaded()
+        if not self.filter_index:
             return []
-        
-        filtered_list = []
-        for pokemon_name, pokemon_info in self.pokemon_data.items():
-            if isinstance(pokemon_info, dict):
-                generation = pokemon_info.get('generation', 1)
-                generation_str = str(generation) if generation != -1 else 'Unknown'
-                
-                if generation_str in selected_generations or generation_str == 'Unknown':
-                    filtered_list.append(pokemon_name)
-            else:
-                # Backward compatibility - include if no generation filtering
-                filtered_list.append(pokemon_name)
-        
-        return filtered_list
+        return self.filter_index.filter(selected_generations)
     
+    @timed('filter_pokemon_by_settings')
     def filter_pokemon_by_settings(self, selected_generations, selected_variants):
         """Filter Pokémon list based on selected generations and variants"""
-        if not self.pokemon_data:
+        self.wait_until_loaded()
+        if not self.filter_index:
             return []
-        
-        filtered_list = []
-        for pokemon_name, pokemon_info in self.pokemon_data.items():
-            if isinstance(pokemon_info, dict):
-                # Check generation
-                generation = pokemon_info.get('generation', 1)
-                generation_str = str(generation) if generation != -1 else 'Unknown'
-                
-                if generation_str not in selected_generations and generation_str != 'Unknown':
-                    continue
-                
-                # Check variant - always include standard (non-variant) Pokemon
-                variant = pokemon_info.get('variant')
-                if variant is None:
-                    # Standard Pokemon - always include
-                    filtered_list.append(pokemon_name)
-                elif variant in selected_variants:
-                    # Variant Pokemon that matches selection
-                    filtered_list.append(pokemon_name)
-                # Skip variant Pokemon that don't match selection
-            else:
-                # Backward compatibility - include if no filtering
-                filtered_list.append(pokemon_name)
-        
-        return filtered_list
+        # Standard (non-variant) Pokemon are always included
+        return self.filter_index.filter(selected_generations, selected_variants)
+    
+    def question_bank(self):
+        """Yes/no questions about catalog attributes and names, for computer players"""
+        self.wait_until_loaded()
+        questions = self.filter_index.question_masks() if self.filter_index else {}
+        questions.update(alphabetical_questions(self.pokemon_list))
+        return QuestionBank(questions)
+    
+    def grid_rules(self, unique_species=False, max_variants=None):
+        """GridSampler keyword arguments for dealing with the catalog's base species and variant forms"""
+        self.wait_until_loaded()
+        rules = {'unique_species': unique_species, 'max_variants': max_variants}
+        if self.filter_index:
+            rules['species'] = self.filter_index.species_ids()
+            rules['variants'] = self.filter_index.variant_flags
+        return rules
+    
+    def grid_sampler(self, pokemon_names, unique_species=False, max_variants=None, rng=None):
+        """
+        GridSampler dealing from the given Pokémon, with base species and variant
+        forms from the catalog. Raises ValueError if they can't fill a grid.
+        """
+        pool_ids = [self.get_pokemon_id(name) for name in pokemon_names]
+        return GridSampler(pool_ids, rng=rng, **self.grid_rules(unique_species, max_variants))
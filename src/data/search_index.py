@@ -0,0 +1,106 @@
+"""
+Prebuilt name index for Pokemon autocomplete search
+"""
+
+
+class PokemonSearchIndex:
+    """
+    Search index built once from a list of Pokemon names.
+
+    Lowercased names and n-gram posting lists are computed up front so a
+    keystroke only touches the names that can possibly match. Results are
+    ranked exact > prefix > substring > subsequence, keeping roster order
+    within each tier, and the search stops as soon as the limit is filled.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.lowered = [name.lower() for name in self.names]
+        self.name_set = set(self.names)
+
+        self.exact = {}     # lowered name -> ids
+        self.prefixes = {}  # first 1..3 characters -> ids
+        self.grams = {}     # every 1..3 character substring -> ids
+
+        for pokemon_id, lowered in enumerate(self.lowered):
+            self.exact.setdefault(lowered, []).append(pokemon_id)
+
+            for size in range(1, min(self.GRAM_SIZE, len(lowered)) + 1):
+                self.prefixes.setdefault(lowered[:size], []).append(pokemon_id)
+
+            seen = set()
+            for size in range(1, self.GRAM_SIZE + 1):
+                for start in range(len(lowered) - size + 1):
+                    gram = lowered[start:start + size]
+                    if gram not in seen:
+                        seen.add(gram)
+                        self.grams.setdefault(gram, []).append(pokemon_id)
+
+    def __len__(self):
+        return len(self.names)
+
+    def search(self, query, limit=8, allowed=None):
+        """
+        Return up to `limit` names matching `query`.
+        If `allowed` is given, only names in that set are returned.
+        """
+        if not query or limit <= 0:
+            return []
+
+        query = query.lower()
+        results = []
+        taken = set()
+
+        tiers = (
+            (self.exact.get(query, ()), None),
+            (self._prefix_candidates(query), lambda lowered: lowered.startswith(query)),
+            (self._substring_candidates(query), lambda lowered: query in lowered),
+            (self._subsequence_candidates(query), lambda lowered: self._is_subsequence(query, lowered)),
+        )
+
+        for candidates, matches in tiers:
+            for pokemon_id in candidates:
+                if pokemon_id in taken:
+                    continue
+                if matches is not None and not matches(self.lowered[pokemon_id]):
+                    continue
+
+                name = self.names[pokemon_id]
+                if allowed is not None and name not in allowed:
+                    continue
+
+                taken.add(pokemon_id)
+                results.append(name)
+                if len(results) >= limit:
+                    return results
+
+        return results
+
+    def _prefix_candidates(self, query):
+        """Ids whose name may start with the query, in roster order"""
+        return self.prefixes.get(query[:self.GRAM_SIZE], ())
+
+    def _substring_candidates(self, query):
+        """Ids whose name may contain the query, in roster order"""
+        if len(query) <= self.GRAM_SIZE:
+            return self.grams.get(query, ())
+
+        # The rarest trigram of the query bounds the candidate set
+        postings = [
+            self.grams.get(query[start:start + self.GRAM_SIZE], ())
+            for start in range(len(query) - self.GRAM_SIZE + 1)
+        ]
+        return min(postings, key=len)
+
+    def _subsequence_candidates(self, query):
+        """Ids whose name contains every character of the query, in roster order"""
+        postings = [self.grams.get(char, ()) for char in set(query)]
+        return min(postings, key=len)
+
+    @staticmethod
+    def _is_subsequence(query, lowered):
+        """Check that all characters of query appear in order in lowered"""
+        remaining = iter(lowered)
+        return all(char in remaining for char in query)
@@ -0,0 +1,46 @@
+"""
+Headless game engine for Pokemon Guess Game
+Game rules on integer ids and bitmasks, with no Tk dependency
+"""
+
+from .game_engine import (
+    GameEngine, deal_grid, GRID_ROWS, GRID_COLUMNS, GRID_SIZE,
+    GUESSED, WRONG_GUESS, ELIMINATED_TARGET
+)
+from .grid_sampler import GridSampler
+from .match_log import MatchRecorder, RecordedMatch, read_matches, replay, roster_crc, LOG_EXTENSION
+from .questioner import (
+    QuestionBank, QuestioningPlayer, TurnPlan, best_question, information_gain, alphabetical_questions
+)
+from .strategies import STRATEGIES, random_elimination, halving
+from .simulator import simulate, play_match, turn_percentile
+
+__all__ = [
+    'GameEngine',
+    'deal_grid',
+    'GRID_ROWS',
+    'GRID_COLUMNS',
+    'GRID_SIZE',
+    'GUESSED',
+    'WRONG_GUESS',
+    'ELIMINATED_TARGET',
+    'GridSampler',
+    'MatchRecorder',
+    'RecordedMatch',
+    'read_matches',
+    'replay',
+    'roster_crc',
+    'LOG_EXTENSION',
+    'QuestionBank',
+    'QuestioningPlayer',
+    'TurnPlan',
+    'best_question',
+    'information_gain',
+    'alphabetical_questions',
+    'STRATEGIES',
+    'random_elimination',
+    'halving',
+    'simulate',
+    'play_match',
+    'turn_percentile'
+]
@@ -0,0 +1,132 @@
+"""
+Headless game rules for the Pokemon Guess Game
+
+A match is two grids of integer Pokemon ids (catalog rows) and, per player,
+a bitmask of the positions they have crossed out on their opponent's grid.
+Nothing here touches Tk, so matches can be played by the UI, replayed or
+simulated in bulk.
+"""
+import random
+
+GRID_ROWS = 4
+GRID_COLUMNS = 6
+GRID_SIZE = GRID_ROWS * GRID_COLUMNS
+
+# Why a match ended
+GUESSED = 'guessed'                      # The current player named the opponent's Pokemon
+WRONG_GUESS = 'wrong_guess'              # The current player named the wrong one and loses
+ELIMINATED_TARGET = 'eliminated_target'  # The current player crossed out the opponent's Pokemon and loses
+
+
+def deal_grid(pool_ids, chosen_id, rng=random):
+    """
+    A random grid of GRID_SIZE distinct ids from the pool that includes the chosen id
+    Samples the pool directly rather than copying it without the chosen id: when the
+    sample misses it, it replaces a random tile, which leaves every grid equally likely
+    """
+    if len(pool_ids) < GRID_SIZE:
+        others = [pokemon_id for pokemon_id in pool_ids if pokemon_id != chosen_id]
+        if len(others) < GRID_SIZE - 1:
+            raise ValueError(f"Need at least {GRID_SIZE} Pokémon to deal a grid, only {len(others) + 1} available")
+        grid = others + [chosen_id]
+        rng.shuffle(grid)
+        return grid
+
+    grid = rng.sample(pool_ids, GRID_SIZE)
+    if chosen_id not in grid:
+        grid[rng.randrange(GRID_SIZE)] = chosen_id
+    return grid
+
+
+class GameEngine:
+    """
+    State and rules of one match. Players are numbered 1 and 2, and player 1 starts.
+    eliminated[p] has bit i set when player p has crossed out position i of the other grid.
+    A recorder (see match_log.MatchRecorder) attached to the engine is told every move.
+    """
+
+    __slots__ = ('grids', 'positions', 'chosen', 'eliminated', 'current_player', 'turns',
+                 'finished', 'winner', 'reason', 'recorder')
+
+    def __init__(self, grid1, grid2, chosen1, chosen2):
+        self.grids = (None, tuple(grid1), tuple(grid2))
+        self.positions = (None, {pokemon_id: i for i, pokemon_id in enumerate(grid1)},
+                          {pokemon_id: i for i, pokemon_id in enumerate(grid2)})
+        self.chosen = (None, chosen1, chosen2)
+        self.eliminated = [None, 0, 0]
+        self.current_player = 1
+        self.turns = 1  # Number of the turn in progress, counting both players' turns
+        self.finished = False
+        self.winner = None
+        self.reason = None
+        self.recorder = None
+
+    @classmethod
+    def deal(cls, pool_ids, chosen1, chosen2, rng=random):
+        """A new match with both grids dealt from the pool"""
+        return cls(deal_grid(pool_ids, chosen1, rng), deal_grid(pool_ids, chosen2, rng), chosen1, chosen2)
+
+    @property
+    def opponent(self):
+        return 3 - self.current_player
+
+    def is_eliminated(self, player, pokemon_id):
+        """Whether `player` has crossed out a Pokemon on their opponent's grid"""
+        position = self.positions[3 - player].get(pokemon_id)
+        return position is not None and bool(self.eliminated[player] >> position & 1)
+
+    def remaining(self, player):
+        """Tiles `player` has not crossed out on their opponent's grid"""
+        return GRID_SIZE - self.eliminated[player].bit_count()
+
+    def candidates(self, player):
+        """Ids `player` has not crossed out on their opponent's grid, in grid order"""
+        mask = self.eliminated[player]
+        return [pokemon_id for i, pokemon_id in enumerate(self.grids[3 - player]) if not mask >> i & 1]
+
+    def toggle_position(self, position):
+        """Cross out (or restore) a position on the opponent's grid; returns True if now crossed out"""
+        if self.finished:
+            raise RuntimeError("The match is over")
+        if self.recorder:
+            self.recorder.toggle(position)
+        player = self.current_player
+        self.eliminated[player] ^= 1 << position
+        return bool(self.eliminated[player] >> position & 1)
+
+    def toggle(self, pokemon_id):
+        """Cross out (or restore) a Pokemon on the opponent's grid; returns True if now crossed out"""
+        return self.toggle_position(self.positions[self.opponent][pokemon_id])
+
+    def end_turn(self):
+        """
+        Pass the turn to the opponent. A player who has crossed out the opponent's
+        Pokemon loses instead. Returns True while the match goes on.
+        """
+        if self.finished:
+            raise RuntimeError("The match is over")
+        if self.recorder:
+            self.recorder.end_turn()
+        if self.is_eliminated(self.current_player, self.chosen[self.opponent]):
+            self._finish(self.opponent, ELIMINATED_TARGET)
+            return False
+        self.current_player = self.opponent
+        self.turns += 1
+        return True
+
+    def guess(self, pokemon_id):
+        """The current player names the opponent's Pokemon, which ends the match; returns True if right"""
+        if self.finished:
+            raise RuntimeError("The match is over")
+        if self.recorder:
+            self.recorder.guess(pokemon_id)
+        if pokemon_id == self.chosen[self.opponent]:
+            self._finish(self.current_player, GUESSED)
+            return True
+        self._finish(self.opponent, WRONG_GUESS)
+        return False
+
+    def _finish(self, winner, reason):
+        self.finished = True
+        self.winner = winner
+        self.reason = reason
@@ -0,0 +1,134 @@
+"""
+Constrained grid dealing for the Pokemon Guess Game
+
+GridSampler deals many grids from one pool of integer Pokemon ids, optionally
+allowing only one Pokemon per base species and capping the variant forms per
+grid. The pool is copied once, when the sampler is built; each grid is then a
+partial Fisher-Yates shuffle of that copy, costing about one draw per tile.
+"""
+import random
+
+from .game_engine import GRID_SIZE, deal_grid
+
+
+class GridSampler:
+    """
+    Deals GRID_SIZE-tile grids of distinct ids that include a chosen id.
+    species[id] is a Pokemon's base species and variants[id] is truthy for
+    variant forms; without them every id is its own standard species.
+    The chosen Pokemon is always dealt, even as a variant over max_variants.
+    rng is a random.Random or a seed.
+    """
+
+    def __init__(self, pool_ids, species=None, variants=None, unique_species=False, max_variants=None, rng=None):
+        self.pool = list(dict.fromkeys(pool_ids))
+        self.species = species
+        self.variants = variants
+        self.unique_species = unique_species
+        self.max_variants = max_variants
+        self.rng = rng if isinstance(rng, random.Random) else random.Random(rng)
+
+        # Fail here rather than on the first deal
+        capacity = self.capacity()
+        if capacity < GRID_SIZE:
+            raise ValueError(self._shortage_message(capacity))
+
+    def species_of(self, pokemon_id):
+        return self.species[pokemon_id] if self.species is not None else pokemon_id
+
+    def is_variant(self, pokemon_id):
+        return self.variants is not None and bool(self.variants[pokemon_id])
+
+    def random_id(self):
+        """A random id from the pool, e.g. a simulated player's chosen Pokemon"""
+        return self.pool[self.rng.randrange(len(self.pool))]
+
+    def capacity(self, chosen_id=None):
+        """Most tiles a grid from this pool can have under the constraints (including chosen_id)"""
+        standard, variant_only = self._groups(chosen_id)
+        slots = self._variant_slots(chosen_id)
+        return len(standard) + min(slots, len(variant_only)) + (chosen_id is not None)
+
+    def deal(self, chosen_id):
+        """A random grid that includes chosen_id; raises ValueError if the constraints can't be met"""
+        if not self.unique_species and self.max_variants is None:
+            return deal_grid(self.pool, chosen_id, self.rng)
+
+        pool = self.pool
+        size = len(pool)
+        randrange = self.rng.randrange
+        species = self.species if self.unique_species else None
+        variants = self.variants if self.max_variants is not None else None
+        used_species = {self.species_of(chosen_id)} if species is not None else None
+        variants_left = self._variant_slots(chosen_id)
+        grid = [chosen_id]
+
+        for i in range(size):
+            j = randrange(i, size)
+            pokemon_id = pool[j]
+            pool[i], pool[j] = pokemon_id, pool[i]
+            if pokemon_id == chosen_id:
+                continue
+            if species is not None:
+                pokemon_species = species[pokemon_id]
+                if pokemon_species in used_species:
+                    continue
+            if variants is not None and variants[pokemon_id]:
+                if not variants_left:
+                    continue
+                variants_left -= 1
+            if species is not None:
+                used_species.add(pokemon_species)
+            grid.append(pokemon_id)
+            if len(grid) == GRID_SIZE:
+                break
+        else:
+            # The random order took variants whose species had standard forms; build one instead
+            grid = self._construct(chosen_id)
+
+        self.rng.shuffle(grid)
+        return grid
+
+    def _variant_slots(self, chosen_id):
+        """Variant tiles a grid may still take once chosen_id is on it"""
+        if self.max_variants is None:
+            return GRID_SIZE
+        return max(0, self.max_variants - (chosen_id is not None and self.is_variant(chosen_id)))
+
+    def _groups(self, chosen_id):
+        """
+        Ids that may join chosen_id, keyed by species when species must be unique
+        (otherwise by id): keys with a standard form, and keys with only variants
+        """
+        chosen_key = self.species_of(chosen_id) if self.unique_species and chosen_id is not None else chosen_id
+        standard = {}
+        variant_only = {}
+        for pokemon_id in self.pool:
+            key = self.species_of(pokemon_id) if self.unique_species else pokemon_id
+            if pokemon_id == chosen_id or key == chosen_key:
+                continue
+            group = variant_only if self.is_variant(pokemon_id) else standard
+            group.setdefault(key, []).append(pokemon_id)
+        for key in standard:
+            variant_only.pop(key, None)
+        return standard, variant_only
+
+    def _construct(self, chosen_id):
+        """A grid built from one Pokemon per standard key plus as many variants as allowed"""
+        rng = self.rng
+        standard, variant_only = self._groups(chosen_id)
+        variant_picks = [rng.choice(ids) for ids in variant_only.values()]
+        rng.shuffle(variant_picks)
+        picks = [rng.choice(ids) for ids in standard.values()] + variant_picks[:self._variant_slots(chosen_id)]
+        if len(picks) < GRID_SIZE - 1:
+            raise ValueError(self._shortage_message(len(picks) + 1))
+        return [chosen_id] + rng.sample(picks, GRID_SIZE - 1)
+
+    def _shortage_message(self, available):
+        rules = []
+        if self.unique_species:
+            rules.append("one per base species")
+        if self.max_variants is not None:
+            rules.append(f"at most {self.max_variants} variant{'' if self.max_variants == 1 else 's'}")
+        rules_text = f" ({' and '.join(rules)})" if rules else ""
+        return f"Need at least {GRID_SIZE} Pokémon to deal a grid{rules_text}, only {available} available"
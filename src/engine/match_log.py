@@ -0,0 +1,209 @@
+"""
+Binary match logs for the Pokemon Guess Game
+
+A log file is a header followed by records. Each match starts with a START
+record holding everything needed to rebuild it (seed, both chosen ids and both
+grids), followed by one small record per toggle, turn end and guess, stamped
+with milliseconds since the match started:
+
+    header:    magic (8 bytes) | version (uint16)
+    START:     op | seed (uint64) | started (float64, Unix time) | roster crc (uint32)
+               | chosen1, chosen2 (uint16) | grid1, grid2 (24 x uint16 each)
+    TOGGLE:    op | grid position (uint8) | ms (uint32)
+    END_TURN:  op | ms (uint32)
+    GUESS:     op | pokemon id (uint16) | ms (uint32)
+
+Ids are positions in the roster the match was played with; the roster crc
+tells whether the current roster still names them the same. Replaying needs
+only this module and GameEngine, so logs can be read without Tk.
+"""
+import struct
+import time
+import zlib
+
+from .game_engine import GameEngine, GRID_SIZE
+
+LOG_MAGIC = b'WYPMATCH'
+LOG_VERSION = 1
+LOG_EXTENSION = '.wyplog'
+
+# Record types
+START = 1
+TOGGLE = 2
+END_TURN = 3
+GUESS = 4
+
+_HEADER = struct.Struct('<8sH')
+_START = struct.Struct(f'<BQdI{2 + 2 * GRID_SIZE}H')
+_TOGGLE = struct.Struct('<BBI')
+_END_TURN = struct.Struct('<BI')
+_GUESS = struct.Struct('<BHI')
+_RECORDS = {TOGGLE: _TOGGLE, END_TURN: _END_TURN, GUESS: _GUESS}
+
+
+def roster_crc(pokemon_names):
+    """Checksum of a roster, to tell whether logged ids still mean the same Pokemon"""
+    return zlib.crc32('\n'.join(pokemon_names).encode('utf-8'))
+
+
+class RecordedMatch:
+    """One match read from a log: its setup and its (type, value, ms) events"""
+
+    __slots__ = ('seed', 'started', 'roster_crc', 'grids', 'chosen', 'events')
+
+    def __init__(self, seed, started, roster_crc, grids, chosen):
+        self.seed = seed
+        self.started = started
+        self.roster_crc = roster_crc
+        self.grids = grids
+        self.chosen = chosen
+        self.events = []
+
+
+class MatchRecorder:
+    """
+    Appends matches to a log file. start() attaches the recorder to an engine,
+    which then reports every toggle, turn end and guess. Records are buffered
+    by the file object and reach the disk on flush(), close() or a full buffer.
+    """
+
+    def __init__(self, path, buffer_size=64 * 1024):
+        self.path = path
+        self._file = open(path, 'ab', buffering=buffer_size)
+        if self._file.tell() == 0:
+            self._file.write(_HEADER.pack(LOG_MAGIC, LOG_VERSION))
+        self._started = 0.0
+
+    def start(self, engine, seed=0, roster_checksum=0):
+        """Record a new match and attach to its engine"""
+        self._started = time.perf_counter()
+        self._file.write(_START.pack(START, seed, time.time(), roster_checksum,
+                                     engine.chosen[1], engine.chosen[2], *engine.grids[1], *engine.grids[2]))
+        engine.recorder = self
+
+    def _ms(self):
+        return int((time.perf_counter() - self._started) * 1000)
+
+    def toggle(self, position):
+        self._file.write(_TOGGLE.pack(TOGGLE, position, self._ms()))
+
+    def end_turn(self):
+        self._file.write(_END_TURN.pack(END_TURN, self._ms()))
+
+    def guess(self, pokemon_id):
+        self._file.write(_GUESS.pack(GUESS, pokemon_id, self._ms()))
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+def read_matches(path):
+    """
+    Every match in a log file, in order. A record cut short by a crash ends
+    the log; anything else malformed raises ValueError.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path} is not a match log")
+    magic, version = _HEADER.unpack_from(data, 0)
+    if magic != LOG_MAGIC or version != LOG_VERSION:
+        raise ValueError(f"Unsupported match log format in {path}")
+
+    matches = []
+    match = None
+    position = _HEADER.size
+    while position < len(data):
+        record_type = data[position]
+        record = _START if record_type == START else _RECORDS.get(record_type)
+        if record is None:
+            raise ValueError(f"Unknown record type {record_type} at byte {position} of {path}")
+        if position + record.size > len(data):
+            break  # Torn final record
+        fields = record.unpack_from(data, position)
+        position += record.size
+
+        if record_type == START:
+            _, seed, started, checksum, chosen1, chosen2, *grids = fields
+            match = RecordedMatch(seed, started, checksum,
+                                  (None, tuple(grids[:GRID_SIZE]), tuple(grids[GRID_SIZE:])),
+                                  (None, chosen1, chosen2))
+            matches.append(match)
+        elif match is None:
+            raise ValueError(f"Event before any match at byte {position - record.size} of {path}")
+        elif record_type == END_TURN:
+            match.events.append((END_TURN, None, fields[1]))
+        else:
+            match.events.append((record_type, fields[1], fields[2]))
+    return matches
+
+
+def replay(match, upto=None):
+    """
+    Rebuild a recorded match on a fresh GameEngine, applying its first `upto`
+    events (all of them by default), and return the engine
+    """
+    engine = GameEngine(match.grids[1], match.grids[2], match.chosen[1], match.chosen[2])
+    events = match.events if upto is None else match.events[:upto]
+    for event_type, value, _ in events:
+        if event_type == TOGGLE:
+            engine.toggle_position(value)
+        elif event_type == END_TURN:
+            engine.end_turn()
+        else:
+            engine.guess(value)
+    return engine
+
+
+def describe(match, names=None):
+    """Lines telling a recorded match move by move; names maps ids to Pokemon names"""
+    def name(pokemon_id):
+        return names[pokemon_id] if names and pokemon_id < len(names) else f"#{pokemon_id}"
+
+    started = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(match.started))
+    lines = [f"Match started {started}, seed {match.seed:016x}",
+             f"  Player 1 chose {name(match.chosen[1])}, Player 2 chose {name(match.chosen[2])}"]
+    engine = GameEngine(match.grids[1], match.grids[2], match.chosen[1], match.chosen[2])
+    for event_type, value, ms in match.events:
+        player = engine.current_player
+        if event_type == TOGGLE:
+            crossed_out = engine.toggle_position(value)
+            action = f"{'crosses out' if crossed_out else 'restores'} {name(engine.grids[engine.opponent][value])}"
+        elif event_type == END_TURN:
+            engine.end_turn()
+            action = "ends turn"
+        else:
+            engine.guess(value)
+            action = f"guesses {name(value)}"
+        lines.append(f"  {ms / 1000:8.1f}s  Player {player} {action}")
+    if engine.finished:
+        lines.append(f"  Player {engine.winner} wins ({engine.reason}) on turn {engine.turns}")
+    else:
+        lines.append(f"  Unfinished after {engine.turns} turns")
+    return lines
+
+
+def main(argv=None):
+    """Print the matches in one or more log files"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Show recorded Pokemon Guess Game matches")
+    parser.add_argument("logs", nargs='+', help=f"match log files ({LOG_EXTENSION})")
+    args = parser.parse_args(argv)
+
+    # Names come from the current roster; Tk itself is never started
+    from ..data import PokemonDataManager
+    names = PokemonDataManager().pokemon_list
+    checksum = roster_crc(names)
+    for path in args.logs:
+        for match in read_matches(path):
+            if match.roster_crc != checksum:
+                print(f"⚠️ {path} was recorded with a different roster; names may not match")
+            print("\n".join(describe(match, names)))
+
+
+if __name__ == "__main__":
+    main()
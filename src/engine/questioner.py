@@ -0,0 +1,163 @@
+"""
+Computer player that asks the most informative yes/no questions
+
+A question is a bitmask over roster ids: bit i is set when the answer is "yes"
+for Pokemon i. For one grid the masks are narrowed to its 24 positions, and
+the candidates still open are a 24-bit mask too, so scoring every question is
+one AND and one popcount each. The best question splits the candidates most
+evenly, which gains the most information when each is equally likely.
+"""
+import math
+import random
+import time
+
+from .game_engine import GRID_SIZE
+
+_ALL_POSITIONS = (1 << GRID_SIZE) - 1
+
+# Turns the ASCII digits of bin() output into 0/1 bytes
+_BIT_DIGITS = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def information_gain(yes, total):
+    """Bits learned from the answer to a question that is "yes" for `yes` of `total` candidates"""
+    if not 0 < yes < total:
+        return 0.0
+    p = yes / total
+    return -(p * math.log2(p) + (1 - p) * math.log2(1 - p))
+
+
+def best_question(candidates, question_masks, deadline=None):
+    """
+    Index of the question gaining the most information about the candidates
+    (both masks over grid positions), or None if none of them splits them.
+    Stops at `deadline` (a time.perf_counter() value) with the best so far.
+    """
+    total = candidates.bit_count()
+    best = None
+    best_gain = 0.0
+    for index, mask in enumerate(question_masks):
+        gain = information_gain((candidates & mask).bit_count(), total)
+        if gain > best_gain:
+            best, best_gain = index, gain
+        if deadline is not None and index & 63 == 63 and best is not None and time.perf_counter() > deadline:
+            break
+    return best
+
+
+def alphabetical_questions(pokemon_names):
+    """ "Does its name come before <letter>?" for B to Z, as text -> mask over roster ids"""
+    questions = {}
+    for letter in map(chr, range(ord('B'), ord('Z') + 1)):
+        mask = 0
+        for pokemon_id, name in enumerate(pokemon_names):
+            if name[:1].upper() < letter:
+                mask |= 1 << pokemon_id
+        questions[f"Does its name come before {letter} in the alphabet?"] = mask
+    return questions
+
+
+class QuestionBank:
+    """
+    The yes/no questions players can ask, as text -> mask over roster ids.
+    Each mask is also unpacked to one byte per id, so looking up an answer
+    doesn't shift a roster-sized integer.
+    """
+
+    def __init__(self, questions):
+        self.texts = list(questions)
+        self.masks = list(questions.values())
+        size = max((mask.bit_length() for mask in self.masks), default=0)
+        self.answers = [format(mask, 'b').zfill(size)[::-1].encode('ascii').translate(_BIT_DIGITS)
+                        for mask in self.masks]
+
+    def __len__(self):
+        return len(self.texts)
+
+    def answer(self, index, pokemon_id):
+        """True answer to a question about a Pokemon"""
+        answers = self.answers[index]
+        return pokemon_id < len(answers) and bool(answers[pokemon_id])
+
+    def grid_masks(self, grid):
+        """Every question as a mask over the positions of a grid"""
+        size = len(self.answers[0]) if self.answers else 0
+        positions = [(1 << position, pokemon_id) for position, pokemon_id in enumerate(grid) if pokemon_id < size]
+        masks = []
+        for answers in self.answers:
+            grid_mask = 0
+            for bit, pokemon_id in positions:
+                if answers[pokemon_id]:
+                    grid_mask |= bit
+            masks.append(grid_mask)
+        return masks
+
+
+class TurnPlan:
+    """What a computer player does this turn: ask, cross out the ruled-out positions, maybe guess"""
+
+    __slots__ = ('question', 'answer', 'cross_out', 'guess')
+
+    def __init__(self, question=None, answer=None, cross_out=(), guess=None):
+        self.question = question    # Question text, or None when going straight to a guess
+        self.answer = answer        # The opponent's true answer
+        self.cross_out = cross_out  # Opponent grid positions the answer rules out
+        self.guess = guess          # Pokemon id to guess after crossing out, or None to end the turn
+
+
+class QuestioningPlayer:
+    """
+    Computer player: asks the question with the most information gain, crosses
+    out what the answer rules out, and guesses once one candidate is left.
+    Thinking stops after `time_budget` seconds with the best question found.
+    Also usable as a simulator strategy (called with the engine and an RNG).
+    """
+
+    def __init__(self, bank, time_budget=0.05):
+        self.bank = bank
+        self.time_budget = time_budget
+        self._grid_masks = {}  # Opponent grid -> its question masks, for the matches in play
+
+    def masks_for(self, grid):
+        masks = self._grid_masks.get(grid)
+        if masks is None:
+            if len(self._grid_masks) >= 8:
+                self._grid_masks.clear()
+            masks = self._grid_masks[grid] = self.bank.grid_masks(grid)
+        return masks
+
+    def plan_turn(self, engine, rng=random):
+        """The current player's turn, without changing the engine"""
+        opponent = engine.opponent
+        grid = engine.grids[opponent]
+        candidates = _ALL_POSITIONS & ~engine.eliminated[engine.current_player]
+        if candidates.bit_count() == 1:
+            return TurnPlan(guess=grid[candidates.bit_length() - 1])
+
+        masks = self.masks_for(grid)
+        deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+        question = best_question(candidates, masks, deadline)
+        if question is None:
+            # Nothing tells the rest apart: guess one of them
+            open_positions = [i for i in range(GRID_SIZE) if candidates >> i & 1]
+            return TurnPlan(guess=grid[rng.choice(open_positions)])
+
+        answer = self.bank.answer(question, engine.chosen[opponent])
+        ruled_out = candidates & (~masks[question] if answer else masks[question])
+        left = candidates & ~ruled_out
+        return TurnPlan(
+            question=self.bank.texts[question],
+            answer=answer,
+            cross_out=[i for i in range(GRID_SIZE) if ruled_out >> i & 1],
+            guess=grid[left.bit_length() - 1] if left.bit_count() == 1 else None
+        )
+
+    def __call__(self, engine, rng):
+        """Play the current player's turn on the engine"""
+        plan = self.plan_turn(engine, rng)
+        for position in plan.cross_out:
+            engine.toggle_position(position)
+        if plan.guess is not None:
+            engine.guess(plan.guess)
+        else:
+            engine.end_turn()
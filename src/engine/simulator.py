@@ -0,0 +1,130 @@
+"""
+Batch match simulator for the Pokemon Guess Game
+
+Plays matches between strategies on the headless GameEngine, in chunks spread
+over a process pool. Each chunk returns only aggregate counts, so memory stays
+flat however many matches are played.
+"""
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .game_engine import GameEngine
+from .grid_sampler import GridSampler
+from .strategies import STRATEGIES
+
+DEFAULT_POOL_SIZE = 1025  # Roughly the number of base Pokemon, when no roster is given
+
+
+def resolve_strategy(strategy):
+    """A strategy function from its name, or the function itself"""
+    if callable(strategy):
+        return strategy
+    try:
+        return STRATEGIES[strategy]
+    except KeyError:
+        raise ValueError(f"Unknown strategy {strategy!r}, expected one of {', '.join(STRATEGIES)}") from None
+
+
+def play_match(sampler, strategy1, strategy2, rng):
+    """Deal a match from a GridSampler and play it to the end, returning the finished engine"""
+    chosen1, chosen2 = sampler.random_id(), sampler.random_id()
+    engine = GameEngine(sampler.deal(chosen1), sampler.deal(chosen2), chosen1, chosen2)
+    strategies = (None, strategy1, strategy2)
+    while not engine.finished:
+        strategies[engine.current_player](engine, rng)
+    return engine
+
+
+def empty_stats():
+    """Aggregate counts; turn_counts maps a match length in turns to how many matches had it"""
+    return {'games': 0, 'wins': [0, 0, 0], 'reasons': {}, 'turns': 0, 'max_turns': 0, 'turn_counts': {}}
+
+
+def turn_percentile(stats, fraction):
+    """Match length (in turns) that `fraction` of the matches played did not exceed"""
+    target = fraction * stats['games']
+    seen = 0
+    for turns in sorted(stats['turn_counts']):
+        seen += stats['turn_counts'][turns]
+        if seen >= target:
+            return turns
+    return 0
+
+
+def merge_stats(total, chunk):
+    """Add one chunk's counts into a running total"""
+    total['games'] += chunk['games']
+    total['wins'] = [a + b for a, b in zip(total['wins'], chunk['wins'])]
+    for reason, count in chunk['reasons'].items():
+        total['reasons'][reason] = total['reasons'].get(reason, 0) + count
+    total['turns'] += chunk['turns']
+    total['max_turns'] = max(total['max_turns'], chunk['max_turns'])
+    for turns, count in chunk['turn_counts'].items():
+        total['turn_counts'][turns] = total['turn_counts'].get(turns, 0) + count
+    return total
+
+
+def play_chunk(pool_ids, strategies, games, seed, grid_rules=None):
+    """Play `games` matches with one RNG and return their aggregate stats"""
+    rng = random.Random(seed)
+    sampler = GridSampler(pool_ids, rng=rng, **(grid_rules or {}))
+    strategy1, strategy2 = (resolve_strategy(strategy) for strategy in strategies)
+    stats = empty_stats()
+    wins = stats['wins']
+    reasons = stats['reasons']
+    turn_counts = stats['turn_counts']
+    for _ in range(games):
+        engine = play_match(sampler, strategy1, strategy2, rng)
+        wins[engine.winner] += 1
+        reasons[engine.reason] = reasons.get(engine.reason, 0) + 1
+        turn_counts[engine.turns] = turn_counts.get(engine.turns, 0) + 1
+        stats['turns'] += engine.turns
+        if engine.turns > stats['max_turns']:
+            stats['max_turns'] = engine.turns
+    stats['games'] = games
+    return stats
+
+
+def simulate(games, strategies=('random', 'random'), pool_ids=None, workers=None, seed=None,
+             chunk_size=20000, on_chunk=None, grid_rules=None):
+    """
+    Play `games` matches between two strategies (names from STRATEGIES or functions)
+    Grids are dealt from pool_ids by a GridSampler given `grid_rules` (its species,
+    variants, unique_species and max_variants arguments).
+    Chunks are seeded from `seed`, so a seeded run gives the same totals for any
+    number of workers. `on_chunk(stats)` sees the running totals as chunks finish.
+    Returns the totals plus 'seconds' and 'games_per_second'.
+    """
+    pool_ids = list(pool_ids) if pool_ids is not None else list(range(DEFAULT_POOL_SIZE))
+    for strategy in strategies:
+        resolve_strategy(strategy)  # Fail here rather than in a worker
+    GridSampler(pool_ids, **(grid_rules or {}))
+    if seed is None:
+        seed = random.randrange(2 ** 63)
+    workers = workers or os.cpu_count() or 1
+
+    chunks = [(index, min(chunk_size, games - start)) for index, start in enumerate(range(0, games, chunk_size))]
+    total = empty_stats()
+    start_time = time.perf_counter()
+
+    if workers == 1:
+        for index, count in chunks:
+            merge_stats(total, play_chunk(pool_ids, strategies, count, f"{seed}-{index}", grid_rules))
+            if on_chunk:
+                on_chunk(total)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(play_chunk, pool_ids, strategies, count, f"{seed}-{index}", grid_rules)
+                       for index, count in chunks]
+            for future in as_completed(futures):
+                merge_stats(total, future.result())
+                if on_chunk:
+                    on_chunk(total)
+
+    seconds = time.perf_counter() - start_time
+    total['seed'] = seed
+    total['seconds'] = seconds
+    total['games_per_second'] = total['games'] / seconds if seconds else 0.0
+    return total
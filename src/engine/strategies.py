@@ -0,0 +1,47 @@
+"""
+Scripted players for simulated matches
+
+A strategy plays one whole turn of a GameEngine: it crosses out tiles and then
+either ends the turn or guesses. Strategies are plain module-level functions,
+so they can be sent to worker processes by name or by reference.
+"""
+from .game_engine import GRID_SIZE
+
+
+def _open_positions(engine):
+    """Positions the current player hasn't crossed out on the opponent's grid"""
+    mask = engine.eliminated[engine.current_player]
+    return [i for i in range(GRID_SIZE) if not mask >> i & 1]
+
+
+def random_elimination(engine, rng):
+    """Cross out one tile at random each turn, guessing once a single tile is left"""
+    positions = _open_positions(engine)
+    if len(positions) == 1:
+        engine.guess(engine.grids[engine.opponent][positions[0]])
+        return
+    engine.toggle_position(rng.choice(positions))
+    engine.end_turn()
+
+
+def halving(engine, rng):
+    """
+    Cross out half of the wrong tiles each turn, as if every question were a
+    perfectly answered yes/no split, and guess once a single tile is left
+    """
+    opponent_grid = engine.grids[engine.opponent]
+    target = engine.chosen[engine.opponent]
+    positions = _open_positions(engine)
+    if len(positions) == 1:
+        engine.guess(opponent_grid[positions[0]])
+        return
+    wrong = [i for i in positions if opponent_grid[i] != target]
+    for position in rng.sample(wrong, max(1, len(positions) // 2)):
+        engine.toggle_position(position)
+    engine.end_turn()
+
+
+STRATEGIES = {
+    'random': random_elimination,
+    'halving': halving,
+}
@@ -1,24 +1,44 @@
 """
 Main Pokemon Guess Game class - Complete Version
 """
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
+import os
 import random
+import time
 
 from ..data import PokemonDataManager
-from ..utils import ImageLoader, adjust_window_for_platform, get_platform_info
-from ..screens import (
-    StartupScreen, GameSettingsScreen, PlayerSetupScreen, 
-    GameScreen, GameOverScreen, PokemonGridSetupScreen
-)
+from ..utils import ImageLoader, adjust_window_for_platform, get_platform_info, get_user_data_dir, metrics
+from ..screens import ScreenRegistry, registered_screen
+from ..engine import GameEngine, MatchRecorder, QuestioningPlayer, roster_crc, LOG_EXTENSION
+from ..widgets import TimingOverlay
+
+log = logging.getLogger(__name__)
 
 
 class PokemonGuessGame:
     """Main game controller class"""
     
+    # Screens are built by self.screens the first time they are needed
+    startup_screen = registered_screen('startup')
+    generation_screen = registered_screen('settings')
+    player_setup_screen = registered_screen('player_setup')
+    pokemon_grid_setup_screen = registered_screen('grid_setup')
+    game_screen = registered_screen('game')
+    game_over_screen = registered_screen('game_over')
+    
+    # Computer opponent pacing: a pause before it moves, and how long it may think
+    COMPUTER_NAME = "Computer"
+    COMPUTER_TURN_DELAY_MS = 800
+    COMPUTER_THINK_BUDGET = 0.05  # Seconds on the Tk thread
+    
+    METRICS_FILE = 'metrics.json'
+    
     def __init__(self):
-        # Initialize data and utilities
-        self.data_manager = PokemonDataManager()
+        # Initialize data and utilities - the catalog loads while the startup screen is drawn
+        self.data_manager = PokemonDataManager(load_in_background=True)
+        self.data_ready = False
         self.image_loader = ImageLoader()
         
         # Game state
@@ -26,9 +46,20 @@ class PokemonGuessGame:
         self.player2_name = ""
         self.player1_chosen = ""
         self.player2_chosen = ""
-        self.current_player = 1
         self.game_active = False
         
+        # Rules and state of the match in progress (turns, eliminations, result)
+        self.engine = None
+        
+        # Every match is logged to the user's data folder so it can be replayed
+        self.record_matches = True
+        self.match_seed = 0  # Seed the random grids were dealt with (0 for hand-picked grids)
+        self.match_recorder = None
+        
+        # Player 2 may be the computer (a QuestioningPlayer); questions are built on first use
+        self.computer_player = None
+        self.question_bank = None
+        
         # Generation selection
         self.selected_generations = set(['1', '2', '3', '4', '5', '6', '7', '8', '9'])  # All selected by default
         self.generation_vars = {}
@@ -41,16 +72,15 @@ class PokemonGuessGame:
         self.all_variants_var = None
         self.pokemon_selection_var = None
         
-        # Initialize selected_variants with all available variants
-        self._initialize_default_variants()
+        # Dealing rules for random grids: one Pokémon per base species, and a cap on variant forms (None = no cap)
+        self.unique_species = False
+        self.max_variants_per_grid = None
         
         # Grid data
         self.player1_grid = []
         self.player2_grid = []
         self.player1_buttons = []
         self.player2_buttons = []
-        self.player1_eliminated = set()
-        self.player2_eliminated = set()
         
         # Manual selection state
         self.manual_selection_grids = {}  # Store manually selected grids
@@ -66,17 +96,33 @@ class PokemonGuessGame:
         self.confirm_button = None
         self.end_turn_button = None
         self.guess_button = None
+        self.computer_status_label = None
         
-        # Initialize screens
-        self.startup_screen = None
-        self.generation_screen = None
-        self.player_setup_screen = None
-        self.pokemon_grid_setup_screen = None
-        self.game_screen = None
-        self.game_over_screen = None
+        self.screens = None
         
         self.init_ui()
     
+    @property
+    def current_player(self):
+        """Player whose turn it is (1 or 2)"""
+        return self.engine.current_player if self.engine else 1
+    
+    @property
+    def player1_eliminated(self):
+        """Names Player 1 has crossed out on Player 2's grid"""
+        return self._eliminated_names(1)
+    
+    @property
+    def player2_eliminated(self):
+        """Names Player 2 has crossed out on Player 1's grid"""
+        return self._eliminated_names(2)
+    
+    def _eliminated_names(self, player):
+        if not self.engine:
+            return set()
+        opponent_grid = self.player2_grid if player == 1 else self.player1_grid
+        return {name for name in opponent_grid if self.engine.is_eliminated(player, self.data_manager.get_pokemon_id(name))}
+    
     def init_ui(self):
         """Initialize the main UI window"""
         self.root = tk.Tk()
@@ -105,6 +151,10 @@ class PokemonGuessGame:
         self.root.bind('<Escape>', lambda e: self.root.destroy())
         self.root.bind('<F11>', self.toggle_fullscreen)
         
+        # F12 shows the hot-path timings (rolling p50/p99) over the window
+        self.timing_overlay = TimingOverlay(self.root)
+        self.root.bind('<F12>', self.timing_overlay.toggle)
+        
         # Add platform-specific key bindings
         platform_info = get_platform_info()
         if platform_info['is_macos']:
@@ -116,21 +166,33 @@ class PokemonGuessGame:
             self.root.bind('<Control-q>', lambda e: self.root.destroy())  # Ctrl+Q to quit
             self.root.bind('<Alt-F4>', lambda e: self.root.destroy())      # Alt+F4 to quit (Windows standard)
         
-        # Load X icon after root window is created
-        self.image_loader.load_x_icon()
+        # Screens (and their modules) are created on first use
+        self.screens = ScreenRegistry(self.root, self)
+        
+        self.show_startup_screen()
         
-        # Initialize all screens
-        self.startup_screen = StartupScreen(self.root, self)
-        self.generation_screen = GameSettingsScreen(self.root, self)
-        self.player_setup_screen = PlayerSetupScreen(self.root, self)
-        self.pokemon_grid_setup_screen = PokemonGridSetupScreen(self.root, self)
-        self.game_screen = GameScreen(self.root, self)
-        self.game_over_screen = GameOverScreen(self.root, self)
+        # Finish the data-dependent setup once the background catalog load is done
+        self.root.after(10, self._poll_data_loaded)
+    
+    def _poll_data_loaded(self):
+        """Check on the background catalog load from the Tk event loop"""
+        if self.data_manager.is_loaded():
+            self.ensure_data_ready()
+        else:
+            self.root.after(10, self._poll_data_loaded)
+    
+    def ensure_data_ready(self):
+        """Apply the default settings to the catalog, waiting for it to load if needed"""
+        if self.data_ready:
+            return
+        self.data_manager.wait_until_loaded()
+        
+        # Initialize selected_variants with all available variants
+        self._initialize_default_variants()
         
         # Initialize the filtered Pokemon list with default settings (all generations/variants)
         self.update_filtered_pokemon_list()
-        
-        self.show_startup_screen()
+        self.data_ready = True
     
     def show_startup_screen(self):
         """Display the initial startup screen"""
@@ -138,10 +200,12 @@ class PokemonGuessGame:
     
     def start_game(self):
         """Begin the game setup process - go directly to player setup"""
+        self.ensure_data_ready()
         self.setup_player(1)
     
     def show_settings(self):
         """Display the game settings screen"""
+        self.ensure_data_ready()
         self.generation_screen.show()
     
     def return_to_startup(self):
@@ -150,6 +214,7 @@ class PokemonGuessGame:
     
     def show_generation_selection(self):
         """Display the generation selection screen"""
+        self.ensure_data_ready()
         self.generation_screen.show()
     
     def setup_player(self, player_num):
@@ -196,7 +261,10 @@ class PokemonGuessGame:
         """Complete manual grid setup for a player and proceed to next step"""
         # Store the manually selected grid
         self.manual_selection_grids[player_num] = selected_grid
-        print(f"🎮 Player {player_num} completed manual grid setup with {len(selected_grid)} Pokemon")
+        log.debug(f"🎮 Player {player_num} completed manual grid setup with {len(selected_grid)} Pokemon")
+        
+        # Start decoding this grid's sprites while the next setup step runs
+        self.prefetch_grid_sprites(selected_grid)
         
         if player_num == 1:
             # Player 1 finished, move to Player 2 setup
@@ -205,6 +273,53 @@ class PokemonGuessGame:
             # Player 2 finished, start the main game
             self.start_main_game()
     
+    def add_computer_opponent(self):
+        """Make Player 2 the computer, with a random Pokémon, and start the game"""
+        if self.question_bank is None:
+            self.question_bank = self.data_manager.question_bank()
+        self.computer_player = QuestioningPlayer(self.question_bank, self.COMPUTER_THINK_BUDGET)
+        self.player2_name = self.COMPUTER_NAME
+        self.player2_chosen = random.choice(self.filtered_pokemon_list)
+        self.start_main_game()
+    
+    def is_computer_turn(self):
+        """Whether the computer is playing the current turn (humans can't move then)"""
+        return self.computer_player is not None and self.current_player == 2
+    
+    def play_computer_turn(self):
+        """Ask the best question, cross out what the answer rules out, then guess or pass"""
+        if not self.game_active or not self.is_computer_turn():
+            return
+        
+        plan = self.computer_player.plan_turn(self.engine)
+        if plan.question:
+            self.show_computer_status(f"🤖 {self.COMPUTER_NAME} asks: {plan.question} {'Yes' if plan.answer else 'No'}!")
+        
+        # The computer crosses out on Player 1's grid
+        for position in plan.cross_out:
+            eliminated = self.engine.toggle_position(position)
+            tile = self.game_screen.tile_for(1, self.player1_grid[position])
+            if tile:
+                self.game_screen.show_elimination(tile, eliminated)
+        self.update_remaining_count()
+        
+        if plan.guess is not None:
+            self.resolve_guess(self.data_manager.get_pokemon_name(plan.guess))
+        else:
+            self.pass_turn()
+    
+    def ask_computer(self, question):
+        """Answer a human's question about the computer's Pokémon"""
+        if not self.game_active or self.is_computer_turn() or question not in self.question_bank.texts:
+            return
+        chosen_id = self.data_manager.get_pokemon_id(self.player2_chosen)
+        answer = self.question_bank.answer(self.question_bank.texts.index(question), chosen_id)
+        self.show_computer_status(f"🤖 {question} {'Yes' if answer else 'No'}!")
+    
+    def show_computer_status(self, text):
+        if self.computer_status_label:
+            self.computer_status_label.configure(text=text)
+    
     def start_main_game(self):
         """Start the main game with manually selected grids or generate random grids"""
         selection_method = self.pokemon_selection_var.get() if self.pokemon_selection_var else "randomize"
@@ -213,18 +328,14 @@ class PokemonGuessGame:
             # Use manually selected grids
             self.player1_grid = self.manual_selection_grids.get(1, [])
             self.player2_grid = self.manual_selection_grids.get(2, [])
-            print(f"🎮 Using manual grids - P1: {len(self.player1_grid)} Pokemon, P2: {len(self.player2_grid)} Pokemon")
+            log.debug(f"🎮 Using manual grids - P1: {len(self.player1_grid)} Pokemon, P2: {len(self.player2_grid)} Pokemon")
         else:
             # Generate random grids as before
             self.generate_grids()
         
-        # Reset game state
-        self.player1_eliminated = set()
-        self.player2_eliminated = set()
-        self.current_player = 1
         self.game_active = True
         
-        # Create and show the game screen
+        # Create and show the game screen (which starts the match on the engine)
         self.create_game_screen()
     
     def create_game_screen(self):
@@ -233,90 +344,102 @@ class PokemonGuessGame:
     
     def generate_grids(self):
         """Generate the Pokemon grids for both players (only if not already set by manual selection)"""
-        print(f"Generating grids. Player 1 chose: {self.player1_chosen}, Player 2 chose: {self.player2_chosen}")
+        log.debug(f"Generating grids. Player 1 chose: {self.player1_chosen}, Player 2 chose: {self.player2_chosen}")
+        
+        # One seeded sampler deals both grids from the filtered list's ids, so the seed reproduces them
+        self.match_seed = random.randrange(1, 2 ** 63)
+        sampler = self.data_manager.grid_sampler(
+            self.filtered_pokemon_list, self.unique_species, self.max_variants_per_grid, self.match_seed
+        )
         
         # Only generate grids if they haven't been manually set
         if not self.player1_grid:
-            # Create Player 1's grid - select 24 random Pokémon from the filtered list
-            available_pokemon = self.filtered_pokemon_list.copy()
-            
-            # Ensure Player 1's chosen Pokemon is included
-            if self.player1_chosen in available_pokemon:
-                available_pokemon.remove(self.player1_chosen)
-            
-            # Select 23 random Pokemon and add the chosen one
-            self.player1_grid = random.sample(available_pokemon, 23)
-            self.player1_grid.append(self.player1_chosen)
-            random.shuffle(self.player1_grid)
+            # 24 random Pokémon from the filtered list, including Player 1's chosen one
+            chosen_id = self.data_manager.get_pokemon_id(self.player1_chosen)
+            self.player1_grid = self.pokemon_names(sampler.deal(chosen_id))
         
         if not self.player2_grid:
-            # Create Player 2's grid - select 24 random Pokémon from the filtered list
-            available_pokemon = self.filtered_pokemon_list.copy()
-            
-            # Ensure Player 2's chosen Pokemon is included
-            if self.player2_chosen in available_pokemon:
-                available_pokemon.remove(self.player2_chosen)
-            
-            # Select 23 random Pokemon and add the chosen one
-            self.player2_grid = random.sample(available_pokemon, 23)
-            self.player2_grid.append(self.player2_chosen)
-            random.shuffle(self.player2_grid)
+            # 24 random Pokémon from the filtered list, including Player 2's chosen one
+            chosen_id = self.data_manager.get_pokemon_id(self.player2_chosen)
+            self.player2_grid = self.pokemon_names(sampler.deal(chosen_id))
+        
+        log.debug(f"Player 1 grid: {self.player1_grid[:6]}...")  # Show first 6
+        log.debug(f"Player 2 grid: {self.player2_grid[:6]}...")  # Show first 6
         
-        print(f"Player 1 grid: {self.player1_grid[:6]}...")  # Show first 6
-        print(f"Player 2 grid: {self.player2_grid[:6]}...")  # Show first 6
+        # Decode sprites in the background while the game screen is built
+        self.prefetch_grid_sprites(self.player1_grid, self.player2_grid)
+    
+    def pokemon_ids(self, pokemon_names):
+        """Game engine ids for a list of names"""
+        return [self.data_manager.get_pokemon_id(name) for name in pokemon_names]
+    
+    def pokemon_names(self, pokemon_ids):
+        """Names for a list of game engine ids"""
+        return [self.data_manager.get_pokemon_name(pokemon_id) for pokemon_id in pokemon_ids]
+    
+    def start_match(self):
+        """Start a fresh engine on the dealt grids; the UI reads turns and eliminations from it"""
+        # Keep this game's sprites cached while autocomplete browsing churns the rest
+        # (random or hand-picked grids alike; this replaces the last game's pins)
+        self.image_loader.pin_grid_sprites(self.player1_grid + self.player2_grid)
+        
+        self.engine = GameEngine(
+            self.pokemon_ids(self.player1_grid),
+            self.pokemon_ids(self.player2_grid),
+            self.data_manager.get_pokemon_id(self.player1_chosen),
+            self.data_manager.get_pokemon_id(self.player2_chosen)
+        )
+        if self.record_matches:
+            self.record_match()
+    
+    def record_match(self):
+        """Log the new match to its own file under the user's data folder"""
+        self.close_match_log()
+        try:
+            log_dir = get_user_data_dir('matches')
+            os.makedirs(log_dir, exist_ok=True)
+            filename = f"{time.strftime('%Y%m%d-%H%M%S')}-{self.match_seed:016x}{LOG_EXTENSION}"
+            self.match_recorder = MatchRecorder(os.path.join(log_dir, filename))
+            self.match_recorder.start(self.engine, self.match_seed, roster_crc(self.data_manager.pokemon_list))
+        except OSError as e:
+            log.warning(f"⚠️ Could not record match: {e}")
+            self.match_recorder = None
+    
+    def close_match_log(self):
+        """Write out and close the current match log, if any"""
+        if self.match_recorder:
+            self.match_recorder.close()
+            self.match_recorder = None
+    
+    def prefetch_grid_sprites(self, *grids):
+        """Start decoding the sprites of the given grids on worker threads"""
+        pokemon_sprites = [
+            (pokemon_name, self.data_manager.get_pokemon_sprite_url(pokemon_name))
+            for grid in grids
+            for pokemon_name in grid
+        ]
+        self.image_loader.prefetcher.prefetch(self.root, pokemon_sprites)
     
     def toggle_pokemon(self, pokemon, target_player_grid):
         """Toggle elimination of a Pokemon from the current player's perspective"""
-        if not self.game_active:
+        if not self.game_active or self.is_computer_turn():
             return
         
-        # The current player is clicking on their opponent's grid
-        # We need to update the elimination status from the current player's perspective
-        # But update the visual on the target grid
+        # The current player is clicking on their opponent's grid; the engine
+        # records the elimination from the current player's perspective
+        eliminated = self.engine.toggle(self.data_manager.get_pokemon_id(pokemon))
         
-        if self.current_player == 1:
-            # Player 1 is clicking, so update player 1's eliminated set
-            eliminated_set = self.player1_eliminated
-        else:
-            # Player 2 is clicking, so update player 2's eliminated set
-            eliminated_set = self.player2_eliminated
-        
-        # Get the buttons for the target grid (the one being clicked)
-        if target_player_grid == 1:
-            buttons = self.player1_buttons
-        else:
-            buttons = self.player2_buttons
-        
-        # Toggle elimination status
-        if pokemon in eliminated_set:
-            eliminated_set.remove(pokemon)
-        else:
-            eliminated_set.add(pokemon)
-        
-        # Update the visual representation on the target grid
-        for row in buttons:
-            for tile in row:
-                if tile and hasattr(tile, 'pokemon_name') and tile.pokemon_name == pokemon:
-                    if pokemon in eliminated_set:
-                        # Show X overlay on the image label
-                        if self.image_loader.x_icon:
-                            tile.image_label.configure(image=self.image_loader.x_icon)
-                            tile.image_label.image = self.image_loader.x_icon
-                    else:
-                        # Restore original image on the image label
-                        sprite_url = self.data_manager.get_pokemon_sprite_url(pokemon)
-                        if sprite_url:
-                            image = self.image_loader.load_pokemon_image(pokemon, sprite_url)
-                            if image:
-                                tile.image_label.configure(image=image)
-                                tile.image_label.image = image
+        # Redraw just the clicked tile on the target grid
+        tile = self.game_screen.tile_for(target_player_grid, pokemon)
+        if tile:
+            self.game_screen.show_elimination(tile, eliminated)
         
         self.update_remaining_count()
     
     def update_remaining_count(self):
         """Update the remaining Pokemon count"""
-        remaining1 = 24 - len(self.player1_eliminated)
-        remaining2 = 24 - len(self.player2_eliminated)
+        remaining1 = self.engine.remaining(1) if self.engine else 24
+        remaining2 = self.engine.remaining(2) if self.engine else 24
         
         if self.player1_remaining_label:
             self.player1_remaining_label.configure(text=f"Remaining: {remaining1}")
@@ -333,42 +456,44 @@ class PokemonGuessGame:
                 self.player1_name_label.configure(bg='#E3F2FD', fg='#333')
                 self.player2_name_label.configure(bg='#4CAF50', fg='white')
         
+        # Humans wait while the computer plays its turn
+        button_state = 'disabled' if self.is_computer_turn() else 'normal'
+        for button in (self.end_turn_button, self.guess_button):
+            if button:
+                button.configure(state=button_state)
+        
         # Update grid clickability based on current turn
-        if self.game_screen and hasattr(self.game_screen, 'update_grid_clickability'):
+        if self.screens.is_created('game') and hasattr(self.game_screen, 'update_grid_clickability'):
             self.game_screen.update_grid_clickability()
     
     def end_turn(self):
         """End current player's turn"""
-        if not self.game_active:
+        if not self.game_active or self.is_computer_turn():
             return
-        
-        # Check if current player eliminated opponent's chosen Pokemon
-        opponent_chosen = self.player2_chosen if self.current_player == 1 else self.player1_chosen
-        current_player_eliminated = self.player1_eliminated if self.current_player == 1 else self.player2_eliminated
-        
-        if opponent_chosen in current_player_eliminated:
-            # Current player loses
-            current_player_name = self.player1_name if self.current_player == 1 else self.player2_name
+        self.pass_turn()
+    
+    def pass_turn(self):
+        """Hand the turn to the other player, unless passing loses the game"""
+        # Passing the turn with the opponent's chosen Pokemon crossed out loses the game
+        current_player_name = self.player1_name if self.current_player == 1 else self.player2_name
+        if not self.engine.end_turn():
             self.end_game(f"{current_player_name} Loses!", f"{current_player_name} accidentally eliminated their target!")
             return
         
-        # Switch turns
-        self.current_player = 2 if self.current_player == 1 else 1
+        # Show the switched turn
         self.update_turn_indicator()
+        if self.is_computer_turn():
+            self.root.after(self.COMPUTER_TURN_DELAY_MS, self.play_computer_turn)
     
     def make_guess(self):
         """Allow current player to make a guess"""
-        if not self.game_active:
+        if not self.game_active or self.is_computer_turn():
             return
         
         current_player_name = self.player1_name if self.current_player == 1 else self.player2_name
-        opponent_chosen = self.player2_chosen if self.current_player == 1 else self.player1_chosen
         
-        # Get available Pokemon from opponent's grid (non-eliminated from current player's perspective)
-        opponent_grid = self.player2_grid if self.current_player == 1 else self.player1_grid
-        # Use current player's eliminated set - this represents what THEY have crossed out
-        current_player_eliminated = self.player1_eliminated if self.current_player == 1 else self.player2_eliminated
-        available_pokemon = [p for p in opponent_grid if p not in current_player_eliminated]
+        # Get available Pokemon from opponent's grid (the ones the current player hasn't crossed out)
+        available_pokemon = self.pokemon_names(self.engine.candidates(self.current_player))
         
         if not available_pokemon:
             messagebox.showwarning("No Pokemon Available", "All Pokemon have been eliminated!")
@@ -426,11 +551,7 @@ class PokemonGuessGame:
                 return
             
             dialog.destroy()
-            
-            if guess == opponent_chosen:
-                self.end_game(f"{current_player_name} Wins!", f"{current_player_name} correctly guessed {opponent_chosen}!")
-            else:
-                self.end_game(f"{current_player_name} Loses!", f"{current_player_name} guessed {guess}, but it was {opponent_chosen}!")
+            self.resolve_guess(guess)
         
         tk.Button(
             dialog,
@@ -447,10 +568,20 @@ class PokemonGuessGame:
             cursor='hand2'
         ).pack(pady=20)
     
+    def resolve_guess(self, guess):
+        """The current player guesses the opponent's Pokémon, which ends the game"""
+        current_player_name = self.player1_name if self.current_player == 1 else self.player2_name
+        opponent_chosen = self.player2_chosen if self.current_player == 1 else self.player1_chosen
+        
+        if self.engine.guess(self.data_manager.get_pokemon_id(guess)):
+            self.end_game(f"{current_player_name} Wins!", f"{current_player_name} correctly guessed {opponent_chosen}!")
+        else:
+            self.end_game(f"{current_player_name} Loses!", f"{current_player_name} guessed {guess}, but it was {opponent_chosen}!")
+    
     def end_game(self, result, message):
         """End the game and show results"""
         self.game_active = False
-        self.game_over_screen = GameOverScreen(self.root, self)
+        self.close_match_log()
         self.game_over_screen.show(result, message)
     
     def new_game(self):
@@ -460,14 +591,15 @@ class PokemonGuessGame:
         self.player2_name = ""
         self.player1_chosen = ""
         self.player2_chosen = ""
-        self.current_player = 1
         self.game_active = False
+        self.close_match_log()
+        self.engine = None
+        self.match_seed = 0
+        self.computer_player = None
         self.player1_grid = []
         self.player2_grid = []
         self.player1_buttons = []
         self.player2_buttons = []
-        self.player1_eliminated = set()
-        self.player2_eliminated = set()
         
         # Reset manual selection state
         self.manual_selection_grids = {}
@@ -485,7 +617,7 @@ class PokemonGuessGame:
         
         # Update filtered Pokémon list
         self.update_filtered_pokemon_list()
-        print(f"📊 Selected generations: {len(self.selected_generations)} generations")
+        log.debug(f"📊 Selected generations: {len(self.selected_generations)} generations")
     
     def on_all_regions_changed(self):
         """Handle All Regions checkbox change"""
@@ -535,7 +667,7 @@ class PokemonGuessGame:
         
         # Update filtered Pokémon list based on both generations and variants
         self.update_filtered_pokemon_list()
-        print(f"🔮 Selected variants: {len(self.selected_variants)} variant types")
+        log.debug(f"🔮 Selected variants: {len(self.selected_variants)} variant types")
     
     def on_all_variants_changed(self):
         """Handle All Variants checkbox change"""
@@ -565,7 +697,7 @@ class PokemonGuessGame:
     def on_pokemon_selection_changed(self, event=None):
         """Handle Pokemon selection method change"""
         selection_method = self.pokemon_selection_var.get() if self.pokemon_selection_var else "randomize"
-        print(f"🎯 Pokemon selection method changed to: {selection_method}")
+        log.debug(f"🎯 Pokemon selection method changed to: {selection_method}")
         
         # Update confirm button state for both manual and randomize
         self.update_confirm_button_state()
@@ -577,7 +709,7 @@ class PokemonGuessGame:
             self.selected_generations, 
             self.selected_variants
         )
-        print(f"📊 Filtered to {len(self.filtered_pokemon_list)} Pokémon")
+        log.debug(f"📊 Filtered to {len(self.filtered_pokemon_list)} Pokémon")
     
     def toggle_fullscreen(self, event=None):
         """Toggle fullscreen mode with cross-platform compatibility"""
@@ -630,30 +762,46 @@ class PokemonGuessGame:
                 except:
                     pass  # Ignore if this fails
             
-            print("🖥️  Starting main event loop...")
+            log.debug("🖥️  Starting main event loop...")
             self.root.mainloop()
-            print("🖥️  Main event loop ended")
+            log.debug("🖥️  Main event loop ended")
+            self.close_match_log()
+            self.image_loader.prefetcher.shutdown()
+            self.image_loader.disk_cache.save()
+            self.save_metrics()
+            
+            stats = self.image_loader.image_cache.stats()
+            log.info(f"🖼️  Sprite cache: {stats['entries']} images, {stats['bytes'] // 1024} KB, "
+                     f"{stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions")
+
+            navigation = self.screens.stats()
+            log.info(f"🧭 Navigation: {navigation['navigations']} screen switches, {navigation['avg_ms']:.1f} ms avg, "
+                     f"{navigation['max_ms']:.1f} ms max")
         except Exception as e:
-            print(f"❌ Error in main loop: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception(f"❌ Error in main loop: {e}")
+    
+    def save_metrics(self, path=None):
+        """Write this session's timings and counters to JSON (metrics.json in the user's data folder)"""
+        try:
+            if path is None:
+                os.makedirs(get_user_data_dir(), exist_ok=True)
+                path = os.path.join(get_user_data_dir(), self.METRICS_FILE)
+            snapshot = metrics.dump_json(path)
+            log.info(f"⏱️  Saved {len(snapshot['timers'])} timings to {path}")
+        except OSError as e:
+            log.warning(f"⚠️ Could not save timings: {e}")
 
     def _initialize_default_variants(self):
         """Initialize selected_variants with all available variants by default"""
         try:
             # Get all unique variants from the Pokemon data
-            all_variants = set()
-            for pokemon_name, pokemon_info in self.data_manager.pokemon_data.items():
-                if isinstance(pokemon_info, dict):
-                    variant = pokemon_info.get('variant')
-                    if variant:
-                        all_variants.add(variant)
+            all_variants = self.data_manager.get_all_variants()
             
             # Add all variants to selected_variants (default behavior: all variants enabled)
             self.selected_variants = all_variants.copy()
-            print(f"🔮 Initialized with {len(self.selected_variants)} default variants")
+            log.debug(f"🔮 Initialized with {len(self.selected_variants)} default variants")
             
         except Exception as e:
-            print(f"⚠️ Error initializing default variants: {e}")
+            log.warning(f"⚠️ Error initializing default variants: {e}")
             # Fallback: empty set (no variants selected)
             self.selected_variants = set()
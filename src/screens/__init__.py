@@ -1,21 +1,40 @@
 """
 Screens package for Pokemon Guess Game
+Screen modules are imported on first access so startup only pays for the screens it shows
 """
 
+from importlib import import_module
+
 from .base_screen import BaseScreen
-from .startup_screen import StartupScreen
-from .game_settings_screen import GameSettingsScreen
-from .player_setup_screen import PlayerSetupScreen
-from .pokemon_grid_setup_screen import PokemonGridSetupScreen
-from .game_screen import GameScreen
-from .game_over_screen import GameOverScreen
+from .screen_registry import ScreenRegistry, registered_screen
+
+_LAZY_SCREENS = {
+    'StartupScreen': 'startup_screen',
+    'GameSettingsScreen': 'game_settings_screen',
+    'PlayerSetupScreen': 'player_setup_screen',
+    'PokemonGridSetupScreen': 'pokemon_grid_setup_screen',
+    'GameScreen': 'game_screen',
+    'GameOverScreen': 'game_over_screen',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_SCREENS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    screen_class = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = screen_class
+    return screen_class
+
 
 __all__ = [
-    'BaseScreen', 
-    'StartupScreen', 
-    'GameSettingsScreen', 
-    'PlayerSetupScreen', 
+    'BaseScreen',
+    'ScreenRegistry',
+    'registered_screen',
+    'StartupScreen',
+    'GameSettingsScreen',
+    'PlayerSetupScreen',
     'PokemonGridSetupScreen',
-    'GameScreen', 
+    'GameScreen',
     'GameOverScreen'
 ]
@@ -5,21 +5,47 @@ import tkinter as tk
 
 
 class BaseScreen:
-    """Base class for all game screens"""
-    
+    """
+    Base class for all game screens
+    Screens are retained: build() creates the widget tree once inside self.container,
+    then each show() swaps the container in and on_show() refreshes it for the current game
+    """
+
+    # How the container is packed into the window while the screen is showing
+    container_options = {'expand': True, 'fill': 'both'}
+
     def __init__(self, root, game_instance):
         self.root = root
         self.game = game_instance
         self.container = None
-    
-    def clear_screen(self):
-        """Clear all widgets from the screen"""
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        
-        # Unbind Enter key
+
+    def build(self):
+        """Create the screen's widgets inside self.container (to be implemented by subclasses)"""
+        raise NotImplementedError("Subclasses must implement build() method")
+
+    def on_show(self, *args):
+        """Refresh the retained widgets for the state the screen is shown with"""
+
+    def on_hide(self):
+        """Called before the screen is taken off the window"""
+
+    def show(self, *args):
+        """Show this screen, building it on first use"""
+        self.game.screens.activate(self, *args)
+
+    def create(self):
+        """Build the widget tree into a fresh container"""
+        self.container = tk.Frame(self.root, bg='#3d7dca')
+        self.build()
+
+    def hide(self):
+        """Take the screen off the window, keeping its widgets for the next show()"""
+        self.on_hide()
         self.root.unbind('<Return>')
-    
-    def show(self):
-        """Show this screen (to be implemented by subclasses)"""
-        raise NotImplementedError("Subclasses must implement show() method")
+        self.container.pack_forget()
+
+    def destroy(self):
+        """Throw the widget tree away; the next show() rebuilds it"""
+        if self.container is not None:
+            self.container.destroy()
+            self.container = None
@@ -9,15 +9,8 @@ from ..utils import get_large_display_font, get_subtitle_font, adjust_window_for
 class GameOverScreen(BaseScreen):
     """End game results screen"""
     
-    def show(self, result, message):
-        """End the game and show results"""
-        self.game.game_active = False
-        self.clear_screen()
-        
-        # Main container
-        self.container = tk.Frame(self.root, bg='#3d7dca')
-        self.container.pack(expand=True, fill='both')
-        
+    def build(self):
+        """Build the results layout; on_show fills in the outcome"""
         # Game Over Logo
         logo_image = self.game.image_loader.load_logo_image('game-over-logo.png', max_width=500, max_height=120)
         if logo_image:
@@ -30,24 +23,21 @@ class GameOverScreen(BaseScreen):
             logo_label.pack(pady=(50, 20))
         
         # Result
-        result_label = tk.Label(
+        self.result_label = tk.Label(
             self.container,
-            text=result,
             font=get_large_display_font(),
-            fg='#4CAF50' if 'Wins' in result else '#F44336',
             bg='#3d7dca'
         )
-        result_label.pack(pady=(20, 20))
+        self.result_label.pack(pady=(20, 20))
         
         # Message
-        message_label = tk.Label(
+        self.message_label = tk.Label(
             self.container,
-            text=message,
             font=get_subtitle_font(),
             fg='#222222',
             bg='#3d7dca'
         )
-        message_label.pack(pady=20)
+        self.message_label.pack(pady=20)
         
         # New game button
         new_game_button = tk.Button(
@@ -67,3 +57,9 @@ class GameOverScreen(BaseScreen):
             cursor='hand2'
         )
         new_game_button.pack(pady=40)
+    
+    def on_show(self, result, message):
+        """End the game and show results"""
+        self.game.game_active = False
+        self.result_label.configure(text=result, fg='#4CAF50' if 'Wins' in result else '#F44336')
+        self.message_label.configure(text=message)
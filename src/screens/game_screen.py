@@ -1,26 +1,30 @@
 """
 Main game screen for Pokemon Guess Game
 """
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
 from .base_screen import BaseScreen
+from ..utils import timed
+
+log = logging.getLogger(__name__)
 
 
 class GameScreen(BaseScreen):
     """Main game interface screen"""
     
-    def show(self):
-        """Create the main game interface"""
-        self.clear_screen()
-        self.game.game_active = True
-        
-        # Generate grids only if they don't already exist (for manual selection)
-        if not self.game.player1_grid or not self.game.player2_grid:
-            self.game.generate_grids()
-        
-        # Main container
-        self.game.main_frame = tk.Frame(self.root, bg='#3d7dca')
-        self.game.main_frame.pack(expand=True, fill='both', padx=10, pady=10)
+    # Main container
+    container_options = {'expand': True, 'fill': 'both', 'padx': 10, 'pady': 10}
+    
+    def __init__(self, root, game_instance):
+        super().__init__(root, game_instance)
+        self.tiles = {1: [], 2: []}  # Retained tile frames per player, row by row
+        self.tile_index = {1: {}, 2: {}}  # Pokemon name -> tile, per player, rebuilt by fill_grid
+        self.grid_frames = {}  # Per-player frame whose cursor shows whether its grid is clickable
+    
+    def build(self):
+        """Create the main game interface; on_show deals each new game into it"""
+        self.game.main_frame = self.container
         
         # Logo
         logo_image = self.game.image_loader.load_logo_image('whos-your-pokemon-logo.png', max_width=400, max_height=80)
@@ -55,7 +59,6 @@ class GameScreen(BaseScreen):
         # Remove "(Player 1)" suffix and increase font size by 25% (14 -> 17.5, rounded to 18)
         self.game.player1_name_label = tk.Label(
             player1_frame,
-            text=f"{self.game.player1_name}",
             font=('Arial', 18, 'bold'),
             bg='lightgreen',
             relief='solid',
@@ -80,7 +83,7 @@ class GameScreen(BaseScreen):
         p1_grid_frame = tk.Frame(p1_grid_container, bg='#3d7dca')
         p1_grid_frame.pack(expand=True, fill='both', padx=3, pady=3)
         
-        print("About to create Player 1 grid...")
+        self.grid_frames[1] = p1_grid_frame
         self.create_grid(p1_grid_frame, 1)
         
         # Player 2 side (RIGHT) - width for 96x96 images
@@ -91,7 +94,6 @@ class GameScreen(BaseScreen):
         # Remove "(Player 2)" suffix and increase font size by 25% (14 -> 17.5, rounded to 18)
         self.game.player2_name_label = tk.Label(
             player2_frame,
-            text=f"{self.game.player2_name}",
             font=('Arial', 18, 'bold'),
             bg='#E3F2FD',
             relief='solid',
@@ -116,7 +118,7 @@ class GameScreen(BaseScreen):
         p2_grid_frame = tk.Frame(p2_grid_container, bg='#3d7dca')
         p2_grid_frame.pack(expand=True, fill='both', padx=3, pady=3)
         
-        print("About to create Player 2 grid...")
+        self.grid_frames[2] = p2_grid_frame
         self.create_grid(p2_grid_frame, 2)
         
         # Control buttons at the bottom
@@ -157,83 +159,125 @@ class GameScreen(BaseScreen):
         )
         self.game.guess_button.pack(side='left', padx=10)
         
-        # Set initial turn
-        self.game.update_turn_indicator()
-        print("Game screen layout complete. Updating turn indicator...")
+        # Questions for the computer opponent and its answers (packed by on_show)
+        self.computer_frame = tk.Frame(self.game.main_frame, bg='#3d7dca')
+        
+        self.question_var = tk.StringVar()
+        self.question_dropdown = ttk.Combobox(
+            self.computer_frame,
+            textvariable=self.question_var,
+            state="readonly",
+            font=('Arial', 11),
+            width=45
+        )
+        self.question_dropdown.pack(side='left', padx=5)
+        
+        tk.Button(
+            self.computer_frame,
+            text="Ask",
+            font=('Arial', 11, 'bold'),
+            bg='#ffcb05',
+            fg='#222222',
+            relief='solid',
+            borderwidth=2,
+            padx=10,
+            command=lambda: self.game.ask_computer(self.question_var.get()),
+            cursor='hand2'
+        ).pack(side='left', padx=5)
         
-        # Update grid clickability for initial turn
-        self.update_grid_clickability()
-        print("Game screen creation finished!")
+        self.game.computer_status_label = tk.Label(
+            self.computer_frame,
+            font=('Arial', 12, 'bold'),
+            fg='#222222',
+            bg='#3d7dca'
+        )
+        self.game.computer_status_label.pack(side='left', padx=10)
     
-    def create_grid(self, parent, player):
-        """Create a 6x4 grid of Pokemon tiles with images and names"""
-        grid_data = self.game.player1_grid if player == 1 else self.game.player2_grid
-        button_list = []
+    def on_show(self):
+        """Deal the current game's grids into the retained tiles"""
+        self.game.game_active = True
+        
+        # Generate grids only if they don't already exist (for manual selection)
+        if not self.game.player1_grid or not self.game.player2_grid:
+            self.game.generate_grids()
+        self.game.start_match()
+        
+        self.game.player1_name_label.configure(text=f"{self.game.player1_name}")
+        self.game.player2_name_label.configure(text=f"{self.game.player2_name}")
+        
+        self.fill_grid(1)
+        self.fill_grid(2)
+        self.game.update_remaining_count()
+        
+        # Questions for the computer, if Player 2 is the computer
+        if self.game.computer_player:
+            self.question_dropdown.configure(values=self.game.question_bank.texts)
+            self.question_var.set("")
+            self.game.show_computer_status("")
+            self.computer_frame.pack(pady=(0, 10))
+        else:
+            self.computer_frame.pack_forget()
         
-        # Debug print to ensure this method is called
-        print(f"Creating grid for player {player} with {len(grid_data)} Pokemon")
+        # Set initial turn (this also updates grid clickability)
+        self.game.update_turn_indicator()
+        log.debug("Game screen ready!")
+    
+    @timed('create_grid')
+    def create_grid(self, parent, player):
+        """
+        Create the retained 6x4 grid of tiles for a player; fill_grid gives them Pokemon
+        Clicks are bound once here and checked against the turn in on_tile_click
+        """
+        tile_rows = []
         
         for row in range(4):
-            button_row = []
+            tile_row = []
             for col in range(6):
-                pokemon_index = row * 6 + col
-                if pokemon_index < len(grid_data):
-                    pokemon_name = grid_data[pokemon_index]
-                    
-                    # Create a frame to hold the tile content
-                    tile_frame = tk.Frame(
-                        parent,
-                        bg='#cccccc',
-                        relief='solid',
-                        borderwidth=2,
-                        width=100,
-                        height=120,
-                        cursor='hand2'
-                    )
-                    tile_frame.grid(row=row, column=col, padx=2, pady=2, sticky='nsew')
-                    tile_frame.grid_propagate(False)
-                    
-                    # Create image label
-                    image_label = tk.Label(
-                        tile_frame,
-                        bg='#cccccc',
-                        borderwidth=0,
-                        highlightthickness=0
-                    )
-                    image_label.pack(side='top', pady=(2, 0))
-                    
-                    # Create name label
-                    name_label = tk.Label(
-                        tile_frame,
-                        text=pokemon_name,
-                        font=('Arial', 8, 'normal'),
-                        fg='black',
-                        bg='#cccccc',
-                        borderwidth=0,
-                        highlightthickness=0
-                    )
-                    name_label.pack(side='bottom', pady=(0, 2))
-                    
-                    # Load and set Pokemon image
-                    sprite_url = self.game.data_manager.get_pokemon_sprite_url(pokemon_name)
-                    if sprite_url:
-                        image = self.game.image_loader.load_pokemon_image(pokemon_name, sprite_url)
-                        if image:
-                            image_label.configure(image=image)
-                            image_label.image = image
-                    
-                    # Store references for later use
-                    tile_frame.pokemon_name = pokemon_name
-                    tile_frame.image_label = image_label
-                    tile_frame.name_label = name_label
-                    tile_frame.player = player
-                    button_row.append(tile_frame)
-                    
-                    print(f"Created tile for {pokemon_name} at ({row}, {col})")
-                else:
-                    button_row.append(None)
+                # Create a frame to hold the tile content (its cursor comes from the grid frame)
+                tile_frame = tk.Frame(
+                    parent,
+                    bg='#cccccc',
+                    relief='solid',
+                    borderwidth=2,
+                    width=100,
+                    height=120
+                )
+                tile_frame.grid(row=row, column=col, padx=2, pady=2, sticky='nsew')
+                tile_frame.grid_propagate(False)
+                
+                # Create image label
+                image_label = tk.Label(
+                    tile_frame,
+                    bg='#cccccc',
+                    borderwidth=0,
+                    highlightthickness=0
+                )
+                image_label.pack(side='top', pady=(2, 0))
+                
+                # Create name label
+                name_label = tk.Label(
+                    tile_frame,
+                    font=('Arial', 8, 'normal'),
+                    fg='black',
+                    bg='#cccccc',
+                    borderwidth=0,
+                    highlightthickness=0
+                )
+                name_label.pack(side='bottom', pady=(0, 2))
+                
+                # Store references for later use
+                tile_frame.pokemon_name = None
+                tile_frame.image_label = image_label
+                tile_frame.name_label = name_label
+                tile_frame.player = player
+                tile_frame.sprite_image = None  # The tile's own sprite, to restore after the X overlay
+                
+                click_cmd = lambda e, tile=tile_frame: self.on_tile_click(tile)
+                for widget in (tile_frame, image_label, name_label):
+                    widget.bind("<Button-1>", click_cmd)
+                tile_row.append(tile_frame)
             
-            button_list.append(button_row)
+            tile_rows.append(tile_row)
         
         # Configure grid weights for equal distribution
         for i in range(4):  # 4 rows
@@ -241,47 +285,88 @@ class GameScreen(BaseScreen):
         for i in range(6):  # 6 columns
             parent.grid_columnconfigure(i, weight=1)
         
+        self.tiles[player] = tile_rows
+    
+    @timed('fill_grid')
+    def fill_grid(self, player):
+        """Show a player's Pokemon on their retained tiles"""
+        grid_data = self.game.player1_grid if player == 1 else self.game.player2_grid
+        button_list = []
+        tile_index = self.tile_index[player] = {}
+        
+        log.debug(f"Filling grid for player {player} with {len(grid_data)} Pokemon")
+        
+        for row, tile_row in enumerate(self.tiles[player]):
+            button_row = []
+            for col, tile_frame in enumerate(tile_row):
+                pokemon_index = row * 6 + col
+                if pokemon_index >= len(grid_data):
+                    tile_frame.pokemon_name = None
+                    tile_frame.grid_remove()
+                    button_row.append(None)
+                    continue
+                
+                pokemon_name = grid_data[pokemon_index]
+                tile_frame.pokemon_name = pokemon_name
+                tile_index[pokemon_name] = tile_frame
+                tile_frame.name_label.configure(text=pokemon_name)
+                tile_frame.grid()
+                
+                # Show a placeholder now and fill in the sprite once it is decoded
+                image_label = tile_frame.image_label
+                placeholder = self.game.image_loader.get_placeholder_image(self.game.image_loader.image_size)
+                image_label.configure(image=placeholder)
+                image_label.image = placeholder
+                tile_frame.sprite_image = placeholder
+                
+                sprite_url = self.game.data_manager.get_pokemon_sprite_url(pokemon_name)
+                self.game.image_loader.prefetcher.request(
+                    self.root,
+                    pokemon_name,
+                    sprite_url,
+                    callback=lambda image, tile=tile_frame, name=pokemon_name: self.fill_tile_image(tile, name, image)
+                )
+                button_row.append(tile_frame)
+            
+            button_list.append(button_row)
+        
         # Store button references
         if player == 1:
             self.game.player1_buttons = button_list
         else:
             self.game.player2_buttons = button_list
+    
+    def fill_tile_image(self, tile, pokemon_name, image):
+        """Replace a tile's placeholder with its sprite once it has loaded"""
+        if not tile.winfo_exists() or tile.pokemon_name != pokemon_name:
+            return  # The tile was dealt a different Pokemon before the sprite arrived
         
-        print(f"Player {player} buttons stored: {len(button_list)} rows")
+        # Tiles showing something else (e.g. the X overlay) get the sprite when restored
+        image_label = tile.image_label
+        showing_sprite = getattr(image_label, 'image', None) is tile.sprite_image
+        tile.sprite_image = image
+        if showing_sprite:
+            image_label.configure(image=image)
+            image_label.image = image
     
-    def update_grid_clickability(self):
-        """Update which grid tiles are clickable based on current player's turn"""
-        # Player 1's grid
-        for row in self.game.player1_buttons:
-            for tile in row:
-                if tile:
-                    # Player 1's grid is clickable when it's player 2's turn
-                    is_clickable = (self.game.current_player == 2)
-                    self.update_tile_clickability(tile, is_clickable)
-        
-        # Player 2's grid  
-        for row in self.game.player2_buttons:
-            for tile in row:
-                if tile:
-                    # Player 2's grid is clickable when it's player 1's turn
-                    is_clickable = (self.game.current_player == 1)
-                    self.update_tile_clickability(tile, is_clickable)
+    def tile_for(self, player, pokemon_name):
+        """The tile showing a Pokemon on a player's grid, or None"""
+        return self.tile_index[player].get(pokemon_name)
     
-    def update_tile_clickability(self, tile, is_clickable):
-        """Update a single tile's clickability"""
-        if is_clickable:
-            # Make clickable
-            tile.configure(cursor='hand2')
-            click_cmd = lambda e, p=tile.pokemon_name, target_player=tile.player: self.game.toggle_pokemon(p, target_player)
-            tile.bind("<Button-1>", click_cmd)
-            tile.image_label.bind("<Button-1>", click_cmd)
-            tile.name_label.bind("<Button-1>", click_cmd)
-            
-            # No hover effects - keep tiles at consistent grey background
-        else:
-            # Make not clickable
-            tile.configure(cursor='')
-            # Unbind click events only
-            tile.unbind("<Button-1>")
-            tile.image_label.unbind("<Button-1>")
-            tile.name_label.unbind("<Button-1>")
+    def show_elimination(self, tile, eliminated):
+        """Draw the X overlay on a tile, or put its stored sprite back"""
+        image = self.game.image_loader.get_x_icon() if eliminated else tile.sprite_image
+        if image:
+            tile.image_label.configure(image=image)
+            tile.image_label.image = image
+    
+    def on_tile_click(self, tile):
+        """Toggle a tile if its grid is the one the current player may click"""
+        # Players eliminate on their opponent's grid: Player 1 clicks grid 2 and vice versa
+        if tile.pokemon_name and tile.player != self.game.current_player:
+            self.game.toggle_pokemon(tile.pokemon_name, tile.player)
+    
+    def update_grid_clickability(self):
+        """Show which grid is clickable this turn; clicks themselves are checked in on_tile_click"""
+        for player, grid_frame in self.grid_frames.items():
+            grid_frame.configure(cursor='hand2' if player != self.game.current_player else '')
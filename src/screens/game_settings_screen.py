@@ -1,22 +1,22 @@
 """
 Game settings screen for Pokemon Guess Game
 """
+import logging
 import tkinter as tk
 from tkinter import messagebox, ttk
 from .base_screen import BaseScreen
 
+log = logging.getLogger(__name__)
+
 
 class GameSettingsScreen(BaseScreen):
     """Screen for configuring game settings including generations, variants, and pokemon selection"""
     
-    def show(self):
-        """Display the game settings screen"""
-        self.clear_screen()
-        
-        # Main container - no scrollbar needed with horizontal layout
-        self.container = tk.Frame(self.root, bg='#3d7dca')
-        self.container.pack(expand=True, fill='both', padx=30, pady=20)
-        
+    # Main container - no scrollbar needed with horizontal layout
+    container_options = {'expand': True, 'fill': 'both', 'padx': 30, 'pady': 20}
+    
+    def build(self):
+        """Build the game settings screen; its checkbox variables live on the game"""
         # Logo
         logo_image = self.game.image_loader.load_logo_image('game-settings-logo.png', max_width=500, max_height=80)
         if logo_image:
@@ -100,9 +100,12 @@ class GameSettingsScreen(BaseScreen):
         # Store reference to button in game instance
         self.game.confirm_button = self.confirm_button
         
-        # Initialize states
+        # Initialize states from the freshly created checkbox variables
         self.game.update_selected_generations()
         self.game.update_selected_variants()
+    
+    def on_show(self):
+        """Checkboxes keep their values between visits; only the button state needs a refresh"""
         self.game.update_confirm_button_state()
     
     def create_generation_section(self, parent_frame):
@@ -328,9 +331,17 @@ class GameSettingsScreen(BaseScreen):
     def confirm_settings(self):
         """Confirm game settings and return to startup screen"""
         if self.game.selected_generations:
-            print(f"🎮 Selected generations: {sorted(self.game.selected_generations)}")
-            print(f"🔮 Selected variants: {sorted(self.game.selected_variants) if hasattr(self.game, 'selected_variants') else 'All'}")
-            print(f"🎯 Pokemon selection method: {self.game.pokemon_selection_var.get()}")
+            # Fail now rather than when the grids are dealt
+            try:
+                self.game.data_manager.grid_sampler(
+                    self.game.filtered_pokemon_list, self.game.unique_species, self.game.max_variants_per_grid
+                )
+            except ValueError as e:
+                messagebox.showwarning("Not Enough Pokémon", f"{e}. Please select more generations or variants!")
+                return
+            log.debug(f"🎮 Selected generations: {sorted(self.game.selected_generations)}")
+            log.debug(f"🔮 Selected variants: {sorted(self.game.selected_variants) if hasattr(self.game, 'selected_variants') else 'All'}")
+            log.debug(f"🎯 Pokemon selection method: {self.game.pokemon_selection_var.get()}")
             # Return to startup screen with settings applied
             self.game.return_to_startup()
         else:
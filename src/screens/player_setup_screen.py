@@ -10,14 +10,12 @@ from ..widgets import AutocompleteEntry
 class PlayerSetupScreen(BaseScreen):
     """Screen for player name and Pokemon selection"""
     
-    def show(self, player_num):
-        """Setup screen for player selection"""
-        self.clear_screen()
-        
-        # Main container
-        self.container = tk.Frame(self.root, bg='#3d7dca')
-        self.container.pack(expand=True, fill='both')
-        
+    def __init__(self, root, game):
+        super().__init__(root, game)
+        self.player_num = 1
+    
+    def build(self):
+        """Build the player setup form; on_show resets it for each player"""
         # Logo
         logo_image = self.game.image_loader.load_logo_image('player-setup-logo.png', max_width=500, max_height=120)
         if logo_image:
@@ -40,14 +38,13 @@ class PlayerSetupScreen(BaseScreen):
             title_label.pack(pady=(50, 10))
         
         # Player number indicator
-        player_label = tk.Label(
+        self.player_label = tk.Label(
             self.container,
-            text=f"Player {player_num}",
             font=('Arial', 24, 'bold'),
             fg='#003a70',
             bg='#3d7dca'
         )
-        player_label.pack(pady=(0, 30))
+        self.player_label.pack(pady=(0, 30))
         
         # Name input
         name_label = tk.Label(
@@ -59,7 +56,7 @@ class PlayerSetupScreen(BaseScreen):
         )
         name_label.pack(pady=10)
         
-        name_entry = tk.Entry(
+        self.name_entry = tk.Entry(
             self.container,
             font=('Arial', 16),
             width=25,
@@ -71,8 +68,7 @@ class PlayerSetupScreen(BaseScreen):
             highlightcolor='#003a70',
             highlightthickness=2
         )
-        name_entry.pack(pady=10)
-        name_entry.focus()
+        self.name_entry.pack(pady=10)
         
         # Pokemon selection
         pokemon_label = tk.Label(
@@ -85,50 +81,16 @@ class PlayerSetupScreen(BaseScreen):
         pokemon_label.pack(pady=(30, 10))
         
         # Autocomplete entry for Pokemon selection
-        pokemon_autocomplete = AutocompleteEntry(
+        self.pokemon_autocomplete = AutocompleteEntry(
             self.container,
             values=self.game.filtered_pokemon_list,
             image_loader=self.game.image_loader,
             data_manager=self.game.data_manager,
             width=25
         )
-        pokemon_autocomplete.pack(pady=10)
+        self.pokemon_autocomplete.pack(pady=10)
         
         # Submit button
-        def submit_player():
-            name = name_entry.get().strip()
-            chosen_pokemon = pokemon_autocomplete.get().strip()
-            
-            if not name:
-                messagebox.showerror("Error", "Please enter your name!")
-                return
-            
-            if not chosen_pokemon:
-                messagebox.showerror("Error", "Please choose a Pokémon!")
-                return
-            
-            # Validate that the chosen Pokemon exists in our filtered list
-            if chosen_pokemon not in self.game.filtered_pokemon_list:
-                messagebox.showerror("Error", f"'{chosen_pokemon}' is not a valid Pokémon from the selected generations. Please select from the suggestions.")
-                return
-            
-            # Check if manual selection is enabled
-            selection_method = self.game.pokemon_selection_var.get() if self.game.pokemon_selection_var else "randomize"
-            
-            if selection_method == "manual":
-                # Go to manual grid setup screen
-                self.game.pokemon_grid_setup_screen.show(player_num, name, chosen_pokemon)
-            else:
-                # Use original randomize logic
-                if player_num == 1:
-                    self.game.player1_name = name
-                    self.game.player1_chosen = chosen_pokemon
-                    self.game.setup_player(2)
-                else:
-                    self.game.player2_name = name
-                    self.game.player2_chosen = chosen_pokemon
-                    self.game.create_game_screen()
-        
         submit_button = tk.Button(
             self.container,
             text="I Choose You!",
@@ -142,10 +104,81 @@ class PlayerSetupScreen(BaseScreen):
             borderwidth=2,
             padx=30,
             pady=15,
-            command=submit_player,
+            command=self.submit_player,
             cursor='hand2'
         )
         submit_button.pack(pady=30)
         
+        # Player 2 can be the computer instead (shown by on_show)
+        self.computer_button = tk.Button(
+            self.container,
+            text="🤖 Play Against the Computer",
+            font=('Arial', 14, 'bold'),
+            bg='#cccccc',
+            fg='#222222',
+            highlightbackground='#222222',
+            highlightcolor='#222222',
+            highlightthickness=2,
+            relief='solid',
+            borderwidth=2,
+            padx=20,
+            pady=8,
+            command=self.game.add_computer_opponent,
+            cursor='hand2'
+        )
+    
+    def on_show(self, player_num):
+        """Setup screen for player selection"""
+        self.player_num = player_num
+        self.player_label.configure(text=f"Player {player_num}")
+        self.name_entry.delete(0, tk.END)
+        self.name_entry.focus()
+        # The settings may have changed the roster since the last visit
+        self.pokemon_autocomplete.reset(self.game.filtered_pokemon_list)
+        
+        if player_num == 2:
+            self.computer_button.pack(pady=(0, 20))
+        else:
+            self.computer_button.pack_forget()
+        
         # Bind Enter key to submit
-        self.root.bind('<Return>', lambda e: submit_player())
+        self.root.bind('<Return>', lambda e: self.submit_player())
+    
+    def on_hide(self):
+        """Close the suggestion list so it isn't showing on the next visit"""
+        self.pokemon_autocomplete.hide_suggestions()
+    
+    def submit_player(self):
+        """Validate the form and move on to the next setup step"""
+        name = self.name_entry.get().strip()
+        chosen_pokemon = self.pokemon_autocomplete.get().strip()
+        
+        if not name:
+            messagebox.showerror("Error", "Please enter your name!")
+            return
+        
+        if not chosen_pokemon:
+            messagebox.showerror("Error", "Please choose a Pokémon!")
+            return
+        
+        # Validate that the chosen Pokemon exists in our filtered list
+        if chosen_pokemon not in self.game.filtered_pokemon_list:
+            messagebox.showerror("Error", f"'{chosen_pokemon}' is not a valid Pokémon from the selected generations. Please select from the suggestions.")
+            return
+        
+        # Check if manual selection is enabled
+        selection_method = self.game.pokemon_selection_var.get() if self.game.pokemon_selection_var else "randomize"
+        
+        if selection_method == "manual":
+            # Go to manual grid setup screen
+            self.game.pokemon_grid_setup_screen.show(self.player_num, name, chosen_pokemon)
+        else:
+            # Use original randomize logic
+            if self.player_num == 1:
+                self.game.player1_name = name
+                self.game.player1_chosen = chosen_pokemon
+                self.game.setup_player(2)
+            else:
+                self.game.player2_name = name
+                self.game.player2_chosen = chosen_pokemon
+                self.game.create_game_screen()
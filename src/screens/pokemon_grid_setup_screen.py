@@ -1,11 +1,14 @@
 """
 Pokemon Grid Setup screen for manual Pokemon selection
 """
+import logging
 import tkinter as tk
 from tkinter import messagebox
 from .base_screen import BaseScreen
-from ..widgets import AutocompleteEntry
-from ..utils import get_title_font, get_subtitle_font, get_grid_font, get_small_font, bind_mousewheel
+from ..widgets import AutocompleteEntry, SuggestionRowPool
+from ..utils import get_title_font, get_subtitle_font, get_grid_font, get_small_font, bind_mousewheel, Debouncer
+
+log = logging.getLogger(__name__)
 
 
 class PokemonGridSetupScreen(BaseScreen):
@@ -16,15 +19,22 @@ class PokemonGridSetupScreen(BaseScreen):
         self.current_player = None
         self.chosen_pokemon = None
         self.grid_tiles = []  # Will store the tile widgets
-        self.autocomplete_widgets = []  # Will store autocomplete widgets
+        self.grid_cells = []  # (chosen label, autocomplete) retained for every position
+        self.autocomplete_widgets = []  # Autocomplete in use per position (None on the chosen one)
         self.selected_pokemon = {}  # Maps position (row, col) to pokemon name
         self.used_pokemon = set()  # Track which Pokemon have been used
         self.confirm_button = None
     
-    def show(self, player_num, player_name, chosen_pokemon):
-        """Show the manual grid setup screen"""
-        self.clear_screen()
+    def build(self):
+        """Build the grid setup layout once; on_show resets it for each player"""
+        # Create centered content frame with maximum dimensions
+        self.content_frame = tk.Frame(self.container, bg='#3d7dca')
+        self.content_frame.place(relx=0.5, rely=0.5, anchor='center')
         
+        self._create_content()
+    
+    def on_show(self, player_num, player_name, chosen_pokemon):
+        """Show the manual grid setup screen"""
         self.current_player = player_num
         self.chosen_pokemon = chosen_pokemon
         
@@ -39,17 +49,17 @@ class PokemonGridSetupScreen(BaseScreen):
             self.game.player2_name = player_name
             self.game.player2_chosen = chosen_pokemon
         
-        # Main container - centered and constrained
-        self.container = tk.Frame(self.root, bg='#3d7dca')
-        self.container.pack(expand=True, fill='both')
-        
-        # Create centered content frame with maximum dimensions
-        self.content_frame = tk.Frame(self.container, bg='#3d7dca')
-        self.content_frame.place(relx=0.5, rely=0.5, anchor='center')
-        
-        self._create_content(player_name)
-        
-    def _create_content(self, player_name):
+        self.instruction_label.configure(text=f"{player_name}, choose the Pokemon for your grid.")
+        self._reset_pokemon_grid()
+        self._update_confirm_button()
+    
+    def on_hide(self):
+        """Close any floating suggestion windows left open"""
+        for cell_row in self.grid_cells:
+            for _, autocomplete_widget in cell_row:
+                autocomplete_widget.hide_suggestions()
+    
+    def _create_content(self):
         """Create the main content of the screen"""
         # Logo
         logo_image = self.game.image_loader.load_logo_image('pokemon-grid-setup-logo.png', max_width=500, max_height=80)
@@ -73,14 +83,13 @@ class PokemonGridSetupScreen(BaseScreen):
             title_label.pack(pady=(10, 15))
         
         # Player instruction
-        instruction_label = tk.Label(
+        self.instruction_label = tk.Label(
             self.content_frame,
-            text=f"{player_name}, choose the Pokemon for your grid.",
             font=get_subtitle_font(),
             fg='#003a70',
             bg='#3d7dca'
         )
-        instruction_label.pack(pady=(0, 20))
+        self.instruction_label.pack(pady=(0, 20))
         
         # Create the grid
         self._create_pokemon_grid()
@@ -106,24 +115,18 @@ class PokemonGridSetupScreen(BaseScreen):
         self.confirm_button.pack(pady=(20, 10))
         
     def _create_pokemon_grid(self):
-        """Create the 6x4 Pokemon grid with autocomplete widgets"""
+        """Create the 6x4 Pokemon grid; every position gets both a CHOSEN label and an autocomplete"""
         # Grid container with fixed size
         grid_container = tk.Frame(self.content_frame, bg='#3d7dca')
         grid_container.pack(pady=10)
         
         # Create 6x4 grid (6 columns, 4 rows = 24 total)
         self.grid_tiles = []
-        self.autocomplete_widgets = []
-        self.selected_pokemon = {}
-        
-        # Determine where to place the chosen Pokemon (random position for now, can be made configurable)
-        import random
-        chosen_row, chosen_col = random.randint(0, 3), random.randint(0, 5)
-        self.selected_pokemon[(chosen_row, chosen_col)] = self.chosen_pokemon
+        self.grid_cells = []
         
         for row in range(4):
             tile_row = []
-            autocomplete_row = []
+            cell_row = []
             
             for col in range(6):
                 # Create container for each position with fixed size
@@ -143,42 +146,67 @@ class PokemonGridSetupScreen(BaseScreen):
                 )
                 tile_button.pack(pady=(0, 5))
                 
+                # Label shown when this position holds the chosen Pokemon
+                chosen_label = tk.Label(
+                    position_frame,
+                    text="CHOSEN",
+                    font=get_grid_font(),
+                    fg='#003a70',
+                    bg='#3d7dca'
+                )
+                
+                # Create autocomplete widget with fixed width and floating dropdown
+                autocomplete_widget = ConstrainedAutocompleteEntry(
+                    position_frame,
+                    values=[],
+                    image_loader=self.game.image_loader,
+                    data_manager=self.game.data_manager,
+                    width=10,  # Fixed width
+                    on_selection_callback=lambda pokemon, r=row, c=col: self._on_pokemon_selected(pokemon, r, c)
+                )
+                
+                tile_row.append(tile_button)
+                cell_row.append((chosen_label, autocomplete_widget))
+            
+            self.grid_tiles.append(tile_row)
+            self.grid_cells.append(cell_row)
+    
+    def _reset_pokemon_grid(self):
+        """Clear every position and place the chosen Pokemon"""
+        self.autocomplete_widgets = []
+        self.selected_pokemon = {}
+        
+        # Determine where to place the chosen Pokemon (random position for now, can be made configurable)
+        import random
+        chosen_row, chosen_col = random.randint(0, 3), random.randint(0, 5)
+        self.selected_pokemon[(chosen_row, chosen_col)] = self.chosen_pokemon
+        available_pokemon = self._get_available_pokemon()
+        
+        for row in range(4):
+            autocomplete_row = []
+            
+            for col in range(6):
+                tile_button = self.grid_tiles[row][col]
+                chosen_label, autocomplete_widget = self.grid_cells[row][col]
+                chosen_label.pack_forget()
+                autocomplete_widget.pack_forget()
+                
                 # Check if this is the chosen Pokemon position
                 if row == chosen_row and col == chosen_col:
                     # Load and display chosen Pokemon
                     self._load_pokemon_image_for_tile(tile_button, self.chosen_pokemon)
                     tile_button.configure(bg='#ffff00', borderwidth=4)  # Highlight chosen Pokemon
-                    
-                    # Add label for chosen Pokemon
-                    chosen_label = tk.Label(
-                        position_frame,
-                        text="CHOSEN",
-                        font=get_grid_font(),
-                        fg='#003a70',
-                        bg='#3d7dca'
-                    )
                     chosen_label.pack()
-                    
                     autocomplete_widget = None  # No autocomplete for chosen Pokemon
                 else:
                     # Load pokeball image
                     self._load_pokeball_image_for_tile(tile_button)
-                    
-                    # Create autocomplete widget with fixed width and floating dropdown
-                    autocomplete_widget = ConstrainedAutocompleteEntry(
-                        position_frame,
-                        values=self._get_available_pokemon(),
-                        image_loader=self.game.image_loader,
-                        data_manager=self.game.data_manager,
-                        width=10,  # Fixed width
-                        on_selection_callback=lambda pokemon, r=row, c=col: self._on_pokemon_selected(pokemon, r, c)
-                    )
+                    tile_button.configure(bg='#cccccc', borderwidth=2)
+                    autocomplete_widget.reset(available_pokemon)
                     autocomplete_widget.pack()
                 
-                tile_row.append(tile_button)
                 autocomplete_row.append(autocomplete_widget)
             
-            self.grid_tiles.append(tile_row)
             self.autocomplete_widgets.append(autocomplete_row)
     
     def _get_available_pokemon(self):
@@ -238,7 +266,7 @@ class PokemonGridSetupScreen(BaseScreen):
                 tile_button.configure(image=pokeball_image, text="")
                 tile_button.image = pokeball_image  # Keep reference
         except Exception as e:
-            print(f"⚠️ Could not load pokeball image: {e}")
+            log.warning(f"⚠️ Could not load pokeball image: {e}")
             tile_button.configure(text="?", font=('Arial', 20), image="")
     
     def _update_confirm_button(self):
@@ -289,6 +317,7 @@ class ConstrainedAutocompleteEntry(tk.Frame):
         self.image_loader = image_loader
         self.data_manager = data_manager
         self.on_selection_callback = on_selection_callback
+        self.debouncer = Debouncer(self, delay_ms=100)
         self.var = tk.StringVar()
         self.var.trace('w', self.on_text_changed)
         
@@ -310,8 +339,9 @@ class ConstrainedAutocompleteEntry(tk.Frame):
         )
         self.entry.pack()
         
-        # Floating suggestions window (initially hidden)
+        # Floating suggestions window (created on first use, then withdrawn/shown)
         self.suggestions_window = None
+        self.suggestion_pool = None
         self.suggestion_items = []
         
         # Bind events
@@ -320,10 +350,21 @@ class ConstrainedAutocompleteEntry(tk.Frame):
         
     def on_entry_click(self, event=None):
         """Show suggestions when entry is clicked"""
+        self.debouncer.cancel()
         self.show_suggestions()
         
     def on_text_changed(self, *args):
         """Handle text changes in entry"""
+        # Coalesce bursts of typing into a single search and render
+        self.debouncer.schedule(self.refresh_suggestions, self.var.get())
+    
+    def refresh_suggestions(self, query):
+        """Render suggestions for a query queued by on_text_changed"""
+        if query != self.var.get():
+            # The text moved on since this search was queued
+            self.debouncer.mark_stale()
+            return
+        
         self.show_suggestions()
         
     def show_suggestions(self):
@@ -341,59 +382,26 @@ class ConstrainedAutocompleteEntry(tk.Frame):
             self.hide_suggestions()
             return
         
-        # Create or update suggestions window
+        # Create the suggestions window and its row pool once
         if not self.suggestions_window:
             self.suggestions_window = tk.Toplevel(self)
             self.suggestions_window.wm_overrideredirect(True)
             self.suggestions_window.configure(bg='#cccccc', relief='solid', borderwidth=1)
-        
-        # Clear previous suggestions
-        for item in self.suggestion_items:
-            item.destroy()
-        self.suggestion_items = []
-        
-        # Add new suggestions
-        for match in matches:
-            item_frame = tk.Frame(self.suggestions_window, bg='#cccccc')
-            item_frame.pack(fill='x', padx=1, pady=1)
-            
-            # Pokemon name label
-            name_label = tk.Label(
-                item_frame,
-                text=match,
+            self.suggestion_pool = SuggestionRowPool(
+                self.suggestions_window,
+                size=10,
+                on_select=self.select_item_by_index,
+                on_enter=lambda index: self.set_item_highlight(index, True),
+                on_leave=lambda index: self.set_item_highlight(index, False),
                 font=get_small_font(),
-                bg='#cccccc',
-                fg='#222222',
-                anchor='w',
-                padx=5,
-                pady=2
+                highlight_bg='#0078d4',
+                label_padding=(5, 2),
+                pack_options={'fill': 'x', 'padx': 1, 'pady': 1}
             )
-            name_label.pack(side='left', fill='x', expand=True)
-            
-            # Bind click events
-            def make_select_func(pokemon_name):
-                return lambda e: self.select_pokemon(pokemon_name)
-            
-            item_frame.bind('<Button-1>', make_select_func(match))
-            name_label.bind('<Button-1>', make_select_func(match))
-            
-            # Hover effects
-            def make_hover_funcs(frame, label):
-                def on_enter(e):
-                    frame.configure(bg='#0078d4')
-                    label.configure(bg='#0078d4', fg='white')
-                def on_leave(e):
-                    frame.configure(bg='#cccccc')
-                    label.configure(bg='#cccccc', fg='#222222')
-                return on_enter, on_leave
-            
-            enter_func, leave_func = make_hover_funcs(item_frame, name_label)
-            item_frame.bind('<Enter>', enter_func)
-            item_frame.bind('<Leave>', leave_func)
-            name_label.bind('<Enter>', enter_func)
-            name_label.bind('<Leave>', leave_func)
-            
-            self.suggestion_items.append(item_frame)
+        
+        # Refill the pooled rows in place instead of rebuilding them
+        self.suggestion_items = self.suggestion_pool.show(matches)
+        self.suggestions_window.deiconify()
         
         # Position the suggestions window
         self.position_suggestions_window()
@@ -412,9 +420,8 @@ class ConstrainedAutocompleteEntry(tk.Frame):
         
     def hide_suggestions(self):
         """Hide suggestions window"""
-        if self.suggestions_window:
-            self.suggestions_window.destroy()
-            self.suggestions_window = None
+        if self.suggestions_window and self.suggestion_items:
+            self.suggestions_window.withdraw()
             self.suggestion_items = []
             
     def on_focus_out(self, event=None):
@@ -422,13 +429,31 @@ class ConstrainedAutocompleteEntry(tk.Frame):
         # Delay hiding to allow for clicks on suggestions
         self.after(150, self.hide_suggestions)
         
+    def set_item_highlight(self, index, highlighted):
+        """Hover effect for a suggestion row"""
+        if 0 <= index < len(self.suggestion_items):
+            self.suggestion_items[index].set_highlighted(highlighted)
+        
+    def select_item_by_index(self, index):
+        """Select the Pokemon shown in a suggestion row"""
+        if 0 <= index < len(self.suggestion_items):
+            self.select_pokemon(self.suggestion_items[index].pokemon_name)
+        
     def select_pokemon(self, pokemon_name):
         """Select a Pokemon from suggestions"""
         self.var.set(pokemon_name)
+        self.debouncer.cancel()
         self.hide_suggestions()
         if self.on_selection_callback:
             self.on_selection_callback(pokemon_name)
             
+    def reset(self, values):
+        """Clear the entry and offer a new set of values"""
+        self.values = values
+        self.var.set("")
+        self.debouncer.cancel()
+        self.hide_suggestions()
+    
     def update_values(self, new_values):
         """Update available values"""
         self.values = new_values
@@ -437,6 +462,12 @@ class ConstrainedAutocompleteEntry(tk.Frame):
         if current and current not in new_values:
             self.var.set("")
             
+    def destroy(self):
+        """Cancel pending searches and close the dropdown before the widget goes away"""
+        self.debouncer.cancel()
+        self.hide_suggestions()
+        super().destroy()
+    
     def get(self):
         """Get current entry value"""
         return self.var.get()
@@ -0,0 +1,119 @@
+"""
+Lazy screen registry for Pokemon Guess Game
+"""
+import time
+from collections import deque
+from importlib import import_module
+
+from ..utils.instrumentation import metrics
+
+
+def widget_paths(widget):
+    """Tk path names of a widget and everything below it"""
+    paths = {str(widget)}
+    for child in widget.children.values():
+        paths |= widget_paths(child)
+    return paths
+
+
+class ScreenRegistry:
+    """
+    Creates each screen the first time it is shown, importing its module only then,
+    and switches between them by packing and unpacking their retained containers
+
+    Every navigation's latency is recorded; with `count_widgets=True` (tests and
+    benchmarks) so is the number of widgets it allocated, counted outside the
+    timed region. `retained=False` destroys each screen as it is left instead,
+    the rebuild-on-every-show behaviour to compare against
+    """
+    
+    HISTORY = 100  # Recent navigations kept; stats() covers the whole session
+
+    # key -> (module in this package, class name)
+    SCREENS = {
+        'startup': ('startup_screen', 'StartupScreen'),
+        'settings': ('game_settings_screen', 'GameSettingsScreen'),
+        'player_setup': ('player_setup_screen', 'PlayerSetupScreen'),
+        'grid_setup': ('pokemon_grid_setup_screen', 'PokemonGridSetupScreen'),
+        'game': ('game_screen', 'GameScreen'),
+        'game_over': ('game_over_screen', 'GameOverScreen'),
+    }
+
+    def __init__(self, root, game_instance, retained=True, count_widgets=False):
+        self.root = root
+        self.game = game_instance
+        self.retained = retained
+        self.count_widgets = count_widgets
+        self.screens = {}
+        self.active = None
+        self.navigations = deque(maxlen=self.HISTORY)  # {'screen', 'ms'[, 'widgets_created', 'widgets_live']}
+        self.reset_stats()
+    
+    def reset_stats(self):
+        """Start the navigation totals and history afresh"""
+        self.navigations.clear()
+        self._totals = {'navigations': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'widgets_created': 0, 'widgets_live': 0}
+
+    def get(self, key):
+        """The screen registered under `key`, created on first use"""
+        screen = self.screens.get(key)
+        if screen is None:
+            module_name, class_name = self.SCREENS[key]
+            screen_class = getattr(import_module(f".{module_name}", __package__), class_name)
+            screen = self.screens[key] = screen_class(self.root, self.game)
+        return screen
+
+    def is_created(self, key):
+        return key in self.screens
+
+    def activate(self, screen, *args):
+        """Hide the current screen, show `screen` (building it if needed) and refresh it"""
+        before = widget_paths(self.root) if self.count_widgets else None
+        start = time.perf_counter()
+
+        previous = self.active
+        if previous is not None and (previous is not screen or not self.retained):
+            previous.hide()
+            if not self.retained:
+                previous.destroy()
+            self.active = None
+
+        if screen.container is None:
+            screen.create()
+        if self.active is not screen:
+            screen.container.pack(**screen.container_options)
+            self.active = screen
+        screen.on_show(*args)
+
+        seconds = time.perf_counter() - start
+        metrics.record('screen_transition', seconds)
+        metrics.record(f'screen.{type(screen).__name__}', seconds)
+        
+        navigation = {'screen': type(screen).__name__, 'ms': seconds * 1000}
+        totals = self._totals
+        totals['navigations'] += 1
+        totals['total_ms'] += navigation['ms']
+        totals['max_ms'] = max(totals['max_ms'], navigation['ms'])
+        if before is not None:
+            after = widget_paths(self.root)
+            navigation['widgets_created'] = len(after - before)
+            navigation['widgets_live'] = len(after)
+            totals['widgets_created'] += navigation['widgets_created']
+            totals['widgets_live'] = navigation['widgets_live']
+        self.navigations.append(navigation)
+
+    def stats(self):
+        """Navigation totals: count, average/slowest latency and widgets allocated (when counted)"""
+        totals = self._totals
+        return {
+            'navigations': totals['navigations'],
+            'avg_ms': totals['total_ms'] / totals['navigations'] if totals['navigations'] else 0.0,
+            'max_ms': totals['max_ms'],
+            'widgets_created': totals['widgets_created'],
+            'widgets_live': totals['widgets_live'],
+        }
+
+
+def registered_screen(key):
+    """Game attribute that resolves to a screen through the game's registry"""
+    return property(lambda game: game.screens.get(key), doc=f"The '{key}' screen, created on first access")
@@ -8,14 +8,8 @@ from .base_screen import BaseScreen
 class StartupScreen(BaseScreen):
     """Initial startup screen with start button"""
     
-    def show(self):
-        """Display the initial startup screen"""
-        self.clear_screen()
-        
-        # Main container
-        self.container = tk.Frame(self.root, bg='#3d7dca')
-        self.container.pack(expand=True, fill='both')
-        
+    def build(self):
+        """Build the initial startup screen"""
         # Logo
         logo_image = self.game.image_loader.load_logo_image('whos-your-pokemon-logo.png', max_width=600, max_height=200)
         if logo_image:
@@ -0,0 +1,136 @@
+"""
+Tournament simulator for the Pokemon Guess Game
+
+Plays matches between two strategies under the game's two-player rules,
+without opening the Tk window:
+
+    python -m src.sim --games 100000 --player1 questions --player2 halving
+
+Grids are dealt the way the game deals them, from the Pokemon the game
+settings select (generations and variant categories). Matches run in chunks
+across a process pool, and running win rates and turn counts are printed as
+chunks finish; no per-match results are kept.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from .data import PokemonDataManager
+from .engine import STRATEGIES, QuestioningPlayer, simulate, turn_percentile
+
+STRATEGY_HELP = {
+    'random': "cross out one random tile a turn",
+    'halving': "cross out half of the wrong tiles a turn (an ideal yes/no question)",
+    'questions': "the computer opponent: ask the most informative catalog question",
+}
+STRATEGY_NAMES = [*STRATEGIES, 'questions']  # Scripted strategies plus the computer opponent
+ALL_GENERATIONS = [str(generation) for generation in range(1, 10)]
+
+
+def build_strategy(name, data_manager):
+    """A strategy the simulator can send to workers, by name"""
+    if name == 'questions':
+        return QuestioningPlayer(data_manager.question_bank(), time_budget=None)
+    return name
+
+
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive number, not {value}")
+    return number
+
+
+def parse_list(value):
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def describe_progress(stats, started):
+    games = stats['games']
+    wins = stats['wins']
+    rate = games / (time.perf_counter() - started)
+    return (f"📊 {games:,} games  P1 {wins[1] / games:6.1%}  P2 {wins[2] / games:6.1%}  "
+            f"avg {stats['turns'] / games:5.2f} turns  ({rate:,.0f} games/s)")
+
+
+def print_summary(stats, strategies):
+    games = stats['games']
+    print(f"\n🏆 {strategies[0]} (Player 1) vs {strategies[1]} (Player 2): {games:,} games, seed {stats['seed']}")
+    for player in (1, 2):
+        print(f"  Player {player} wins: {stats['wins'][player]:,} ({stats['wins'][player] / games:.1%})")
+    for reason, count in sorted(stats['reasons'].items(), key=lambda item: -item[1]):
+        print(f"  Ended by {reason}: {count:,} ({count / games:.1%})")
+    print(f"  Turns: avg {stats['turns'] / games:.2f}, median {turn_percentile(stats, 0.5)}, "
+          f"p90 {turn_percentile(stats, 0.9)}, max {stats['max_turns']}")
+    print(f"  ⏱️ {stats['seconds']:.1f} s, {stats['games_per_second']:,.0f} games/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Play simulated Pokemon Guess Game matches between strategies",
+        epilog="Strategies: " + "; ".join(f"{name}: {STRATEGY_HELP.get(name, '')}" for name in STRATEGY_NAMES),
+        exit_on_error=False
+    )
+    parser.add_argument("--games", type=positive_int, default=10_000, help="matches to play (default 10000)")
+    parser.add_argument("--player1", default='random', choices=STRATEGY_NAMES, help="Player 1's strategy")
+    parser.add_argument("--player2", default='random', choices=STRATEGY_NAMES, help="Player 2's strategy")
+    parser.add_argument("--workers", type=positive_int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for a reproducible tournament")
+    parser.add_argument("--chunk-size", type=positive_int, default=None, help="matches per task (default: sized to the pool)")
+    parser.add_argument("--generations", type=parse_list, default=ALL_GENERATIONS,
+                        help="comma-separated generations to deal from (default: all)")
+    parser.add_argument("--variants", default='all',
+                        help="'all', 'none', or comma-separated variant categories to include (default: all)")
+    parser.add_argument("--unique-species", action='store_true', help="at most one Pokemon per base species in a grid")
+    parser.add_argument("--max-variants", type=int, default=None, help="at most this many variant forms in a grid")
+    parser.add_argument("--json", metavar="PATH", help="also write the final statistics to a JSON file")
+    try:
+        args = parser.parse_args(argv)
+    except argparse.ArgumentError as e:
+        print(f"❌ {e}")
+        return 1
+
+    # The same roster, filters and dealing rules the game uses
+    data_manager = PokemonDataManager()
+    if args.variants == 'all':
+        variants = data_manager.get_all_variants()
+    elif args.variants == 'none':
+        variants = set()
+    else:
+        variants = set(parse_list(args.variants))
+    pokemon_names = data_manager.filter_pokemon_by_settings(set(args.generations), variants)
+    pool_ids = [data_manager.get_pokemon_id(name) for name in pokemon_names]
+    grid_rules = data_manager.grid_rules(args.unique_species, args.max_variants)
+    strategies = (build_strategy(args.player1, data_manager), build_strategy(args.player2, data_manager))
+
+    workers = args.workers or os.cpu_count() or 1
+    chunk_size = args.chunk_size or max(500, min(20_000, args.games // (workers * 8) or 1))
+    print(f"🎮 {args.games:,} games of {args.player1} vs {args.player2} on {len(pool_ids):,} Pokémon, "
+          f"{workers} worker{'s' if workers != 1 else ''}")
+
+    started = time.perf_counter()
+    try:
+        stats = simulate(args.games, strategies, pool_ids=pool_ids, workers=workers, seed=args.seed,
+                         chunk_size=chunk_size, grid_rules=grid_rules,
+                         on_chunk=lambda total: print(describe_progress(total, started), flush=True))
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print_summary(stats, (args.player1, args.player2))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({**stats, 'player1': args.player1, 'player2': args.player2,
+                       'pokemon': len(pool_ids)}, f, indent=2)
+        print(f"💾 Saved statistics to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
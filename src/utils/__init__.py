@@ -4,8 +4,14 @@ Utils package for Pokemon Guess Game
 
 from .resource_path import get_resource_path
 from .image_loader import ImageLoader
+from .sprite_cache import SpriteCache
+from .sprite_disk_cache import SpriteDiskCache
+from .logo_cache import LogoCache
+from .debounce import Debouncer
+from .sprite_prefetcher import SpritePrefetcher
+from .instrumentation import Metrics, metrics, timed, count, configure_logging
 from .platform_utils import (
-    get_platform_info, bind_mousewheel, get_modifier_key, 
+    get_platform_info, get_user_cache_dir, get_user_data_dir, bind_mousewheel, get_modifier_key, 
     bind_copy_paste, get_font_config, configure_widget_appearance,
     adjust_window_for_platform, get_key_binding_display
 )
@@ -18,7 +24,19 @@ from .font_config import (
 __all__ = [
     'get_resource_path', 
     'ImageLoader',
+    'SpriteCache',
+    'SpriteDiskCache',
+    'LogoCache',
+    'Debouncer',
+    'SpritePrefetcher',
+    'Metrics',
+    'metrics',
+    'timed',
+    'count',
+    'configure_logging',
     'get_platform_info',
+    'get_user_cache_dir',
+    'get_user_data_dir',
     'bind_mousewheel',
     'get_modifier_key',
     'bind_copy_paste',
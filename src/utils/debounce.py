@@ -0,0 +1,69 @@
+"""
+Debounced Tk callback scheduling for the Pokemon Guess Game
+"""
+
+
+class Debouncer:
+    """
+    Coalesces bursts of calls into a single `after` callback on a Tk widget.
+
+    Every schedule() cancels the callback that is still waiting, so only the
+    last call of a burst runs. The stats counters record how many renders
+    were requested, executed, coalesced away, or dropped as stale.
+    """
+
+    def __init__(self, widget, delay_ms=100):
+        self.widget = widget
+        self.delay_ms = delay_ms
+        self._after_id = None
+        self._pending = None
+        self.stats = {
+            'requested': 0,
+            'executed': 0,
+            'coalesced': 0,
+            'stale': 0
+        }
+
+    def schedule(self, callback, *args):
+        """Run callback(*args) after the delay, replacing any pending call"""
+        self.stats['requested'] += 1
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self.stats['coalesced'] += 1
+
+        self._pending = (callback, args)
+        self._after_id = self.widget.after(self.delay_ms, self._run)
+
+    def is_pending(self):
+        """Check whether a call is waiting to run"""
+        return self._after_id is not None
+
+    def flush(self):
+        """Run the pending call immediately, if there is one"""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._run()
+
+    def cancel(self):
+        """Drop the pending call without running it"""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+            self._pending = None
+            self.stats['coalesced'] += 1
+
+    def mark_stale(self):
+        """Record that a call ran but its result was out of date"""
+        self.stats['stale'] += 1
+
+    def skipped_renders(self):
+        """Number of requested renders that never reached the screen"""
+        return self.stats['coalesced'] + self.stats['stale']
+
+    def _run(self):
+        """Run the pending call"""
+        self._after_id = None
+        callback, args = self._pending
+        self._pending = None
+        self.stats['executed'] += 1
+        callback(*args)
@@ -1,12 +1,20 @@
 """
 Image loading utilities for the Pokemon Guess Game
 """
+import logging
 import tkinter as tk
 from PIL import Image, ImageTk, ImageFile
-import requests
 from io import BytesIO
 import os
 from .resource_path import get_resource_path
+from .sprite_atlas import SpriteAtlas
+from .logo_cache import LogoCache
+from .sprite_cache import SpriteCache
+from .sprite_disk_cache import SpriteDiskCache
+from .sprite_prefetcher import SpritePrefetcher
+from .instrumentation import count, timed
+
+log = logging.getLogger(__name__)
 
 # Enable loading of truncated images to handle potentially problematic PNG files
 ImageFile.LOAD_TRUNCATED_IMAGES = True
@@ -15,90 +23,115 @@ ImageFile.LOAD_TRUNCATED_IMAGES = True
 class ImageLoader:
     """Handles image loading and caching for the game"""
     
-    def __init__(self):
-        self.image_cache = {}
+    def __init__(self, cache_budgets=None):
+        # LRU cache of converted sprites with a byte budget per sprite size
+        self.image_cache = SpriteCache(cache_budgets)
         self.x_icon = None
+        self.x_icon_loaded = False
         self.image_size = (96, 96)
         self.autocomplete_size = (64, 64)
+        self.placeholder_images = {}
+        # Logos and icons, converted once per size (pre-scaled at build time when available)
+        self.logo_cache = LogoCache()
+        # Pre-resized sprites packed at build time (None when not built)
+        self.sprite_atlas = SpriteAtlas.load()
+        # Resized sprites and downloads kept between launches
+        self.disk_cache = SpriteDiskCache()
+        # Decodes sprites off the Tk thread ahead of grid rendering
+        self.prefetcher = SpritePrefetcher(self)
     
     def load_logo_image(self, filename, max_width=400, max_height=150):
-        """Load and resize a logo image while maintaining aspect ratio"""
+        """Load a logo image fitted to the box while maintaining aspect ratio (cached per size)"""
         try:
-            image = Image.open(get_resource_path(f'assets/{filename}'))
-            
-            # Calculate scaling to fit within max dimensions while maintaining aspect ratio
-            original_width, original_height = image.size
-            width_ratio = max_width / original_width
-            height_ratio = max_height / original_height
-            scale_factor = min(width_ratio, height_ratio)
-            
-            new_width = int(original_width * scale_factor)
-            new_height = int(original_height * scale_factor)
-            
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            return ImageTk.PhotoImage(image)
+            return self.logo_cache.get(filename, max_width, max_height)
         except Exception as e:
-            print(f"❌ Error loading logo {filename}: {e}")
+            log.error(f"❌ Error loading logo {filename}: {e}")
             return None
 
+    def get_x_icon(self):
+        """The elimination overlay, loaded on first use rather than at startup"""
+        if not self.x_icon_loaded:
+            self.load_x_icon()
+            self.x_icon_loaded = True
+        return self.x_icon
+    
     def load_x_icon(self):
         """Load and prepare the X icon for elimination overlay"""
         try:
-            x_image = Image.open(get_resource_path('assets/x_icon.png'))
-            x_image = x_image.resize((96, 96), Image.Resampling.LANCZOS)
-            self.x_icon = ImageTk.PhotoImage(x_image)
-            print("✅ X icon loaded successfully")
+            # The icon is square, so fitting it to 96x96 gives exactly 96x96
+            self.x_icon = self.logo_cache.get('x_icon.png', 96, 96)
+            log.debug("✅ X icon loaded successfully")
         except Exception as e:
-            print(f"❌ Error loading X icon: {e}")
+            log.error(f"❌ Error loading X icon: {e}")
             self.x_icon = None
     
+    @timed('load_pokemon_image')
     def load_pokemon_image(self, pokemon_name, sprite_url):
         """Load a Pokémon sprite image (96x96), prioritizing local cache over remote downloads"""
-        if pokemon_name in self.image_cache:
-            return self.image_cache[pokemon_name]
-        
-        # First, try to load from local cache
-        local_image = self._load_local_image_sized(pokemon_name, self.image_size)
-        if local_image:
-            self.image_cache[pokemon_name] = local_image
-            return local_image
-        
-        # If local image not available, download from URL
-        if sprite_url:
-            downloaded_image = self._download_image_from_url_sized(pokemon_name, sprite_url, self.image_size)
-            if downloaded_image:
-                self.image_cache[pokemon_name] = downloaded_image
-                return downloaded_image
-        
-        print(f"❌ Failed to load image for {pokemon_name}")
-        return None
+        image = self._load_pokemon_photo(pokemon_name, sprite_url, self.image_size)
+        if not image:
+            log.error(f"❌ Failed to load image for {pokemon_name}")
+        return image
     
     def load_pokemon_image_autocomplete(self, pokemon_name, sprite_url):
         """Load a Pokémon sprite image for autocomplete (64x64), prioritizing local cache"""
-        cache_key = f"{pokemon_name}_autocomplete"
-        
-        if cache_key in self.image_cache:
-            return self.image_cache[cache_key]
-        
-        # First, try to load from local cache
-        local_image = self._load_local_image_sized(pokemon_name, self.autocomplete_size)
-        if local_image:
-            self.image_cache[cache_key] = local_image
-            return local_image
+        image = self._load_pokemon_photo(pokemon_name, sprite_url, self.autocomplete_size)
+        if not image:
+            log.error(f"❌ Failed to load autocomplete image for {pokemon_name}")
+        return image
+    
+    def get_cached_image(self, pokemon_name, size):
+        """Return an already converted sprite, or None"""
+        return self.image_cache.get(pokemon_name, size)
+    
+    def store_image(self, pokemon_name, size, photo_image):
+        """Cache a converted sprite (must be called on the Tk thread)"""
+        self.image_cache.put(pokemon_name, size, photo_image)
+    
+    def pin_grid_sprites(self, pokemon_names):
+        """Keep the sprites of the visible grids cached for the rest of the game"""
+        self.image_cache.set_pinned(pokemon_names, self.image_size)
+    
+    def get_placeholder_image(self, size):
+        """Transparent stand-in shown on a tile until its sprite arrives"""
+        if size not in self.placeholder_images:
+            self.placeholder_images[size] = ImageTk.PhotoImage(Image.new('RGBA', size, (0, 0, 0, 0)))
+        return self.placeholder_images[size]
+    
+    @timed('decode_sprite')
+    def load_pil_image(self, pokemon_name, sprite_url, size):
+        """
+        Decode and resize a Pokémon sprite to a PIL image, local first then remote.
+        Touches no Tk state, so it is safe to call from worker threads.
+        """
+        image = self._load_local_image_sized(pokemon_name, size)
+        if image is None and sprite_url:
+            image = self._download_image_from_url_sized(pokemon_name, sprite_url, size)
+        return image
+    
+    def _load_pokemon_photo(self, pokemon_name, sprite_url, size):
+        """Load a sprite as a PhotoImage through the image cache"""
+        cached = self.get_cached_image(pokemon_name, size)
+        if cached is not None:
+            return cached
         
-        # If local image not available, download from URL
-        if sprite_url:
-            downloaded_image = self._download_image_from_url_sized(pokemon_name, sprite_url, self.autocomplete_size)
-            if downloaded_image:
-                self.image_cache[cache_key] = downloaded_image
-                return downloaded_image
+        image = self.load_pil_image(pokemon_name, sprite_url, size)
+        if image is None:
+            return None
         
-        print(f"❌ Failed to load autocomplete image for {pokemon_name}")
-        return None
+        photo_image = ImageTk.PhotoImage(image)
+        self.store_image(pokemon_name, size, photo_image)
+        return photo_image
     
     def _load_local_image_sized(self, pokemon_name, size):
         """Load a Pokémon image from local assets folder with specific size"""
         try:
+            # The atlas already holds the sprite at this size - no probing or resizing
+            if self.sprite_atlas:
+                image = self.sprite_atlas.get_image(pokemon_name, size)
+                if image:
+                    return image
+            
             # Try different possible filenames
             possible_names = [
                 pokemon_name.lower().replace(' ', '_').replace('.', '').replace("'", ''),
@@ -109,6 +142,12 @@ class ImageLoader:
             for name in possible_names:
                 local_path = get_resource_path(f'assets/pokemon_images/{name}.png')
                 if os.path.exists(local_path):
+                    # A previous launch may already have resized this exact file
+                    cache_key = self.disk_cache.file_key(local_path)
+                    image = self.disk_cache.get(cache_key, size)
+                    if image:
+                        return image
+                    
                     image = Image.open(local_path)
                     image = image.resize(size, Image.Resampling.LANCZOS)
                     
@@ -116,17 +155,29 @@ class ImageLoader:
                     if image.mode != 'RGBA':
                         image = image.convert('RGBA')
                     
-                    return ImageTk.PhotoImage(image)
+                    self.disk_cache.put(cache_key, size, image)
+                    return image
             
             return None
         except Exception as e:
-            print(f"❌ Error loading local image for {pokemon_name}: {e}")
+            log.error(f"❌ Error loading local image for {pokemon_name}: {e}")
             return None
     
     def _download_image_from_url_sized(self, pokemon_name, sprite_url, size):
         """Download a Pokémon sprite image from remote URL with specific size as fallback"""
         try:
-            print(f"📥 Downloading image for {pokemon_name} from remote URL...")
+            # Sprites downloaded on a previous launch are served from disk
+            cache_key = self.disk_cache.url_key(sprite_url)
+            cached_image = self.disk_cache.get(cache_key, size)
+            if cached_image:
+                return cached_image
+            
+            # Only needed for sprites that aren't bundled, so kept off the startup path
+            import requests
+            
+            count('sprite.download')
+            
+            log.info(f"📥 Downloading image for {pokemon_name} from remote URL...")
             response = requests.get(sprite_url, timeout=10)
             response.raise_for_status()
             
@@ -148,7 +199,7 @@ class ImageLoader:
                     
                     image = Image.open(tmp_path)
                     os.unlink(tmp_path)  # Clean up
-                    print(f"⚠️ Used fallback method for {pokemon_name}")
+                    log.warning(f"⚠️ Used fallback method for {pokemon_name}")
                 except Exception as e2:
                     # Approach 3: Try with PIL's load_truncated_images option
                     try:
@@ -156,9 +207,9 @@ class ImageLoader:
                         bio = BytesIO(response.content)
                         bio.seek(0)
                         image = Image.open(bio)
-                        print(f"⚠️ Used truncated image loading for {pokemon_name}")
+                        log.warning(f"⚠️ Used truncated image loading for {pokemon_name}")
                     except Exception as e3:
-                        print(f"❌ All methods failed for {pokemon_name}: {e3}")
+                        log.error(f"❌ All methods failed for {pokemon_name}: {e3}")
                         return None
             
             if image:
@@ -169,8 +220,9 @@ class ImageLoader:
                 if image.mode != 'RGBA':
                     image = image.convert('RGBA')
                 
-                return ImageTk.PhotoImage(image)
+                self.disk_cache.put(cache_key, size, image)
+                return image
             
         except Exception as e:
-            print(f"❌ Error downloading image for {pokemon_name}: {e}")
+            log.error(f"❌ Error downloading image for {pokemon_name}: {e}")
             return None
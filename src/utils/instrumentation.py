@@ -0,0 +1,160 @@
+"""
+Hot-path timing and counters for the Pokemon Guess Game
+
+Timers keep their last WINDOW durations for rolling percentiles, plus running
+totals; counters are plain totals. Both are cheap enough to leave on:
+
+    with timed('fuzzy_search'):
+        ...
+
+    @timed('create_grid')
+    def create_grid(...):
+        ...
+
+    count('sprite.download')
+
+The game shows them on an overlay (F12) and writes them to JSON on exit.
+"""
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+WINDOW = 1000
+LOG_LEVEL_ENV = 'WYP_LOG_LEVEL'
+
+
+def configure_logging(level=None):
+    """
+    Send the game's log messages to the console. The level comes from the
+    argument, else the WYP_LOG_LEVEL environment variable, else INFO;
+    DEBUG adds the per-grid and per-screen detail.
+    """
+    level = (level or os.environ.get(LOG_LEVEL_ENV) or 'INFO')
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            level = logging.INFO
+    logging.basicConfig(format='%(message)s')
+    logging.getLogger().setLevel(level)
+    return level
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list (0.0 when empty)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class _Timer:
+    """What timed() returns: a context manager, and a decorator timing each call"""
+
+    __slots__ = ('metrics', 'name', 'start')
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.record(self.name, time.perf_counter() - self.start)
+        return False
+
+    def __call__(self, func):
+        metrics, name = self.metrics, self.name
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.record(name, time.perf_counter() - start)
+        return wrapper
+
+
+class Metrics:
+    """Named timers and counters, safe to update from worker threads"""
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._timers = {}    # name -> [calls, total seconds, max seconds, recent seconds]
+        self._counters = {}  # name -> total
+
+    def timed(self, name):
+        """Time a block (`with`) or every call of a function (decorator) under `name`"""
+        return _Timer(self, name)
+
+    def record(self, name, seconds):
+        """Add one duration to a timer"""
+        if not self.enabled:
+            return
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                timer = self._timers[name] = [0, 0.0, 0.0, deque(maxlen=self.window)]
+            timer[0] += 1
+            timer[1] += seconds
+            if seconds > timer[2]:
+                timer[2] = seconds
+            timer[3].append(seconds)
+
+    def count(self, name, amount=1):
+        """Add to a counter"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def snapshot(self):
+        """
+        {'timers': {name: {calls, total_ms, avg_ms, p50_ms, p99_ms, max_ms}},
+        'counters': {name: total}}, percentiles over the last `window` calls
+        """
+        with self._lock:
+            timers = {name: (calls, total, slowest, sorted(recent))
+                      for name, (calls, total, slowest, recent) in self._timers.items()}
+            counters = dict(self._counters)
+        return {
+            'timers': {
+                name: {
+                    'calls': calls,
+                    'total_ms': total * 1000,
+                    'avg_ms': total * 1000 / calls,
+                    'p50_ms': percentile(recent, 0.5) * 1000,
+                    'p99_ms': percentile(recent, 0.99) * 1000,
+                    'max_ms': slowest * 1000,
+                }
+                for name, (calls, total, slowest, recent) in sorted(timers.items())
+            },
+            'counters': dict(sorted(counters.items())),
+        }
+
+    def reset(self):
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+
+    def dump_json(self, path):
+        """Write a snapshot to `path` and return it"""
+        snapshot = self.snapshot()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'written': time.time(), **snapshot}, f, indent=2)
+        return snapshot
+
+
+# The game's shared registry
+metrics = Metrics()
+timed = metrics.timed
+count = metrics.count
@@ -0,0 +1,98 @@
+"""
+Logo and icon cache for the Pokemon Guess Game
+
+Fixed UI art (screen logos, the pokeball tile, the X overlay) is shown at a
+handful of known sizes. build_scaled_logos() resizes each one to those sizes
+at build time, so at runtime a logo is a PNG open with no resampling, and
+LogoCache keeps every converted image so it is only opened once per size.
+"""
+import os
+from PIL import Image, ImageTk
+from .resource_path import get_resource_path
+
+SCALED_LOGO_DIR = 'assets/scaled'
+
+# filename -> every (max_width, max_height) box the screens ask for
+LOGO_SIZES = {
+    'whos-your-pokemon-logo.png': [(600, 200), (400, 80)],  # Startup and game screens
+    'game-settings-logo.png': [(500, 80)],
+    'player-setup-logo.png': [(500, 120)],
+    'pokemon-grid-setup-logo.png': [(500, 80)],
+    'game-over-logo.png': [(500, 120)],
+    'pokeball.png': [(80, 80)],  # Empty grid setup tiles
+    'x_icon.png': [(96, 96)],  # Elimination overlay
+}
+
+
+def fit_size(size, max_width, max_height):
+    """Largest size with the same aspect ratio that fits within the box"""
+    width, height = size
+    scale_factor = min(max_width / width, max_height / height)
+    return int(width * scale_factor), int(height * scale_factor)
+
+
+def scaled_logo_name(filename, max_width, max_height):
+    """File name of a logo pre-scaled to fit a box"""
+    stem, extension = os.path.splitext(filename)
+    return f"{stem}-{max_width}x{max_height}{extension}"
+
+
+def build_scaled_logos(asset_dir, output_dir, sizes=LOGO_SIZES):
+    """
+    Write every logo in `sizes` resized to each of its boxes into output_dir
+    Returns the number of scaled images written
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    count = 0
+    for filename, boxes in sizes.items():
+        with Image.open(os.path.join(asset_dir, filename)) as source:
+            source.load()
+            for max_width, max_height in boxes:
+                # Same resampling load_logo_image used at runtime, done once here
+                image = source.resize(fit_size(source.size, max_width, max_height), Image.Resampling.LANCZOS)
+                path = os.path.join(output_dir, scaled_logo_name(filename, max_width, max_height))
+                temp_path = f"{path}.tmp"
+                image.save(temp_path, 'PNG', optimize=True)
+                os.replace(temp_path, path)
+                count += 1
+    return count
+
+
+class LogoCache:
+    """Converted logos keyed by (filename, max_width, max_height), preferring pre-scaled files"""
+
+    def __init__(self, asset_dir='assets', scaled_dir=SCALED_LOGO_DIR, to_photo=ImageTk.PhotoImage):
+        self.asset_dir = asset_dir
+        self.scaled_dir = scaled_dir
+        self.to_photo = to_photo
+        self.images = {}
+        self.hits = 0
+        self.misses = 0
+        self.resampled = 0  # Misses that had no pre-scaled file and were resized here
+
+    def load_image(self, filename, max_width, max_height):
+        """The logo fitted to the box as a PIL image, resizing only if it wasn't pre-scaled"""
+        scaled_path = get_resource_path(os.path.join(self.scaled_dir, scaled_logo_name(filename, max_width, max_height)))
+        if os.path.exists(scaled_path):
+            with Image.open(scaled_path) as image:
+                image.load()
+                return image
+
+        self.resampled += 1
+        with Image.open(get_resource_path(os.path.join(self.asset_dir, filename))) as image:
+            return image.resize(fit_size(image.size, max_width, max_height), Image.Resampling.LANCZOS)
+
+    def get(self, filename, max_width, max_height):
+        """The logo fitted to the box, converted once and shared afterwards"""
+        key = (filename, max_width, max_height)
+        photo = self.images.get(key)
+        if photo is not None:
+            self.hits += 1
+            return photo
+
+        self.misses += 1
+        photo = self.images[key] = self.to_photo(self.load_image(filename, max_width, max_height))
+        return photo
+
+    def stats(self):
+        return {'entries': len(self.images), 'hits': self.hits, 'misses': self.misses, 'resampled': self.resampled}
@@ -2,6 +2,7 @@
 Cross-platform utilities for the Pokemon Guess Game
 Handles platform-specific differences in functionality
 """
+import os
 import platform
 import tkinter as tk
 
@@ -19,6 +20,54 @@ def get_platform_info():
     }
 
 
+def get_user_cache_dir(*subdirs):
+    """
+    Get the per-user cache directory for the game, following platform conventions
+    
+    Args:
+        *subdirs: Optional path components appended to the cache directory
+    
+    Returns:
+        Absolute path (not created)
+    """
+    platform_info = get_platform_info()
+    
+    if platform_info['is_windows']:
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+        cache_dir = os.path.join(base, 'WhosYourPokemon', 'Cache')
+    elif platform_info['is_macos']:
+        cache_dir = os.path.join(os.path.expanduser('~/Library/Caches'), 'WhosYourPokemon')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+        cache_dir = os.path.join(base, 'whos-your-pokemon')
+    
+    return os.path.join(cache_dir, *subdirs)
+
+
+def get_user_data_dir(*subdirs):
+    """
+    Get the per-user data directory for files worth keeping (unlike the cache)
+    
+    Args:
+        *subdirs: Optional path components appended to the data directory
+    
+    Returns:
+        Absolute path (not created)
+    """
+    platform_info = get_platform_info()
+    
+    if platform_info['is_windows']:
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~\\AppData\\Local')
+        data_dir = os.path.join(base, 'WhosYourPokemon', 'Data')
+    elif platform_info['is_macos']:
+        data_dir = os.path.join(os.path.expanduser('~/Library/Application Support'), 'WhosYourPokemon')
+    else:
+        base = os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share')
+        data_dir = os.path.join(base, 'whos-your-pokemon')
+    
+    return os.path.join(data_dir, *subdirs)
+
+
 def bind_mousewheel(widget, callback):
     """
     Bind mouse wheel events across platforms
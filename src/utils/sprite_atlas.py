@@ -0,0 +1,136 @@
+"""
+Packed sprite atlas for the Pokemon Guess Game
+
+The atlas is one file holding every Pokemon sprite already resized to the
+sizes the game displays, so a lookup is a dict access and a slice of a
+memory-mapped file instead of a filesystem probe, PNG open and resize.
+
+File layout:
+    magic (8 bytes) | version (uint16) | index length (uint32) | index JSON | sprite blobs
+The index maps "WxH" -> {lowercased sprite name: [offset, length]}, with
+offsets relative to the start of the blob section. Each blob is the sprite's
+raw RGBA pixels, zlib-compressed, so reading one is an inflate and a buffer
+wrap with no PNG parsing.
+"""
+import json
+import logging
+import mmap
+import os
+import struct
+import zlib
+from io import BytesIO
+from PIL import Image
+from .resource_path import get_resource_path
+
+log = logging.getLogger(__name__)
+
+ATLAS_FILE = 'assets/sprite_atlas.bin'
+ATLAS_MAGIC = b'WYPATLAS'
+ATLAS_VERSION = 1
+ATLAS_SIZES = [(96, 96), (64, 64)]  # Grid tiles and autocomplete suggestions
+
+_HEADER = struct.Struct('<8sHI')
+
+
+def size_key(size):
+    """Index key for a sprite size"""
+    return f"{size[0]}x{size[1]}"
+
+
+def sprite_keys(pokemon_name):
+    """Names a sprite may be stored under, matching the local filename variants"""
+    lowered = pokemon_name.lower()
+    return [
+        lowered,
+        lowered.replace(' ', '_').replace('.', '').replace("'", ''),
+        lowered.replace(' ', '-').replace('.', '').replace("'", '')
+    ]
+
+
+class SpriteAtlas:
+    """Read-only view of a packed sprite atlas file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, index_length = _HEADER.unpack_from(self._data, 0)
+            if magic != ATLAS_MAGIC or version != ATLAS_VERSION:
+                raise ValueError(f"Unsupported sprite atlas format in {path}")
+
+            index_start = _HEADER.size
+            self.index = json.loads(self._data[index_start:index_start + index_length].decode('utf-8'))
+            self._blob_start = index_start + index_length
+        except Exception:
+            self._file.close()
+            raise
+
+    @classmethod
+    def load(cls, relative_path=ATLAS_FILE):
+        """Open the bundled atlas, or return None if it hasn't been built"""
+        path = get_resource_path(relative_path)
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls(path)
+        except Exception as e:
+            log.warning(f"⚠️ Could not open sprite atlas: {e}")
+            return None
+
+    def sprite_count(self, size):
+        """Number of sprites stored at a size"""
+        return len(self.index.get(size_key(size), {}))
+
+    def get_image(self, pokemon_name, size):
+        """Slice a sprite out of the atlas as an RGBA PIL image, or None if absent"""
+        entries = self.index.get(size_key(size))
+        if not entries:
+            return None
+
+        for key in sprite_keys(pokemon_name):
+            entry = entries.get(key)
+            if entry:
+                offset, length = entry
+                start = self._blob_start + offset
+                pixels = zlib.decompress(self._data[start:start + length])
+                return Image.frombuffer('RGBA', tuple(size), pixels, 'raw', 'RGBA', 0, 1)
+        return None
+
+    def close(self):
+        """Release the memory map and file handle"""
+        self._data.close()
+        self._file.close()
+
+
+def build_sprite_atlas(image_dir, output_path, sizes=ATLAS_SIZES):
+    """
+    Pack every PNG in image_dir into an atlas file at each of the given sizes
+    Returns the number of sprites packed
+    """
+    filenames = sorted(f for f in os.listdir(image_dir) if f.lower().endswith('.png'))
+
+    index = {size_key(size): {} for size in sizes}
+    blobs = BytesIO()
+
+    for filename in filenames:
+        key = os.path.splitext(filename)[0].lower()
+        with Image.open(os.path.join(image_dir, filename)) as source:
+            source = source.convert('RGBA')
+            for size in sizes:
+                # Same resampling the loader uses at runtime, done once here
+                image = source if source.size == size else source.resize(size, Image.Resampling.LANCZOS)
+                offset = blobs.tell()
+                blobs.write(zlib.compress(image.tobytes()))
+                index[size_key(size)][key] = [offset, blobs.tell() - offset]
+
+    index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+
+    temp_path = f"{output_path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(_HEADER.pack(ATLAS_MAGIC, ATLAS_VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        f.write(blobs.getbuffer())
+    os.replace(temp_path, output_path)
+
+    return len(filenames)
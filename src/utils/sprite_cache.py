@@ -0,0 +1,153 @@
+"""
+Bounded sprite cache for the Pokemon Guess Game
+"""
+from collections import OrderedDict
+
+BYTES_PER_PIXEL = 4  # Sprites are held as RGBA
+
+DEFAULT_TIER_BUDGETS = {
+    (96, 96): 8 * 1024 * 1024,  # Grid tiles - roughly 225 sprites
+    (64, 64): 4 * 1024 * 1024   # Autocomplete suggestions - roughly 255 sprites
+}
+DEFAULT_BUDGET = 4 * 1024 * 1024  # Any other size
+
+
+def sprite_bytes(size):
+    """Approximate memory held by one sprite of the given size"""
+    return size[0] * size[1] * BYTES_PER_PIXEL
+
+
+class _CacheTier:
+    """Least-recently-used entries for a single sprite size"""
+
+    def __init__(self, size, budget_bytes):
+        self.size = size
+        self.budget_bytes = budget_bytes
+        self.entries = OrderedDict()  # pokemon_name -> image, oldest first
+        self.pinned = set()
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        return {
+            'entries': len(self.entries),
+            'pinned': len(self.pinned & self.entries.keys()),
+            'bytes': self.used_bytes,
+            'budget_bytes': self.budget_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+
+class SpriteCache:
+    """
+    Size-aware LRU cache for converted sprites.
+
+    Each sprite size gets its own tier with its own byte budget, so browsing
+    autocomplete suggestions can't push grid sprites out. Pinned entries
+    (the sprites on the visible grids) are never evicted; if they alone
+    exceed a budget the tier is allowed to overflow until they are unpinned.
+    """
+
+    def __init__(self, tier_budgets=None, default_budget=DEFAULT_BUDGET):
+        self.tier_budgets = dict(DEFAULT_TIER_BUDGETS if tier_budgets is None else tier_budgets)
+        self.default_budget = default_budget
+        self.tiers = {}
+
+    def _tier(self, size):
+        size = tuple(size)
+        tier = self.tiers.get(size)
+        if tier is None:
+            tier = _CacheTier(size, self.tier_budgets.get(size, self.default_budget))
+            self.tiers[size] = tier
+        return tier
+
+    def get(self, pokemon_name, size):
+        """Return a cached sprite and mark it recently used, or None"""
+        tier = self._tier(size)
+        image = tier.entries.get(pokemon_name)
+        if image is None:
+            tier.misses += 1
+            return None
+
+        tier.entries.move_to_end(pokemon_name)
+        tier.hits += 1
+        return image
+
+    def put(self, pokemon_name, size, image):
+        """Cache a sprite, evicting the least recently used unpinned ones if over budget"""
+        tier = self._tier(size)
+        if pokemon_name in tier.entries:
+            tier.entries.move_to_end(pokemon_name)
+        else:
+            tier.used_bytes += sprite_bytes(tier.size)
+        tier.entries[pokemon_name] = image
+        self._evict(tier)
+
+    def __contains__(self, key):
+        pokemon_name, size = key
+        tier = self.tiers.get(tuple(size))
+        return tier is not None and pokemon_name in tier.entries
+
+    def pin(self, pokemon_names, size):
+        """Keep the given sprites cached until they are unpinned"""
+        self._tier(size).pinned.update(pokemon_names)
+
+    def unpin(self, pokemon_names, size):
+        """Allow the given sprites to be evicted again"""
+        tier = self._tier(size)
+        tier.pinned.difference_update(pokemon_names)
+        self._evict(tier)
+
+    def set_pinned(self, pokemon_names, size):
+        """Replace the pinned sprites of a size, e.g. when new grids are dealt"""
+        tier = self._tier(size)
+        tier.pinned = set(pokemon_names)
+        self._evict(tier)
+
+    def clear(self):
+        """Drop every cached sprite (pins and statistics are kept)"""
+        for tier in self.tiers.values():
+            tier.entries.clear()
+            tier.used_bytes = 0
+
+    def memory_usage(self, size=None):
+        """Bytes held by one tier, or by all tiers"""
+        if size is not None:
+            tier = self.tiers.get(tuple(size))
+            return tier.used_bytes if tier else 0
+        return sum(tier.used_bytes for tier in self.tiers.values())
+
+    def stats(self, size=None):
+        """Hit/miss/eviction counters for one tier, or totals across all tiers"""
+        if size is not None:
+            return self._tier(size).stats()
+
+        totals = {'entries': 0, 'pinned': 0, 'bytes': 0, 'budget_bytes': 0,
+                  'hits': 0, 'misses': 0, 'evictions': 0}
+        for tier in self.tiers.values():
+            for key, value in tier.stats().items():
+                totals[key] += value
+        return totals
+
+    def __len__(self):
+        return sum(len(tier.entries) for tier in self.tiers.values())
+
+    def _evict(self, tier):
+        """Drop least recently used unpinned entries until the tier fits its budget"""
+        if tier.used_bytes <= tier.budget_bytes:
+            return
+
+        entry_bytes = sprite_bytes(tier.size)
+        for pokemon_name in list(tier.entries):
+            if tier.used_bytes <= tier.budget_bytes:
+                break
+            if pokemon_name in tier.pinned:
+                continue
+            # Widgets still showing the image keep their own reference to it
+            del tier.entries[pokemon_name]
+            tier.used_bytes -= entry_bytes
+            tier.evictions += 1
@@ -0,0 +1,135 @@
+"""
+Persistent cache of resized sprites for the Pokemon Guess Game
+
+Resized sprites are written to the user cache directory as zlib-compressed
+raw RGBA, named by a hash of their source and the target size. Local
+sprites are keyed by a SHA-1 of the file's contents and downloaded ones by
+a SHA-1 of their URL, so a later launch skips both the LANCZOS resize and
+the network request.
+
+Hashing a file means reading it, so the hash is remembered in a small
+manifest together with the file's mtime and size; as long as those still
+match, the hash is reused without opening the file.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import zlib
+from PIL import Image
+from .platform_utils import get_user_cache_dir
+
+log = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+MANIFEST_FILE = 'sources.json'
+
+
+class SpriteDiskCache:
+    """Resized-sprite store shared by every launch of the game"""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or get_user_cache_dir('sprites', f'v{CACHE_VERSION}')
+        self.manifest_path = os.path.join(self.cache_dir, MANIFEST_FILE)
+        self._lock = threading.Lock()
+        self._sources = {}  # source path -> [mtime_ns, size, sha1]
+        self._dirty = False
+        self.enabled = True
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        except OSError as e:
+            log.warning(f"⚠️ Sprite disk cache disabled: {e}")
+            self.enabled = False
+            return
+
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self._sources = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            log.warning(f"⚠️ Ignoring unreadable sprite cache manifest: {e}")
+
+    def file_key(self, path):
+        """Content hash of a source file, reusing the stored hash while mtime and size match"""
+        if not self.enabled:
+            return None
+
+        stat = os.stat(path)
+        with self._lock:
+            entry = self._sources.get(path)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        with open(path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+
+        with self._lock:
+            self._sources[path] = [stat.st_mtime_ns, stat.st_size, digest]
+            self._dirty = True
+        return digest
+
+    def url_key(self, url):
+        """Hash identifying a downloaded sprite"""
+        if not self.enabled:
+            return None
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def get(self, key, size):
+        """Return the cached RGBA image for a key and size, or None"""
+        if not key:
+            return None
+
+        try:
+            with open(self._blob_path(key, size), 'rb') as f:
+                pixels = zlib.decompress(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, zlib.error) as e:
+            log.warning(f"⚠️ Discarding corrupt cached sprite {key}: {e}")
+            return None
+
+        if len(pixels) != size[0] * size[1] * 4:
+            return None
+        return Image.frombuffer('RGBA', tuple(size), pixels, 'raw', 'RGBA', 0, 1)
+
+    def put(self, key, size, image):
+        """Store a resized image; failures only cost a resize on the next launch"""
+        if not key:
+            return
+
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+
+        path = self._blob_path(key, size)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(zlib.compress(image.tobytes()))
+            os.replace(temp_path, path)
+        except OSError as e:
+            log.warning(f"⚠️ Could not cache sprite {key}: {e}")
+
+    def save(self):
+        """Write the source manifest if it changed, dropping sources that no longer exist"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            sources = {path: entry for path, entry in self._sources.items() if os.path.exists(path)}
+            self._dirty = False
+
+        temp_path = f"{self.manifest_path}.tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(sources, f, separators=(',', ':'))
+            os.replace(temp_path, self.manifest_path)
+        except OSError as e:
+            log.warning(f"⚠️ Could not save sprite cache manifest: {e}")
+
+    def _blob_path(self, key, size):
+        return os.path.join(self.cache_dir, f"{key}_{size[0]}x{size[1]}.rgba")
@@ -0,0 +1,110 @@
+"""
+Background sprite prefetching for the Pokemon Guess Game
+"""
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from PIL import ImageTk
+
+log = logging.getLogger(__name__)
+
+
+class SpritePrefetcher:
+    """
+    Decodes and resizes sprites on a thread pool and hands them back to the
+    Tk thread, where the PhotoImage conversion has to happen.
+
+    Worker threads only produce PIL images. Results are collected on a queue
+    that a root.after poll drains on the main thread, so Tk is never touched
+    off the main thread.
+    """
+
+    def __init__(self, image_loader, max_workers=4, poll_ms=15):
+        self.image_loader = image_loader
+        self.max_workers = max_workers
+        self.poll_ms = poll_ms
+        self._executor = None
+        self._results = queue.Queue()
+        self._in_flight = {}  # (pokemon_name, size) -> callbacks waiting on it
+        self._root = None
+        self._polling = False
+
+    def prefetch(self, root, pokemon_sprites, size=None):
+        """Start decoding (pokemon_name, sprite_url) pairs that aren't cached yet"""
+        for pokemon_name, sprite_url in pokemon_sprites:
+            self.request(root, pokemon_name, sprite_url, size=size)
+
+    def request(self, root, pokemon_name, sprite_url, callback=None, size=None):
+        """
+        Get a sprite as a PhotoImage, calling callback(photo_image) on the Tk thread.
+        Cached sprites call back immediately; otherwise the call is queued behind
+        any decode already running for the same sprite.
+        """
+        size = size or self.image_loader.image_size
+        cached = self.image_loader.get_cached_image(pokemon_name, size)
+        if cached is not None:
+            if callback:
+                callback(cached)
+            return
+
+        key = (pokemon_name, size)
+        if key in self._in_flight:
+            if callback:
+                self._in_flight[key].append(callback)
+            return
+
+        self._in_flight[key] = [callback] if callback else []
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='sprite-prefetch')
+        self._executor.submit(self._decode, pokemon_name, sprite_url, size)
+        self._start_polling(root)
+
+    def is_idle(self):
+        """Check whether no sprites are waiting to be delivered"""
+        return not self._in_flight
+
+    def shutdown(self):
+        """Stop the worker threads, dropping sprites that haven't started"""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._in_flight.clear()
+
+    def _decode(self, pokemon_name, sprite_url, size):
+        """Worker thread: produce a PIL image and queue it for the Tk thread"""
+        try:
+            image = self.image_loader.load_pil_image(pokemon_name, sprite_url, size)
+        except Exception as e:
+            log.error(f"❌ Error prefetching image for {pokemon_name}: {e}")
+            image = None
+        self._results.put((pokemon_name, size, image))
+
+    def _start_polling(self, root):
+        """Make sure the Tk thread is draining results"""
+        self._root = root
+        if not self._polling:
+            self._polling = True
+            root.after(self.poll_ms, self._drain_results)
+
+    def _drain_results(self):
+        """Tk thread: convert finished sprites and run their callbacks"""
+        while True:
+            try:
+                pokemon_name, size, image = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            callbacks = self._in_flight.pop((pokemon_name, size), [])
+            if image is None:
+                log.error(f"❌ Failed to load image for {pokemon_name}")
+                continue
+
+            photo_image = ImageTk.PhotoImage(image)
+            self.image_loader.store_image(pokemon_name, size, photo_image)
+            for callback in callbacks:
+                callback(photo_image)
+
+        if self._in_flight:
+            self._root.after(self.poll_ms, self._drain_results)
+        else:
+            self._polling = False
@@ -3,5 +3,7 @@ Widgets package for Pokemon Guess Game
 """
 
 from .autocomplete_entry import AutocompleteEntry
+from .suggestion_pool import SuggestionRowPool
+from .timing_overlay import TimingOverlay
 
-__all__ = ['AutocompleteEntry']
+__all__ = ['AutocompleteEntry', 'SuggestionRowPool', 'TimingOverlay']
@@ -3,7 +3,9 @@ Autocomplete Entry widget for Pokemon Guess Game
 """
 import tkinter as tk
 from tkinter import ttk
-from ..utils import bind_mousewheel, get_entry_font, get_body_font
+from ..utils import bind_mousewheel, get_entry_font, get_body_font, Debouncer, timed
+from ..data import PokemonSearchIndex
+from .suggestion_pool import SuggestionRowPool
 
 
 class AutocompleteEntry(tk.Frame):
@@ -16,6 +18,10 @@ class AutocompleteEntry(tk.Frame):
         self.values = values
         self.image_loader = image_loader
         self.data_manager = data_manager
+        self.search_index = None
+        self.allowed_values = None
+        self.configure_search(values)
+        self.debouncer = Debouncer(self, delay_ms=100)
         self.var = tk.StringVar()
         self.var.trace('w', self.on_text_changed)
         
@@ -80,7 +86,20 @@ class AutocompleteEntry(tk.Frame):
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
         
-        # Store suggestion items for interaction
+        # Reusable suggestion rows - refilled in place on every search
+        self.suggestion_pool = SuggestionRowPool(
+            self.scrollable_frame,
+            size=8,
+            on_select=self.select_item_by_index,
+            on_enter=self.highlight_item,
+            on_leave=self.unhighlight_item,
+            font=get_body_font(),
+            image_loader=self.image_loader,
+            data_manager=self.data_manager,
+            show_sprites=True
+        )
+        
+        # Currently visible suggestion rows
         self.suggestion_items = []
         
         # Bind events
@@ -100,156 +119,56 @@ class AutocompleteEntry(tk.Frame):
         self.selection_made = False  # Track if user made a selection
         self.selected_index = -1  # Track selected suggestion
     
-    def fuzzy_search(self, query, items):
+    def configure_search(self, values):
+        """Point the fuzzy search at the shared index, restricted to values"""
+        index = self.data_manager.get_search_index() if self.data_manager else None
+        allowed = set(values)
+        
+        if index is None or not allowed.issubset(index.name_set):
+            # Values outside the roster get their own index
+            self.search_index = PokemonSearchIndex(values)
+            self.allowed_values = None
+        else:
+            self.search_index = index
+            self.allowed_values = None if len(allowed) == len(index) else allowed
+    
+    @timed('fuzzy_search')
+    def fuzzy_search(self, query):
         """
-        Perform fuzzy search on items based on query
+        Perform fuzzy search on the values based on query
         Returns list of items that match the query
         """
-        if not query:
-            return []
-        
-        query = query.lower()
-        matches = []
-        
-        for item in items:
-            item_lower = item.lower()
-            
-            # Exact match gets highest priority
-            if item_lower == query:
-                matches.insert(0, item)
-            # Starts with query gets second priority
-            elif item_lower.startswith(query):
-                matches.append(item)
-            # Contains query gets third priority
-            elif query in item_lower:
-                matches.append(item)
-            # Fuzzy match - all characters of query appear in order
-            else:
-                query_index = 0
-                for char in item_lower:
-                    if query_index < len(query) and char == query[query_index]:
-                        query_index += 1
-                
-                if query_index == len(query):
-                    matches.append(item)
-        
-        return matches[:8]  # Limit to 8 suggestions for better UI
+        # Limit to 8 suggestions for better UI
+        return self.search_index.search(query, limit=8, allowed=self.allowed_values)
         
     def on_mousewheel_cross_platform(self, direction):
         """Handle mouse wheel scrolling cross-platform"""
         # Scroll the canvas based on direction
         self.canvas.yview_scroll(-direction, "units")
     
-    def create_pokemon_suggestion_item(self, parent, pokemon_name, index):
-        """Create a single Pokemon suggestion item with sprite"""
-        # Main container frame - fill entire width
-        item_frame = tk.Frame(
-            parent,
-            bg='#cccccc',
-            relief='flat',
-            borderwidth=0,
-            cursor='hand2'
-        )
-        item_frame.pack(fill='both', expand=True, padx=0, pady=1)
-        
-        # Configure grid weights to fill width properly
-        item_frame.grid_columnconfigure(0, weight=1)
-        item_frame.grid_columnconfigure(1, weight=0)
-        
-        # Pokemon name label (left side) - expand to fill available space
-        name_label = tk.Label(
-            item_frame,
-            text=pokemon_name,
-            font=get_body_font(),
-            fg='#222222',
-            bg='#cccccc',
-            anchor='w',
-            padx=10,
-            pady=5
-        )
-        name_label.grid(row=0, column=0, sticky='ew')
-        
-        # Pokemon sprite container (right side) - fixed size at the right edge
-        sprite_container = tk.Frame(
-            item_frame,
-            bg='#999999',  # Grey background
-            relief='solid',
-            borderwidth=1,  # Black border
-            width=68,  # 64px + 2px padding on each side
-            height=68
-        )
-        sprite_container.grid(row=0, column=1, padx=(5, 5), pady=2, sticky='e')
-        sprite_container.grid_propagate(False)
-        
-        # Pokemon sprite label
-        sprite_label = tk.Label(
-            sprite_container,
-            bg='#999999',
-            borderwidth=0,
-            highlightthickness=0
-        )
-        sprite_label.pack(expand=True)
-        
-        # Load Pokemon sprite if available
-        if self.image_loader and self.data_manager:
-            sprite_url = self.data_manager.get_pokemon_sprite_url(pokemon_name)
-            if sprite_url:
-                image = self.image_loader.load_pokemon_image_autocomplete(pokemon_name, sprite_url)
-                if image:
-                    sprite_label.configure(image=image)
-                    sprite_label.image = image  # Keep reference
-        
-        # Bind click events to all components
-        def on_click(event):
-            self.select_item_by_index(index)
-        
-        def on_enter(event):
-            self.highlight_item(index)
-        
-        def on_leave(event):
-            self.unhighlight_item(index)
-        
-        # Bind events to all widgets in the item
-        for widget in [item_frame, name_label, sprite_container, sprite_label]:
-            widget.bind('<Button-1>', on_click)
-            widget.bind('<Enter>', on_enter)
-            widget.bind('<Leave>', on_leave)
-        
-        return {
-            'frame': item_frame,
-            'name_label': name_label,
-            'sprite_container': sprite_container,
-            'sprite_label': sprite_label,
-            'pokemon_name': pokemon_name
-        }
-    
     def highlight_item(self, index):
         """Highlight a suggestion item"""
         if 0 <= index < len(self.suggestion_items):
             self.selected_index = index
-            item = self.suggestion_items[index]
             # Change background to selection color
-            item['frame'].configure(bg='#3d7dca')
-            item['name_label'].configure(bg='#3d7dca', fg='white')
+            self.suggestion_items[index].set_highlighted(True)
             
             # Unhighlight all other items
             for i, other_item in enumerate(self.suggestion_items):
                 if i != index:
-                    other_item['frame'].configure(bg='#cccccc')
-                    other_item['name_label'].configure(bg='#cccccc', fg='#222222')
+                    other_item.set_highlighted(False)
     
     def unhighlight_item(self, index):
         """Remove highlight from a suggestion item"""
         if 0 <= index < len(self.suggestion_items):
-            item = self.suggestion_items[index]
             if self.selected_index != index:
-                item['frame'].configure(bg='#cccccc')
-                item['name_label'].configure(bg='#cccccc', fg='#222222')
+                self.suggestion_items[index].set_highlighted(False)
     
     def select_item_by_index(self, index):
         """Select an item by its index"""
         if 0 <= index < len(self.suggestion_items):
-            pokemon_name = self.suggestion_items[index]['pokemon_name']
+            pokemon_name = self.suggestion_items[index].pokemon_name
+            self.debouncer.cancel()
             self.selecting_from_list = True
             self.var.set(pokemon_name)
             self.selecting_from_list = False
@@ -266,9 +185,18 @@ class AutocompleteEntry(tk.Frame):
         # Don't show suggestions if user made a selection and hasn't typed since
         if self.selection_made:
             return
-            
-        query = self.var.get()
-        matches = self.fuzzy_search(query, self.values)
+        
+        # Coalesce bursts of typing into a single search and render
+        self.debouncer.schedule(self.refresh_suggestions, self.var.get())
+    
+    def refresh_suggestions(self, query):
+        """Search and render suggestions for a query queued by on_text_changed"""
+        if query != self.var.get() or self.selection_made:
+            # The text moved on since this search was queued
+            self.debouncer.mark_stale()
+            return
+        
+        matches = self.fuzzy_search(query)
         
         if matches and len(query) > 0:
             self.show_suggestions(matches)
@@ -282,15 +210,8 @@ class AutocompleteEntry(tk.Frame):
     
     def show_suggestions(self, matches):
         """Show the suggestions with Pokemon sprites"""
-        # Clear existing suggestions
-        for child in self.scrollable_frame.winfo_children():
-            child.destroy()
-        self.suggestion_items.clear()
-        
-        # Create new suggestion items
-        for i, pokemon_name in enumerate(matches):
-            item = self.create_pokemon_suggestion_item(self.scrollable_frame, pokemon_name, i)
-            self.suggestion_items.append(item)
+        # Refill the pooled rows in place instead of rebuilding them
+        self.suggestion_items = self.suggestion_pool.show(matches)
         
         # Show suggestions frame
         if not self.suggestions_visible:
@@ -347,6 +268,7 @@ class AutocompleteEntry(tk.Frame):
     
     def on_down_arrow(self, event):
         """Handle down arrow key - navigate suggestions"""
+        self.debouncer.flush()  # Render any search still waiting on the debounce
         if self.suggestions_visible and len(self.suggestion_items) > 0:
             next_index = 0 if self.selected_index == -1 else min(self.selected_index + 1, len(self.suggestion_items) - 1)
             self.highlight_item(next_index)
@@ -354,6 +276,7 @@ class AutocompleteEntry(tk.Frame):
     
     def on_up_arrow(self, event):
         """Handle up arrow key - navigate suggestions"""
+        self.debouncer.flush()  # Render any search still waiting on the debounce
         if self.suggestions_visible and len(self.suggestion_items) > 0:
             prev_index = len(self.suggestion_items) - 1 if self.selected_index == -1 else max(self.selected_index - 1, 0)
             self.highlight_item(prev_index)
@@ -361,6 +284,7 @@ class AutocompleteEntry(tk.Frame):
     
     def on_enter(self, event):
         """Handle enter key - select current item"""
+        self.debouncer.flush()  # Render any search still waiting on the debounce
         if self.suggestions_visible:
             if self.selected_index >= 0:
                 self.select_item_by_index(self.selected_index)
@@ -372,10 +296,16 @@ class AutocompleteEntry(tk.Frame):
     
     def on_tab(self, event):
         """Handle tab key - select first suggestion"""
+        self.debouncer.flush()  # Render any search still waiting on the debounce
         if self.suggestions_visible and len(self.suggestion_items) > 0:
             self.select_item_by_index(0)
             return 'break'
     
+    def destroy(self):
+        """Cancel pending searches before the widget goes away"""
+        self.debouncer.cancel()
+        super().destroy()
+    
     def get(self):
         """Get the current value"""
         return self.var.get()
@@ -383,3 +313,14 @@ class AutocompleteEntry(tk.Frame):
     def set(self, value):
         """Set the current value"""
         self.var.set(value)
+    
+    def reset(self, values):
+        """Clear the entry and search a new set of values, so a retained screen can reuse it"""
+        self.debouncer.cancel()
+        self.hide_suggestions()
+        self.values = values
+        self.configure_search(values)
+        self.selection_made = False
+        self.selecting_from_list = True  # Clearing the text shouldn't queue a search
+        self.var.set("")
+        self.selecting_from_list = False
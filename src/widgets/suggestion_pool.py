@@ -0,0 +1,157 @@
+"""
+Reusable suggestion rows for the autocomplete widgets
+"""
+import tkinter as tk
+
+
+class SuggestionRow:
+    """
+    A single suggestion row whose widgets and bindings are created once
+    and then updated in place for each new suggestion
+    """
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.index = index
+        self.pokemon_name = None
+        self.visible = False
+
+        self.frame = tk.Frame(
+            pool.parent,
+            bg=pool.bg,
+            relief='flat',
+            borderwidth=0,
+            cursor='hand2'
+        )
+
+        self.name_label = tk.Label(
+            self.frame,
+            font=pool.font,
+            fg=pool.fg,
+            bg=pool.bg,
+            anchor='w',
+            padx=pool.label_padding[0],
+            pady=pool.label_padding[1]
+        )
+
+        self.sprite_container = None
+        self.sprite_label = None
+
+        if pool.show_sprites:
+            # Configure grid weights to fill width properly
+            self.frame.grid_columnconfigure(0, weight=1)
+            self.frame.grid_columnconfigure(1, weight=0)
+            self.name_label.grid(row=0, column=0, sticky='ew')
+
+            # Pokemon sprite container (right side) - fixed size at the right edge
+            self.sprite_container = tk.Frame(
+                self.frame,
+                bg='#999999',  # Grey background
+                relief='solid',
+                borderwidth=1,  # Black border
+                width=68,  # 64px + 2px padding on each side
+                height=68
+            )
+            self.sprite_container.grid(row=0, column=1, padx=(5, 5), pady=2, sticky='e')
+            self.sprite_container.grid_propagate(False)
+
+            self.sprite_label = tk.Label(
+                self.sprite_container,
+                bg='#999999',
+                borderwidth=0,
+                highlightthickness=0
+            )
+            self.sprite_label.pack(expand=True)
+        else:
+            self.name_label.pack(side='left', fill='x', expand=True)
+
+        # Bind once - the handlers look up the row's current index
+        for widget in self.widgets():
+            widget.bind('<Button-1>', lambda e: pool.on_select(self.index))
+            widget.bind('<Enter>', lambda e: pool.on_enter(self.index))
+            widget.bind('<Leave>', lambda e: pool.on_leave(self.index))
+
+    def widgets(self):
+        """All widgets that make up the row"""
+        widgets = [self.frame, self.name_label]
+        if self.sprite_container:
+            widgets.extend([self.sprite_container, self.sprite_label])
+        return widgets
+
+    def update(self, pokemon_name):
+        """Show a new suggestion in this row"""
+        self.set_highlighted(False)
+        if pokemon_name == self.pokemon_name:
+            return
+
+        self.pokemon_name = pokemon_name
+        self.name_label.configure(text=pokemon_name)
+
+        if self.sprite_label:
+            image = self.pool.load_sprite(pokemon_name)
+            self.sprite_label.configure(image=image or '')
+            self.sprite_label.image = image  # Keep reference
+
+    def set_highlighted(self, highlighted):
+        """Switch between the highlight and normal colours"""
+        if highlighted:
+            self.frame.configure(bg=self.pool.highlight_bg)
+            self.name_label.configure(bg=self.pool.highlight_bg, fg='white')
+        else:
+            self.frame.configure(bg=self.pool.bg)
+            self.name_label.configure(bg=self.pool.bg, fg=self.pool.fg)
+
+
+class SuggestionRowPool:
+    """
+    Fixed pool of suggestion rows shared by the autocomplete widgets.
+    Rows are created on first use, refilled in place and hidden with
+    pack_forget when fewer suggestions are shown.
+    """
+    def __init__(self, parent, size, on_select, on_enter=None, on_leave=None,
+                 font=None, image_loader=None, data_manager=None, show_sprites=False,
+                 highlight_bg='#3d7dca', label_padding=(10, 5), pack_options=None):
+        self.parent = parent
+        self.size = size
+        self.on_select = on_select
+        self.on_enter = on_enter or (lambda index: None)
+        self.on_leave = on_leave or (lambda index: None)
+        self.font = font
+        self.image_loader = image_loader
+        self.data_manager = data_manager
+        self.show_sprites = show_sprites
+        self.bg = '#cccccc'
+        self.fg = '#222222'
+        self.highlight_bg = highlight_bg
+        self.label_padding = label_padding
+        self.pack_options = pack_options or {'fill': 'both', 'expand': True, 'padx': 0, 'pady': 1}
+        self.rows = []
+
+    def show(self, pokemon_names):
+        """Fill rows with the given names and return the visible rows"""
+        pokemon_names = pokemon_names[:self.size]
+
+        while len(self.rows) < len(pokemon_names):
+            self.rows.append(SuggestionRow(self, len(self.rows)))
+
+        for row, pokemon_name in zip(self.rows, pokemon_names):
+            row.update(pokemon_name)
+            if not row.visible:
+                # Rows are shown and hidden from the end, so packing keeps their order
+                row.frame.pack(**self.pack_options)
+                row.visible = True
+
+        for row in self.rows[len(pokemon_names):]:
+            if row.visible:
+                row.frame.pack_forget()
+                row.visible = False
+
+        return self.rows[:len(pokemon_names)]
+
+    def load_sprite(self, pokemon_name):
+        """Load the autocomplete-sized sprite for a Pokemon, if possible"""
+        if not (self.image_loader and self.data_manager):
+            return None
+        sprite_url = self.data_manager.get_pokemon_sprite_url(pokemon_name)
+        if not sprite_url:
+            return None
+        return self.image_loader.load_pokemon_image_autocomplete(pokemon_name, sprite_url)
@@ -0,0 +1,72 @@
+"""
+On-screen timing overlay for the Pokemon Guess Game
+"""
+import tkinter as tk
+
+from ..utils.instrumentation import metrics
+
+
+def format_snapshot(snapshot):
+    """Overlay text for a metrics snapshot: one line per timer, then the counters"""
+    lines = [f"{'timer':<22}{'calls':>7}{'p50 ms':>9}{'p99 ms':>9}"]
+    for name, timer in snapshot['timers'].items():
+        lines.append(f"{name[:21]:<22}{timer['calls']:>7}{timer['p50_ms']:>9.2f}{timer['p99_ms']:>9.2f}")
+    for name, total in snapshot['counters'].items():
+        lines.append(f"{name[:30]:<30}{total:>17,}")
+    return "\n".join(lines)
+
+
+class TimingOverlay:
+    """
+    Rolling p50/p99 timings drawn over the top-right corner of the window,
+    refreshed while shown. Built on the first toggle, so it costs nothing
+    unless someone presses the key.
+    """
+
+    REFRESH_MS = 500
+
+    def __init__(self, root, registry=metrics):
+        self.root = root
+        self.registry = registry
+        self.label = None
+        self.visible = False
+        self._refresh_id = None
+
+    def toggle(self, event=None):
+        if self.visible:
+            self.hide()
+        else:
+            self.show()
+
+    def show(self):
+        if self.label is None:
+            self.label = tk.Label(
+                self.root,
+                font=('Courier', 9),
+                fg='#00ff66',
+                bg='#111111',
+                justify='left',
+                anchor='nw',
+                padx=8,
+                pady=6
+            )
+        self.visible = True
+        self.label.place(relx=1.0, rely=0.0, x=-10, y=10, anchor='ne')
+        self.label.lift()
+        self.refresh()
+
+    def hide(self):
+        self.visible = False
+        if self._refresh_id is not None:
+            self.root.after_cancel(self._refresh_id)
+            self._refresh_id = None
+        if self.label is not None:
+            self.label.place_forget()
+
+    def refresh(self):
+        self._refresh_id = None
+        if not self.visible:
+            return
+        self.label.configure(text=format_snapshot(self.registry.snapshot()))
+        self.label.lift()
+        self._refresh_id = self.root.after(self.REFRESH_MS, self.refresh)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Local HTTP stand-in for PokéAPI used by the data service tests
+Serves the recorded responses in test_files/fixtures/pokeapi and the
+sprite PNGs in test_files/fixtures/sprites
+"""
+
+import hashlib
+import os
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'pokeapi')
+SPRITE_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'sprites')
+API_PREFIX = '/api/v2'
+SPRITE_PREFIX = '/sprites'
+
+
+class FakePokeApi:
+    """
+    Serves fixtures on 127.0.0.1 in a background thread, with ETags so
+    conditional requests get 304 Not Modified
+    `requests` counts hits per path, `not_modified` counts 304s,
+    `fail_next[path] = n` answers the next n requests with 503 and
+    `overrides[path] = text or bytes` replaces a fixture to simulate an upstream change
+    """
+
+    def __init__(self, fixture_dir=FIXTURE_DIR, sprite_dir=SPRITE_DIR):
+        self.fixture_dir = fixture_dir
+        self.sprite_dir = sprite_dir
+        self.requests = Counter()
+        self.not_modified = Counter()
+        self.fail_next = {}
+        self.overrides = {}
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def api_root(self):
+        host, port = self.server.server_address
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def sprite_url(self, filename):
+        host, port = self.server.server_address
+        return f"http://{host}:{port}{SPRITE_PREFIX}/{filename}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def fixture_path(self, path):
+        """Map an API or sprite path to its fixture file, or None"""
+        if path.startswith(SPRITE_PREFIX + '/'):
+            return os.path.join(self.sprite_dir, os.path.basename(path))
+        parts = [part for part in path[len(API_PREFIX):].split('/') if part]
+        if parts == ['pokemon']:
+            return os.path.join(self.fixture_dir, 'pokemon_list.json')
+        if len(parts) == 2 and parts[0] in ('pokemon', 'pokemon-species'):
+            return os.path.join(self.fixture_dir, parts[0], f"{parts[1]}.json")
+        return None
+
+    def load_fixture(self, path):
+        """Fixture body with links pointing back at this server, or None"""
+        if path in self.overrides:
+            body = self.overrides[path]
+        else:
+            fixture_path = self.fixture_path(path)
+            if not fixture_path or not os.path.exists(fixture_path):
+                return None
+            with open(fixture_path, 'rb') as f:
+                body = f.read()
+        if path.startswith(SPRITE_PREFIX + '/'):
+            return body
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        return body.replace('{api_root}', self.api_root).encode('utf-8')
+
+    def _make_handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = urlsplit(self.path).path
+                with api.lock:
+                    api.requests[path] += 1
+                    failing = api.fail_next.get(path, 0)
+                    if failing:
+                        api.fail_next[path] = failing - 1
+
+                if failing:
+                    self.send_error(503)
+                    return
+
+                body = api.load_fixture(path)
+                if body is None:
+                    self.send_error(404)
+                    return
+
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                if self.headers.get('If-None-Match') == etag:
+                    with api.lock:
+                        api.not_modified[path] += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', 'Mon, 01 Sep 2025 00:00:00 GMT')
+                is_sprite = path.startswith(SPRITE_PREFIX + '/')
+                self.send_header('Content-Type', 'image/png' if is_sprite else 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep test output quiet
+
+        return Handler
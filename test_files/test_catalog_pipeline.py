@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass catalog build pipeline
+"""
+
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'data_sources'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fake_pokeapi import FakePokeApi
+from catalog_pipeline import (CatalogPipeline, ClassifyVariantStage, PipelineStage,
+                              ResolveGenerationStage, default_stages, listing_source)
+from pokemon_data_service import PokemonDataService
+import add_variants
+import variant_classifier
+
+
+def build(api, tmp_path, image_dir):
+    service = PokemonDataService(api.api_root, max_workers=3, requests_per_second=None)
+    pipeline = CatalogPipeline(listing_source(service), default_stages(service, str(image_dir)))
+    output = tmp_path / 'pokemon_data.json'
+    written = pipeline.build(str(output))
+    return pipeline, written, output
+
+
+def test_pipeline_builds_final_catalog_in_one_write(tmp_path):
+    image_dir = tmp_path / 'images'
+    image_dir.mkdir()
+    (image_dir / 'Bulbasaur.png').write_bytes(b'')
+
+    with FakePokeApi() as api:
+        pipeline, written, output = build(api, tmp_path, image_dir)
+
+    text = output.read_text(encoding='utf-8')
+    data = json.loads(text)
+    assert text == json.dumps(data, indent=2, ensure_ascii=False)
+    assert written == 5
+    assert list(data) == ["Bulbasaur", "Venusaur", "Pikachu", "Venusaur-Mega", "Venusaur-Gmax"]
+    assert data["Bulbasaur"] == {
+        "sprite_url": "assets/pokemon_images/Bulbasaur.png",
+        "generation": 1,
+        "variant": None,
+        "local_image": True
+    }
+    assert data["Venusaur-Mega"]["variant"] == "Mega"
+    assert data["Venusaur-Mega"]["generation"] == 1
+    assert data["Pikachu"]["local_image"] is False
+
+    assert set(pipeline.timings) == {"source", "fetch", "normalize", "classify", "generation", "localize"}
+    assert all(seconds >= 0 for seconds in pipeline.timings.values())
+    assert pipeline.counts["fetch"] == 6 and pipeline.counts["normalize"] == 5
+
+
+def test_records_stream_through_before_the_source_is_exhausted():
+    produced = []
+
+    def source():
+        for index in range(1000):
+            produced.append(index)
+            yield {'name': f"Pokemon{index}"}
+
+    class Probe(PipelineStage):
+        name = "probe"
+        first_seen_at = None
+
+        def process(self, record):
+            if self.first_seen_at is None:
+                self.first_seen_at = len(produced)
+            return record
+
+    probe = Probe()
+    pipeline = CatalogPipeline(source(), [ClassifyVariantStage(), probe])
+    assert sum(1 for _ in pipeline.records()) == 1000
+    assert probe.first_seen_at == 1
+
+
+def test_failed_species_lookup_falls_back_to_base_generation():
+    with FakePokeApi() as api:
+        service = PokemonDataService(api.api_root, max_workers=1, requests_per_second=None)
+        service.client.retries = 0
+        api.fail_next['/api/v2/pokemon-species/999/'] = 1
+        stage = ResolveGenerationStage(service)
+        records = [
+            {'name': 'Venusaur', 'species_url': f"{api.api_root}/pokemon-species/3/"},
+            {'name': 'Venusaur-Mega', 'species_url': f"{api.api_root}/pokemon-species/999/"},
+            {'name': 'Garchomp-Mega', 'species_url': f"{api.api_root}/pokemon-species/999/"},
+            {'name': 'Nobody-Special', 'species_url': f"{api.api_root}/pokemon-species/999/"}
+        ]
+        generations = {record['name']: record['generation'] for record in stage.stream(records)}
+
+    assert generations == {'Venusaur': 1, 'Venusaur-Mega': 1, 'Garchomp-Mega': 4, 'Nobody-Special': -1}
+    assert stage.fixed == 2
+
+
+def test_add_variants_uses_the_shared_classifier():
+    assert add_variants.classify_variant is variant_classifier.classify_variant
+    assert PokemonDataService().classify_variant("Raichu-Alola") == "Regional - Alolan"
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent PokéAPI ingestion against a local stand-in server
+"""
+
+import sys
+import os
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'data_sources'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fake_pokeapi import FakePokeApi
+from pokeapi_client import PokeApiClient, TokenBucket
+from pokemon_data_service import PokemonDataService
+
+
+def make_service(api, **kwargs):
+    service = PokemonDataService(api.api_root, requests_per_second=None, **kwargs)
+    service.client.backoff = 0.01
+    return service
+
+
+def test_concurrent_fetch_matches_sequential():
+    with FakePokeApi() as api:
+        concurrent = make_service(api, max_workers=4).fetch_all_pokemon()
+        sequential = make_service(api, max_workers=1).fetch_all_pokemon()
+
+    assert concurrent == sequential
+    assert list(concurrent) == ["Bulbasaur", "Venusaur", "Pikachu", "Venusaur-Mega", "Venusaur-Gmax"]
+    assert concurrent["Venusaur-Mega"] == {
+        "sprite_url": "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/10033.png",
+        "generation": 1,
+        "variant": "Mega"
+    }
+    assert concurrent["Venusaur-Gmax"]["variant"] == "Gigantamax"
+
+
+def test_alternate_forms_share_species_request():
+    with FakePokeApi() as api:
+        make_service(api, max_workers=4).fetch_all_pokemon()
+
+    # Venusaur, its Mega and its Gigantamax form all resolve species 3 once
+    assert api.requests['/api/v2/pokemon-species/3/'] == 1
+    # Pikachu-Starter has no sprite, so its species is never needed beyond Pikachu's
+    assert api.requests['/api/v2/pokemon-species/25/'] == 1
+
+
+class BlockingClient:
+    """Client whose species requests wait for `release`, then return `record` or raise it"""
+
+    def __init__(self, record):
+        self.record = record
+        self.release = threading.Event()
+
+    def get_json(self, url):
+        self.release.wait(5)
+        if isinstance(self.record, Exception):
+            raise self.record
+        return self.record
+
+
+def ask_twice(service, url):
+    """Ask for one species from two threads, the second while the first is still fetching"""
+    results = {}
+
+    def ask(caller):
+        try:
+            results[caller] = service.get_species_generation(url)
+        except Exception as e:
+            results[caller] = e
+
+    first = threading.Thread(target=ask, args=('first',), daemon=True)
+    first.start()
+    while url not in service.species_generations:
+        time.sleep(0.001)
+    second = threading.Thread(target=ask, args=('second',), daemon=True)
+    second.start()
+    time.sleep(0.05)  # Let the second caller start waiting on the first one's request
+    service.client.release.set()
+    first.join(5)
+    second.join(5)
+    assert not first.is_alive() and not second.is_alive(), "a caller is still blocked"
+    return results
+
+
+def test_unexpected_species_error_releases_waiting_callers():
+    service = PokemonDataService("http://unused", requests_per_second=None)
+    service.client = BlockingClient(RuntimeError("boom"))
+    url = "http://unused/pokemon-species/1/"
+
+    results = ask_twice(service, url)
+
+    assert all(isinstance(result, RuntimeError) for result in results.values())
+    # The failure isn't remembered, so a later request tries again
+    assert url not in service.species_generations
+
+
+def test_species_with_null_generation_counts_as_unknown():
+    service = PokemonDataService("http://unused", requests_per_second=None)
+    service.client = BlockingClient({"generation": None})
+
+    results = ask_twice(service, "http://unused/pokemon-species/1/")
+
+    assert results == {'first': -1, 'second': -1}
+
+
+def test_transient_errors_are_retried():
+    with FakePokeApi() as api:
+        api.fail_next['/api/v2/pokemon/25/'] = 2
+        service = make_service(api, max_workers=2)
+        pokemon_data = service.fetch_all_pokemon()
+
+    assert "Pikachu" in pokemon_data
+    assert api.requests['/api/v2/pokemon/25/'] == 3
+    assert service.client.stats['retries'] == 2
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=200, capacity=1)
+    start = time.monotonic()
+    for _ in range(21):
+        bucket.acquire()
+    # 20 refills at 200/s take at least 0.1s
+    assert time.monotonic() - start >= 0.09
+
+
+def test_client_gives_up_after_retries():
+    with FakePokeApi() as api:
+        api.fail_next['/api/v2/pokemon/1/'] = 10
+        client = PokeApiClient(requests_per_second=None, retries=2, backoff=0.01)
+        try:
+            client.get_json(f"{api.api_root}/pokemon/1/")
+        except Exception as e:
+            assert '503' in str(e)
+        else:
+            raise AssertionError("expected the request to fail")
+
+    assert api.requests['/api/v2/pokemon/1/'] == 3
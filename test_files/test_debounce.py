@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the debounced suggestion scheduler
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.debounce import Debouncer
+
+
+class FakeTkWidget:
+    """Stands in for a Tk widget's after/after_cancel without a display"""
+
+    def __init__(self):
+        self.callbacks = {}
+        self.next_id = 0
+
+    def after(self, delay_ms, callback):
+        self.next_id += 1
+        self.callbacks[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.callbacks.pop(after_id, None)
+
+    def run_pending(self):
+        callbacks, self.callbacks = self.callbacks, {}
+        for callback in callbacks.values():
+            callback()
+
+
+def test_burst_is_coalesced_into_one_render():
+    widget = FakeTkWidget()
+    debouncer = Debouncer(widget)
+    rendered = []
+
+    for query in ["p", "pi", "pik", "pika"]:
+        debouncer.schedule(rendered.append, query)
+    widget.run_pending()
+
+    assert rendered == ["pika"]
+    assert debouncer.stats['requested'] == 4
+    assert debouncer.stats['executed'] == 1
+    assert debouncer.skipped_renders() == 3
+
+
+def test_flush_and_cancel():
+    widget = FakeTkWidget()
+    debouncer = Debouncer(widget)
+    rendered = []
+
+    debouncer.schedule(rendered.append, "mew")
+    debouncer.flush()
+    assert rendered == ["mew"]
+    assert not debouncer.is_pending()
+
+    debouncer.schedule(rendered.append, "mewtwo")
+    debouncer.cancel()
+    widget.run_pending()
+    assert rendered == ["mew"]
+
+    debouncer.mark_stale()
+    assert debouncer.skipped_renders() == 2
+
+
+if __name__ == "__main__":
+    test_burst_is_coalesced_into_one_render()
+    test_flush_and_cancel()
+    print("✅ Debounce tests passed")
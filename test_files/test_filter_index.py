@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the generation x variant filter index
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data.pokemon_catalog import PokemonCatalog
+from src.data.filter_index import PokemonFilterIndex
+
+SAMPLE_DATA = {
+    "Bulbasaur": {"sprite_url": None, "generation": 1, "variant": None, "local_image": False},
+    "Vulpix-Alola": {"sprite_url": None, "generation": 7, "variant": "Regional - Alolan", "local_image": False},
+    "Missingno": {"sprite_url": None, "generation": -1, "variant": None, "local_image": False},
+    "Charizard-Mega-X": {"sprite_url": None, "generation": 6, "variant": "Mega", "local_image": False},
+    "Chikorita": {"sprite_url": None, "generation": 2, "variant": None, "local_image": False},
+    "Oddity": {"sprite_url": None, "variant": None, "local_image": False},
+    "Pikachu": "https://example.com/25.png",
+}
+
+
+def reference_filter(data, selected_generations, selected_variants):
+    """The original scan over pokemon_data.json entries"""
+    filtered_list = []
+    for pokemon_name, pokemon_info in data.items():
+        if isinstance(pokemon_info, dict):
+            generation = pokemon_info.get('generation', 1)
+            generation_str = str(generation) if generation != -1 else 'Unknown'
+            if generation_str not in selected_generations and generation_str != 'Unknown':
+                continue
+            variant = pokemon_info.get('variant')
+            if variant is None or variant in selected_variants:
+                filtered_list.append(pokemon_name)
+        else:
+            filtered_list.append(pokemon_name)
+    return filtered_list
+
+
+def make_index():
+    return PokemonFilterIndex(PokemonCatalog.from_dict(SAMPLE_DATA))
+
+
+def test_matches_reference_for_every_selection():
+    index = make_index()
+    generations = ['1', '2', '6', '7']
+    variants = ['Mega', 'Regional - Alolan']
+
+    for generation_bits in range(1 << len(generations)):
+        selected_generations = {g for i, g in enumerate(generations) if generation_bits & (1 << i)}
+        for variant_bits in range(1 << len(variants)):
+            selected_variants = {v for i, v in enumerate(variants) if variant_bits & (1 << i)}
+            assert index.filter(selected_generations, selected_variants) == \
+                reference_filter(SAMPLE_DATA, selected_generations, selected_variants)
+
+
+def test_unknown_and_standard_forms_are_always_included():
+    index = make_index()
+    assert index.filter(set(), set()) == ["Missingno", "Pikachu"]
+    assert index.filter({'1'}, set()) == ["Bulbasaur", "Missingno", "Oddity", "Pikachu"]
+
+
+def test_previous_selection_is_memoized():
+    index = make_index()
+    first = index.filter({'6', '7'}, {'Mega'})
+    first.append("Mutated by caller")
+
+    assert index.filter({'7', '6'}, {'Mega'}) == ["Missingno", "Charizard-Mega-X", "Pikachu"]
+    assert index._last_result is not first
+
+
+def test_filter_ids_match_filtered_names():
+    index = make_index()
+    ids = index.filter_ids({'6', '7'}, {'Mega'})
+    assert [index.names[i] for i in ids] == index.filter({'6', '7'}, {'Mega'})
+
+
+def test_variants_share_their_base_species():
+    data = {
+        "Charizard": {"generation": 1, "variant": None},
+        "Charizard-Mega-X": {"generation": 6, "variant": "Mega"},
+        "Deoxys-Normal": {"generation": 3, "variant": None},
+        "Deoxys-Speed": {"generation": 3, "variant": "Form Variants"},
+        "Shaymin-Land": {"generation": 4, "variant": "Form Variants"},
+        "Shaymin-Sky": {"generation": 4, "variant": "Form Variants"},
+        "Iron-Moth": {"generation": 9, "variant": "Paradox Pokemon"},
+        "Iron-Hands": {"generation": 9, "variant": "Paradox Pokemon"},
+    }
+    index = PokemonFilterIndex(PokemonCatalog.from_dict(data))
+    species = index.species_ids()
+    base = {name: index.names[species[i]] for i, name in enumerate(index.names)}
+
+    assert base["Charizard-Mega-X"] == "Charizard"
+    assert base["Deoxys-Speed"] == "Deoxys-Normal"
+    assert base["Shaymin-Sky"] == base["Shaymin-Land"] == "Shaymin-Land"
+    assert base["Iron-Moth"] == "Iron-Moth" and base["Iron-Hands"] == "Iron-Hands"
+    assert list(index.variant_flags) == [0, 1, 0, 1, 1, 1, 1, 1]
+
+
+def test_question_masks_cover_generations_and_variants():
+    index = make_index()
+    questions = index.question_masks()
+
+    def yes(text):
+        return set(index.names_for_mask(questions[text]))
+
+    assert yes("Is it from Generation 1?") == {"Bulbasaur", "Oddity"}
+    assert yes("Is it from Generation 2 or earlier?") == {"Bulbasaur", "Oddity", "Chikorita"}
+    assert yes("Is it a variant form?") == {"Vulpix-Alola", "Charizard-Mega-X"}
+    assert yes("Is it in the Mega category?") == {"Charizard-Mega-X"}
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for the headless game engine and the batch simulator
+"""
+
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from src.engine import (GRID_SIZE, ELIMINATED_TARGET, GUESSED, WRONG_GUESS,
+                        GameEngine, deal_grid, simulate)
+
+
+def make_engine():
+    grid1 = list(range(0, GRID_SIZE))
+    grid2 = list(range(100, 100 + GRID_SIZE))
+    return GameEngine(grid1, grid2, chosen1=5, chosen2=105)
+
+
+def test_deal_grid_is_distinct_and_includes_the_chosen_pokemon():
+    rng = random.Random(7)
+    pool = list(range(200))
+    for chosen in (0, 57, 199):
+        for _ in range(200):
+            grid = deal_grid(pool, chosen, rng)
+            assert len(grid) == GRID_SIZE
+            assert len(set(grid)) == GRID_SIZE
+            assert chosen in grid
+
+
+def test_deal_grid_uses_a_pool_of_exactly_one_grid():
+    grid = deal_grid(list(range(GRID_SIZE)), 3, random.Random(1))
+    assert sorted(grid) == list(range(GRID_SIZE))
+
+
+def test_deal_grid_rejects_a_pool_that_is_too_small():
+    with pytest.raises(ValueError, match="at least 24"):
+        deal_grid(list(range(10)), 3)
+
+
+def test_toggle_tracks_eliminations_per_player():
+    engine = make_engine()
+    assert engine.toggle(110) is True
+    assert engine.is_eliminated(1, 110)
+    assert engine.remaining(1) == GRID_SIZE - 1
+    assert 110 not in engine.candidates(1)
+    assert engine.toggle(110) is False
+    assert engine.remaining(1) == GRID_SIZE
+
+    engine.toggle(110)
+    assert engine.end_turn()
+    assert engine.current_player == 2 and engine.turns == 2
+    engine.toggle(3)
+    assert engine.is_eliminated(2, 3)
+    assert not engine.is_eliminated(1, 3)
+    assert engine.remaining(1) == GRID_SIZE - 1
+
+
+def test_ending_a_turn_with_the_target_crossed_out_loses():
+    engine = make_engine()
+    engine.toggle(105)
+    assert engine.end_turn() is False
+    assert engine.finished
+    assert (engine.winner, engine.reason) == (2, ELIMINATED_TARGET)
+    with pytest.raises(RuntimeError):
+        engine.toggle(106)
+
+
+def test_guesses_end_the_match():
+    engine = make_engine()
+    assert engine.guess(105) is True
+    assert (engine.winner, engine.reason) == (1, GUESSED)
+
+    engine = make_engine()
+    engine.end_turn()
+    assert engine.guess(6) is False
+    assert (engine.winner, engine.reason) == (1, WRONG_GUESS)
+
+
+def test_seeded_simulations_are_reproducible():
+    first = simulate(2000, ('random', 'halving'), workers=1, seed=42, chunk_size=500)
+    second = simulate(2000, ('random', 'halving'), workers=1, seed=42, chunk_size=500)
+    assert first['games'] == 2000
+    assert sum(first['wins']) == 2000
+    assert sum(first['reasons'].values()) == 2000
+    for key in ('wins', 'reasons', 'turns', 'max_turns'):
+        assert first[key] == second[key]
+
+
+def test_simulate_rejects_unknown_strategies():
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        simulate(10, ('random', 'psychic'), workers=1)
+
+
+def test_engine_does_not_import_tkinter():
+    code = "import sys; import src.engine; print('tkinter' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
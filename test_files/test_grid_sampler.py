@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Tests for dealing constrained grids from integer Pokemon ids
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.engine import GRID_SIZE, GridSampler
+
+# 40 species of 3 Pokemon each: id 3s is standard, 3s+1 and 3s+2 are its variants
+SPECIES = [pokemon_id // 3 for pokemon_id in range(120)]
+VARIANTS = [pokemon_id % 3 != 0 for pokemon_id in range(120)]
+POOL = list(range(120))
+
+
+def deal_many(sampler, count=300):
+    return [(chosen, sampler.deal(chosen)) for chosen in (sampler.random_id() for _ in range(count))]
+
+
+def test_grids_are_distinct_and_include_the_chosen_pokemon():
+    for chosen, grid in deal_many(GridSampler(POOL, rng=1)):
+        assert len(grid) == GRID_SIZE
+        assert len(set(grid)) == GRID_SIZE
+        assert chosen in grid
+
+
+def test_seeded_samplers_deal_the_same_grids():
+    assert deal_many(GridSampler(POOL, rng=5)) == deal_many(GridSampler(POOL, rng=5))
+
+
+def test_unique_species_and_variant_cap():
+    sampler = GridSampler(POOL, SPECIES, VARIANTS, unique_species=True, max_variants=2, rng=2)
+    for chosen, grid in deal_many(sampler):
+        assert chosen in grid
+        assert len({SPECIES[pokemon_id] for pokemon_id in grid}) == GRID_SIZE
+        assert sum(VARIANTS[pokemon_id] for pokemon_id in grid) <= max(2, VARIANTS[chosen])
+
+
+def test_tight_pools_still_deal_when_a_grid_exists():
+    # 23 species with a standard form and one variant, plus one variant-only species:
+    # with one variant slot, a full grid needs every standard form and that variant
+    variant_only = 3 * 23 + 1
+    pool = [pokemon_id for species in range(23) for pokemon_id in (3 * species, 3 * species + 1)] + [variant_only]
+    sampler = GridSampler(pool, SPECIES, VARIANTS, unique_species=True, max_variants=1, rng=3)
+    for _ in range(100):
+        grid = sampler.deal(0)
+        assert len({SPECIES[pokemon_id] for pokemon_id in grid}) == GRID_SIZE
+        assert variant_only in grid
+
+    # A chosen variant takes the only slot, leaving 23 species to fill 24 tiles
+    with pytest.raises(ValueError, match="only 23 available"):
+        sampler.deal(1)
+
+
+def test_impossible_constraints_fail_fast():
+    with pytest.raises(ValueError, match="only 10 available"):
+        GridSampler(range(10))
+    with pytest.raises(ValueError, match=r"one per base species\), only 20"):
+        GridSampler(range(60), SPECIES, VARIANTS, unique_species=True)
+    with pytest.raises(ValueError, match="at most 0 variants"):
+        GridSampler(range(60), SPECIES, VARIANTS, max_variants=0)
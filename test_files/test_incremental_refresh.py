@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental, resumable data refresh
+"""
+
+import sys
+import os
+import json
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'data_sources'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fake_pokeapi import FakePokeApi, FIXTURE_DIR
+from pokemon_data_service import PokemonDataService
+from refresh_journal import RefreshJournal
+
+RECORD_PATHS = ['/api/v2/pokemon/1/', '/api/v2/pokemon/3/', '/api/v2/pokemon/25/',
+                '/api/v2/pokemon/10033/', '/api/v2/pokemon/10195/', '/api/v2/pokemon/10158/']
+
+
+def make_service(api, tmp_path, requests_per_second=None):
+    service = PokemonDataService(api.api_root, max_workers=3, requests_per_second=requests_per_second)
+    service.client.backoff = 0.01
+    service.client.retries = 1
+    service.data_file = str(tmp_path / 'pokemon_data.json')
+    service.journal_file = str(tmp_path / 'refresh_journal.jsonl')
+    return service
+
+
+def test_refresh_with_nothing_new_only_gets_304s(tmp_path):
+    with FakePokeApi() as api:
+        first = make_service(api, tmp_path).refresh_pokemon_data()
+        written = os.path.getmtime(tmp_path / 'pokemon_data.json')
+
+        api.requests.clear()
+        second = make_service(api, tmp_path).refresh_pokemon_data()
+
+    assert second == first
+    assert len(first) == 5
+    # Every record answered 304, and no species lookups were needed
+    assert sum(api.not_modified.values()) == len(RECORD_PATHS) + 1
+    assert not any(path.startswith('/api/v2/pokemon-species/') for path in api.requests)
+    assert os.path.getmtime(tmp_path / 'pokemon_data.json') == written
+
+
+def serve_many_pokemon(api, count):
+    """Override the listing with `count` records, all copies of Bulbasaur sharing its species"""
+    with open(os.path.join(FIXTURE_DIR, 'pokemon', '1.json'), 'r', encoding='utf-8') as f:
+        bulbasaur = json.load(f)
+    results = []
+    for number in range(1, count + 1):
+        name = f"bulbasaur-{number}"
+        api.overrides[f'/api/v2/pokemon/{number}/'] = json.dumps(dict(bulbasaur, id=number, name=name))
+        results.append({"name": name, "url": f"{{api_root}}/pokemon/{number}/"})
+    api.overrides['/api/v2/pokemon'] = json.dumps({"count": count, "results": results})
+
+
+def test_unchanged_records_are_not_charged_to_the_rate_limit(tmp_path):
+    with FakePokeApi() as api:
+        serve_many_pokemon(api, 200)
+        make_service(api, tmp_path).refresh_pokemon_data()
+
+        # At the default 20 requests/s, 201 charged requests would take over 9 s
+        service = make_service(api, tmp_path, requests_per_second=20)
+        start = time.monotonic()
+        refreshed = service.refresh_pokemon_data()
+        elapsed = time.monotonic() - start
+
+    assert len(refreshed) == 200
+    assert service.client.stats['not_modified'] == 201
+    assert elapsed < 5
+
+
+def test_changed_record_is_merged_and_local_sprites_kept(tmp_path):
+    with FakePokeApi() as api:
+        service = make_service(api, tmp_path)
+        service.refresh_pokemon_data()
+
+        # Pretend Bulbasaur's sprite was localized by download_pokemon_images.py
+        with open(service.data_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['Bulbasaur'].update(sprite_url='assets/pokemon_images/Bulbasaur.png', local_image=True)
+        service.save_pokemon_data(data)
+
+        with open(os.path.join(FIXTURE_DIR, 'pokemon', '25.json'), 'r', encoding='utf-8') as f:
+            pikachu = json.load(f)
+        pikachu['sprites']['front_default'] = 'https://example.com/new-pikachu.png'
+        api.overrides['/api/v2/pokemon/25/'] = json.dumps(pikachu)
+
+        refreshed = make_service(api, tmp_path).refresh_pokemon_data()
+
+    assert refreshed['Pikachu']['sprite_url'] == 'https://example.com/new-pikachu.png'
+    assert refreshed['Bulbasaur']['sprite_url'] == 'assets/pokemon_images/Bulbasaur.png'
+    assert refreshed['Bulbasaur']['local_image'] is True
+
+
+def test_interrupted_refresh_resumes(tmp_path):
+    with FakePokeApi() as api:
+        api.fail_next['/api/v2/pokemon/25/'] = 10  # Pikachu keeps failing in the first run
+        partial = make_service(api, tmp_path).refresh_pokemon_data()
+        assert 'Pikachu' not in partial
+
+        journal = RefreshJournal(str(tmp_path / 'refresh_journal.jsonl'))
+        assert not journal.last_run_complete
+
+        api.fail_next.clear()
+        api.requests.clear()
+        resumed = make_service(api, tmp_path).refresh_pokemon_data()
+
+    assert 'Pikachu' in resumed
+    # Only the listing and the record that failed are requested again
+    record_requests = {path for path in api.requests if path in RECORD_PATHS}
+    assert record_requests == {'/api/v2/pokemon/25/'}
+    assert RefreshJournal(str(tmp_path / 'refresh_journal.jsonl')).last_run_complete
+
+
+def test_journal_ignores_torn_last_line(tmp_path):
+    path = str(tmp_path / 'refresh_journal.jsonl')
+    journal = RefreshJournal(path)
+    journal.start_or_resume()
+    journal.record('http://x/pokemon/1/', None, None, 'Bulbasaur', {'generation': 1})
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"type": "record", "url": "http://x/pok')
+
+    reloaded = RefreshJournal(path)
+    assert reloaded.start_or_resume() is True
+    assert reloaded.done_this_run('http://x/pokemon/1/')['name'] == 'Bulbasaur'
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for the hot-path timers, counters, JSON dump and timing overlay text
+"""
+
+import sys
+import os
+import json
+import logging
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.instrumentation import Metrics, configure_logging, percentile
+from src.widgets.timing_overlay import format_snapshot
+
+
+def test_timed_works_as_context_manager_and_decorator():
+    registry = Metrics()
+
+    with registry.timed('block'):
+        pass
+
+    @registry.timed('call')
+    def double(value):
+        return value * 2
+
+    assert [double(n) for n in range(3)] == [0, 2, 4]
+    assert double.__name__ == 'double'
+
+    timers = registry.snapshot()['timers']
+    assert timers['block']['calls'] == 1
+    assert timers['call']['calls'] == 3
+    assert timers['call']['max_ms'] >= timers['call']['p50_ms'] >= 0
+
+
+def test_failing_calls_are_still_timed():
+    registry = Metrics()
+
+    @registry.timed('broken')
+    def broken():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        broken()
+    assert registry.snapshot()['timers']['broken']['calls'] == 1
+
+
+def test_percentiles_cover_the_rolling_window_and_totals_everything():
+    registry = Metrics(window=100)
+    for ms in range(1, 201):
+        registry.record('load', ms / 1000)
+
+    timer = registry.snapshot()['timers']['load']
+    assert timer['calls'] == 200
+    assert timer['total_ms'] == pytest.approx(sum(range(1, 201)))
+    assert timer['max_ms'] == pytest.approx(200)
+    # Only the last 100 calls (101..200 ms) are in the window
+    assert timer['p50_ms'] == pytest.approx(150)
+    assert timer['p99_ms'] == pytest.approx(199)
+
+
+def test_percentile_nearest_rank():
+    assert percentile([], 0.5) == 0.0
+    assert percentile([7], 0.99) == 7
+    assert percentile([1, 2, 3, 4], 0.5) == 2
+    assert percentile([1, 2, 3, 4], 1.0) == 4
+
+
+def test_counters_are_thread_safe():
+    registry = Metrics()
+
+    def work():
+        for _ in range(1000):
+            registry.count('hits')
+            registry.record('work', 0.001)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    snapshot = registry.snapshot()
+    assert snapshot['counters'] == {'hits': 4000}
+    assert snapshot['timers']['work']['calls'] == 4000
+
+
+def test_disabled_registry_records_nothing():
+    registry = Metrics()
+    registry.enabled = False
+    with registry.timed('block'):
+        registry.count('hits', 5)
+    assert registry.snapshot() == {'timers': {}, 'counters': {}}
+
+
+def test_dump_json(tmp_path):
+    registry = Metrics()
+    registry.record('create_grid', 0.004)
+    registry.count('sprite.download', 2)
+
+    path = tmp_path / 'metrics.json'
+    registry.dump_json(str(path))
+    data = json.loads(path.read_text(encoding='utf-8'))
+
+    assert data['timers']['create_grid']['p99_ms'] == pytest.approx(4)
+    assert data['counters'] == {'sprite.download': 2}
+    assert data['written'] > 0
+
+
+def test_overlay_text_lists_timers_and_counters():
+    registry = Metrics()
+    registry.record('fuzzy_search', 0.0015)
+    registry.count('sprite.download', 1234)
+
+    lines = format_snapshot(registry.snapshot()).splitlines()
+    assert lines[0].split() == ['timer', 'calls', 'p50', 'ms', 'p99', 'ms']
+    assert lines[1].split() == ['fuzzy_search', '1', '1.50', '1.50']
+    assert lines[2].split() == ['sprite.download', '1,234']
+
+
+def test_configure_logging_reads_the_environment(monkeypatch):
+    root = logging.getLogger()
+    saved_level, saved_handlers = root.level, root.handlers[:]
+    try:
+        monkeypatch.setenv('WYP_LOG_LEVEL', 'debug')
+        assert configure_logging() == logging.DEBUG
+        assert logging.getLogger('src.game').isEnabledFor(logging.DEBUG)
+        assert configure_logging('warning') == logging.WARNING
+        assert not logging.getLogger('src.game').isEnabledFor(logging.INFO)
+        monkeypatch.setenv('WYP_LOG_LEVEL', 'nonsense')
+        assert configure_logging() == logging.INFO
+    finally:
+        root.setLevel(saved_level)
+        root.handlers[:] = saved_handlers
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Tests for the logo cache and the build-time pre-scaled logos
+"""
+
+import sys
+import os
+import re
+import glob
+import tempfile
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, REPO_ROOT)
+
+from PIL import Image
+from src.utils.logo_cache import LogoCache, LOGO_SIZES, build_scaled_logos, fit_size
+
+ASSET_DIR = os.path.join(REPO_ROOT, 'assets')
+
+
+def test_prescaled_logos_load_without_resampling():
+    with tempfile.TemporaryDirectory() as tmp:
+        count = build_scaled_logos(ASSET_DIR, tmp)
+        assert count == sum(len(boxes) for boxes in LOGO_SIZES.values())
+
+        cache = LogoCache(asset_dir=ASSET_DIR, scaled_dir=tmp, to_photo=lambda image: image)
+        for filename, boxes in LOGO_SIZES.items():
+            with Image.open(os.path.join(ASSET_DIR, filename)) as source:
+                original_size = source.size
+            for box in boxes:
+                assert cache.get(filename, *box).size == fit_size(original_size, *box)
+
+        # Every grid setup tile shares one pokeball image
+        pokeballs = {id(cache.get('pokeball.png', 80, 80)) for _ in range(24)}
+        assert len(pokeballs) == 1
+        assert cache.stats() == {'entries': count, 'hits': 24, 'misses': count, 'resampled': 0}
+
+
+def test_missing_prescaled_logo_falls_back_to_resizing():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LogoCache(asset_dir=ASSET_DIR, scaled_dir=tmp, to_photo=lambda image: image)
+        assert cache.get('x_icon.png', 96, 96).size == (96, 96)
+        assert cache.get('x_icon.png', 96, 96).size == (96, 96)
+        assert cache.stats()['resampled'] == 1
+
+
+def test_screens_only_ask_for_prescaled_sizes():
+    call = re.compile(r"load_logo_image\('([^']+)', max_width=(\d+), max_height=(\d+)\)")
+    requested = set()
+    for path in glob.glob(os.path.join(REPO_ROOT, 'src', 'screens', '*.py')):
+        with open(path, 'r', encoding='utf-8') as f:
+            requested |= {(name, int(w), int(h)) for name, w, h in call.findall(f.read())}
+
+    assert requested
+    prescaled = {(name, *box) for name, boxes in LOGO_SIZES.items() for box in boxes}
+    assert requested <= prescaled
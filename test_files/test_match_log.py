@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for binary match logs and replaying them on the headless engine
+"""
+
+import sys
+import os
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.engine import GameEngine, GridSampler, MatchRecorder, read_matches, replay, halving, random_elimination
+from src.engine.match_log import describe
+
+
+def play_recorded(recorder, sampler, rng, seed):
+    chosen1, chosen2 = sampler.random_id(), sampler.random_id()
+    engine = GameEngine(sampler.deal(chosen1), sampler.deal(chosen2), chosen1, chosen2)
+    recorder.start(engine, seed, roster_checksum=1234)
+    strategies = (None, halving, random_elimination)
+    while not engine.finished:
+        strategies[engine.current_player](engine, rng)
+    return engine
+
+
+def record_matches(path, count=20):
+    rng = random.Random(11)
+    sampler = GridSampler(range(300), rng=rng)
+    recorder = MatchRecorder(path)
+    engines = [play_recorded(recorder, sampler, rng, seed) for seed in range(1, count + 1)]
+    recorder.close()
+    return engines
+
+
+def state(engine):
+    return (engine.grids, engine.chosen, engine.eliminated, engine.current_player,
+            engine.turns, engine.winner, engine.reason)
+
+
+def test_replay_rebuilds_every_recorded_match(tmp_path):
+    path = tmp_path / "matches.wyplog"
+    engines = record_matches(path)
+
+    matches = read_matches(path)
+    assert [match.seed for match in matches] == list(range(1, 21))
+    assert all(match.roster_crc == 1234 for match in matches)
+    assert [state(replay(match)) for match in matches] == [state(engine) for engine in engines]
+
+
+def test_replay_stops_part_way(tmp_path):
+    path = tmp_path / "matches.wyplog"
+    record_matches(path, count=1)
+    match = read_matches(path)[0]
+
+    assert replay(match, upto=0).eliminated == [None, 0, 0]
+    partial = replay(match, upto=1)
+    assert partial.eliminated[1].bit_count() == 1 and not partial.finished
+
+
+def test_logs_append_and_survive_a_torn_last_record(tmp_path):
+    path = tmp_path / "matches.wyplog"
+    record_matches(path, count=2)
+    record_matches(path, count=3)
+    size = os.path.getsize(path)
+    with open(path, 'r+b') as f:
+        f.truncate(size - 2)
+
+    matches = read_matches(path)
+    assert len(matches) == 5
+    assert not replay(matches[-1]).finished
+
+
+def test_rejects_files_that_are_not_match_logs(tmp_path):
+    path = tmp_path / "bogus.wyplog"
+    path.write_bytes(b"NOTALOG!\x01\x00")
+    with pytest.raises(ValueError, match="Unsupported"):
+        read_matches(path)
+
+
+def test_describe_tells_the_match_and_its_result(tmp_path):
+    path = tmp_path / "matches.wyplog"
+    engine = record_matches(path, count=1)[0]
+    match = read_matches(path)[0]
+    names = [f"Mon{i}" for i in range(300)]
+
+    lines = describe(match, names)
+    assert f"Player 1 chose Mon{match.chosen[1]}" in lines[1]
+    assert lines[-1].startswith(f"  Player {engine.winner} wins ({engine.reason})")
+    assert len(lines) == len(match.events) + 3
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for the binary Pokemon catalog
+"""
+
+import sys
+import os
+import json
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data import pokemon_catalog
+from src.data.pokemon_catalog import PokemonCatalog, build_catalog, GENERATION_UNKNOWN
+
+SAMPLE_DATA = {
+    "Bulbasaur": {"sprite_url": "assets/pokemon_images/Bulbasaur.png", "generation": 1, "variant": None, "local_image": True},
+    "Nidoran♀": {"sprite_url": "assets/pokemon_images/Nidoran♀.png", "generation": 1, "variant": None, "local_image": True},
+    "Charizard-Mega-X": {"sprite_url": "https://example.com/6-mega-x.png", "generation": 6, "variant": "Mega", "local_image": False},
+    "Venusaur-Mega": {"sprite_url": "assets/pokemon_images/Venusaur-Mega.png", "generation": 6, "variant": "Mega", "local_image": True},
+}
+
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def test_binary_catalog_matches_json(tmp_path):
+    json_path = str(tmp_path / 'pokemon_data.json')
+    catalog_path = str(tmp_path / 'pokemon_catalog.bin')
+    write_json(json_path, SAMPLE_DATA)
+
+    assert build_catalog(json_path, catalog_path) == 4
+
+    catalog = PokemonCatalog.open(catalog_path, json_path)
+    try:
+        assert catalog.names == list(SAMPLE_DATA)
+        for pokemon_name, info in SAMPLE_DATA.items():
+            pokemon_id = catalog.index[pokemon_name]
+            assert catalog.sprite_url(pokemon_id) == info['sprite_url']
+            assert catalog.variant(pokemon_id) == info['variant']
+            assert catalog.generation(pokemon_id) == info['generation']
+            assert catalog.local_image(pokemon_id) == info['local_image']
+        assert catalog.all_variants() == {"Mega"}
+    finally:
+        catalog.close()
+
+
+def test_variant_names_are_interned():
+    catalog = PokemonCatalog.from_dict(SAMPLE_DATA)
+    assert catalog.variant_ids[2] == catalog.variant_ids[3]
+    assert catalog.strings.count("Mega") == 1
+
+
+def test_stale_catalog_is_rejected(tmp_path):
+    json_path = str(tmp_path / 'pokemon_data.json')
+    catalog_path = str(tmp_path / 'pokemon_catalog.bin')
+    write_json(json_path, SAMPLE_DATA)
+    build_catalog(json_path, catalog_path)
+
+    write_json(json_path, {**SAMPLE_DATA, "Mew": {"sprite_url": None, "generation": 1, "variant": None, "local_image": False}})
+
+    try:
+        PokemonCatalog.open(catalog_path, json_path)
+    except ValueError as e:
+        assert "out of date" in str(e)
+    else:
+        raise AssertionError("stale catalog was accepted")
+
+
+def test_fresh_catalog_is_opened_without_reading_the_json(tmp_path, monkeypatch):
+    json_path = str(tmp_path / 'pokemon_data.json')
+    catalog_path = str(tmp_path / 'pokemon_catalog.bin')
+    write_json(json_path, SAMPLE_DATA)
+    build_catalog(json_path, catalog_path)
+
+    def unexpected_read(path):
+        raise AssertionError("the JSON was read although its size and mtime match")
+
+    monkeypatch.setattr(pokemon_catalog, '_source_crc', unexpected_read)
+    PokemonCatalog.open(catalog_path, json_path).close()
+
+
+def test_touched_json_falls_back_to_the_checksum(tmp_path):
+    json_path = str(tmp_path / 'pokemon_data.json')
+    catalog_path = str(tmp_path / 'pokemon_catalog.bin')
+    write_json(json_path, SAMPLE_DATA)
+    build_catalog(json_path, catalog_path)
+    status = os.stat(json_path)
+
+    # Same content with a new mtime (as after a checkout) is still current
+    os.utime(json_path, ns=(status.st_atime_ns, status.st_mtime_ns + 10**9))
+    PokemonCatalog.open(catalog_path, json_path).close()
+
+    # Different content of the same size is not
+    with open(json_path, 'r', encoding='utf-8') as f:
+        edited = f.read().replace('"generation": 1', '"generation": 2', 1)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        f.write(edited)
+    assert os.stat(json_path).st_size == status.st_size
+    try:
+        PokemonCatalog.open(catalog_path, json_path)
+    except ValueError as e:
+        assert "out of date" in str(e)
+    else:
+        raise AssertionError("stale catalog was accepted")
+
+
+def test_old_format_entries():
+    catalog = PokemonCatalog.from_dict({"Pikachu": "https://example.com/25.png"})
+    assert catalog.sprite_url(0) == "https://example.com/25.png"
+    assert catalog.variant(0) is None
+    assert catalog.generation(0) == GENERATION_UNKNOWN
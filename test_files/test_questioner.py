@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the information-gain computer player
+"""
+
+import sys
+import os
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.engine import (GRID_SIZE, GUESSED, GameEngine, QuestionBank, QuestioningPlayer,
+                        alphabetical_questions, best_question, information_gain, simulate)
+
+
+def bit_questions(bits=5):
+    """Questions on the binary digits of ids 0-31: 24 grid ids are told apart in five answers"""
+    return QuestionBank({f"Is bit {bit} set?": sum(1 << i for i in range(32) if i >> bit & 1) for bit in range(bits)})
+
+
+def make_engine(chosen2=13):
+    return GameEngine(list(range(24)), list(range(24)), chosen1=3, chosen2=chosen2)
+
+
+def test_information_gain_prefers_even_splits():
+    assert information_gain(12, 24) == pytest.approx(1.0)
+    assert information_gain(6, 24) < information_gain(10, 24) < 1.0
+    assert information_gain(0, 24) == information_gain(24, 24) == 0.0
+
+
+def test_best_question_splits_the_candidates_most_evenly():
+    candidates = 0b1111_0000
+    masks = [0b1111_0000, 0b0001_0000, 0b1100_0000, 0b0000_1111]
+    assert best_question(candidates, masks) == 2
+    assert best_question(candidates, [0, candidates]) is None
+
+
+def test_a_deadline_in_the_past_still_returns_a_question():
+    masks = [0b01] * 200 + [0b11]
+    assert best_question(0b11, masks, deadline=0.0) == 0
+
+
+def test_grid_masks_narrow_questions_to_positions():
+    bank = QuestionBank({"Even?": 0b0101_0101})
+    assert bank.grid_masks([1, 0, 2, 7]) == [0b0110]
+    assert bank.answer(0, 2) and not bank.answer(0, 3)
+
+
+def test_answers_never_cross_out_the_target():
+    player = QuestioningPlayer(bit_questions())
+    engine = make_engine()
+    plan = player.plan_turn(engine)
+    assert plan.question is not None and plan.answer is not None
+    assert len(plan.cross_out) == 12
+    assert 13 not in plan.cross_out  # Position 13 holds the opponent's id 13
+
+
+def test_binary_questions_find_the_pokemon_in_five_turns():
+    player = QuestioningPlayer(bit_questions())
+    for chosen in range(GRID_SIZE):
+        engine = make_engine(chosen)
+        while not engine.finished:
+            player(engine, random)
+            if not engine.finished:
+                engine.end_turn()  # Player 2 passes
+        assert (engine.winner, engine.reason) == (1, GUESSED)
+        assert engine.turns <= 9
+
+
+def test_alphabetical_questions_follow_first_letters():
+    questions = alphabetical_questions(["Abra", "bulbasaur", "Zubat"])
+    assert questions["Does its name come before B in the alphabet?"] == 0b001
+    assert questions["Does its name come before C in the alphabet?"] == 0b011
+    assert questions["Does its name come before Z in the alphabet?"] == 0b011
+
+
+def test_simulated_questioner_beats_random_elimination():
+    player = QuestioningPlayer(bit_questions(5))
+    stats = simulate(300, (player, 'random'), pool_ids=range(32), workers=1, seed=9)
+    assert stats['wins'][1] > 250
+
+
+@pytest.fixture
+def computer_game():
+    import tkinter
+    try:
+        tkinter.Tk().destroy()
+    except tkinter.TclError:
+        pytest.skip("no display available")
+
+    from src import PokemonGuessGame
+    game = PokemonGuessGame()
+    game.ensure_data_ready()
+    game.player1_name, game.player1_chosen = "Ash", game.filtered_pokemon_list[0]
+    game.add_computer_opponent()
+    yield game
+    game.root.destroy()
+
+
+def test_computer_plays_its_turn_on_player_ones_grid(computer_game):
+    game = computer_game
+    game.end_turn()
+    assert game.is_computer_turn()
+    assert str(game.end_turn_button.cget('state')) == 'disabled'
+
+    game.end_turn()  # Humans can't pass the computer's turn
+    assert game.is_computer_turn()
+
+    game.play_computer_turn()
+    assert game.player1_chosen not in game.player2_eliminated
+    assert game.player2_eliminated or not game.game_active
+    assert not game.game_active or game.current_player == 1
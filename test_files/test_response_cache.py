@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for the raw PokéAPI response cache and offline replay
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'data_sources'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fake_pokeapi import FakePokeApi
+from pokemon_data_service import PokemonDataService
+from response_cache import ResponseCache
+
+
+def make_service(api_root, cache):
+    return PokemonDataService(api_root, max_workers=3, requests_per_second=None, cache=cache)
+
+
+def test_identical_bodies_share_a_blob(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.store('http://x/a', b'{"same": true}')
+    cache.store('http://x/b', b'{"same": true}')
+    cache.store('http://x/c', b'{"other": true}')
+
+    assert cache.read('http://x/a') == b'{"same": true}'
+    assert len(os.listdir(cache.blob_dir)) == 2
+
+
+def test_offline_replay_matches_online_fetch(tmp_path):
+    with FakePokeApi() as api:
+        api_root = api.api_root
+        cache = ResponseCache(str(tmp_path))
+        online_service = make_service(api_root, cache)
+        online = online_service.fetch_all_pokemon()
+        online_service.client.close()
+
+    # The server is gone; every response must come from the cache
+    offline_cache = ResponseCache(str(tmp_path), offline=True)
+    offline = make_service(api_root, offline_cache).fetch_all_pokemon()
+
+    assert offline == online
+    assert offline_cache.stats['misses'] == 0
+
+
+def test_fresh_entries_skip_the_network_and_stale_ones_revalidate(tmp_path):
+    with FakePokeApi() as api:
+        cache = ResponseCache(str(tmp_path))
+        make_service(api.api_root, cache).fetch_all_pokemon()
+
+        api.requests.clear()
+        make_service(api.api_root, cache).fetch_all_pokemon()
+        assert sum(api.requests.values()) == 0
+
+        cache.ttl = 0  # Everything is stale now
+        make_service(api.api_root, cache).fetch_all_pokemon()
+
+    assert sum(api.requests.values()) == sum(api.not_modified.values()) > 0
+
+
+def test_size_budget_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    for index in range(5):
+        cache.store(f'http://x/{index}', os.urandom(1000))  # Incompressible
+    cache.read('http://x/0')  # Most recently used now
+
+    cache.max_bytes = 2 * cache.lookup('http://x/0')['size']
+    cache.close()
+
+    reopened = ResponseCache(str(tmp_path))
+    assert set(reopened.entries) == {'http://x/0', 'http://x/4'}
+    assert len(os.listdir(reopened.blob_dir)) == 2
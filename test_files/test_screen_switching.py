@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Retained screen switching: screens are built once and reused on every later visit
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.screens import ScreenRegistry
+from src.screens.screen_registry import widget_paths
+from src.utils import metrics
+
+
+class FakeWidget:
+    """Just enough of a Tk widget for the registry: a named node in a tree"""
+
+    def __init__(self, master=None, name='.'):
+        self.master = master
+        self.children = {}
+        self.path = name if master is None else f"{master.path}.{name}"
+        self.packed = False
+        if master is not None:
+            master.children[name] = self
+
+    def __str__(self):
+        return self.path
+
+    def pack(self, **options):
+        self.packed = True
+
+    def pack_forget(self):
+        self.packed = False
+
+    def unbind(self, sequence):
+        pass
+
+    def destroy(self):
+        del self.master.children[self.path.rsplit('.', 1)[1]]
+
+
+class FakeScreen:
+    """Screen with a three-widget tree, counting builds and refreshes"""
+    container_options = {}
+    builds = 0
+
+    def __init__(self, root, game):
+        self.root = root
+        self.container = None
+        self.shown_with = []
+
+    def create(self):
+        type(self).builds += 1
+        self.container = FakeWidget(self.root, f"screen{type(self).builds}")
+        FakeWidget(self.container, 'label')
+        FakeWidget(self.container, 'button')
+
+    def on_show(self, *args):
+        self.shown_with.append(args)
+
+    def hide(self):
+        self.container.pack_forget()
+
+    def destroy(self):
+        self.container.destroy()
+        self.container = None
+
+
+def navigate(retained):
+    FakeScreen.builds = 0
+    registry = ScreenRegistry(FakeWidget(), None, retained=retained, count_widgets=True)
+    registry.get = lambda key: registry.screens.setdefault(key, FakeScreen(registry.root, None))
+    for key, args in [('startup', ()), ('settings', ()), ('startup', ()),
+                      ('player_setup', (1,)), ('player_setup', (2,)), ('game_over', ('Ash Wins!', ''))]:
+        registry.activate(registry.get(key), *args)
+    return registry
+
+
+def test_retained_screens_are_built_once_and_refreshed():
+    registry = navigate(retained=True)
+
+    assert FakeScreen.builds == 4
+    assert [n['widgets_created'] for n in registry.navigations] == [3, 3, 0, 3, 0, 3]
+    assert registry.screens['player_setup'].shown_with == [(1,), (2,)]
+    # Only the active screen is packed; the others are kept, hidden
+    assert [key for key, screen in registry.screens.items() if screen.container.packed] == ['game_over']
+    assert registry.stats()['widgets_live'] == 1 + 4 * 3
+
+
+def test_rebuild_mode_destroys_screens_as_they_are_left():
+    registry = navigate(retained=False)
+
+    assert FakeScreen.builds == 6
+    assert registry.stats()['widgets_created'] == 6 * 3
+    assert len(widget_paths(registry.root)) == 1 + 3
+
+
+def test_navigations_are_timed_as_screen_transitions():
+    metrics.reset()
+    navigate(retained=True)
+
+    timers = metrics.snapshot()['timers']
+    assert timers['screen_transition']['calls'] == 6
+    assert timers['screen.FakeScreen']['calls'] == 6
+
+
+def test_widgets_are_only_walked_when_counting_and_history_is_bounded():
+    registry = ScreenRegistry(FakeWidget(), None)
+    screens = [FakeScreen(registry.root, None) for _ in range(2)]
+    for index in range(ScreenRegistry.HISTORY + 50):
+        registry.activate(screens[index % 2])
+
+    assert len(registry.navigations) == ScreenRegistry.HISTORY
+    assert 'widgets_created' not in registry.navigations[-1]
+    stats = registry.stats()
+    assert stats['navigations'] == ScreenRegistry.HISTORY + 50
+    assert stats['max_ms'] >= stats['avg_ms'] > 0
+    assert stats['widgets_created'] == 0
+
+
+def test_revisits_allocate_no_widgets_in_the_real_ui():
+    import tkinter
+    try:
+        tkinter.Tk().destroy()
+    except tkinter.TclError:
+        pytest.skip("no display available")
+
+    from src import PokemonGuessGame
+    game = PokemonGuessGame()
+    try:
+        game.screens.count_widgets = True
+        round_starts = []
+        for _ in range(2):
+            round_starts.append(game.screens.stats()['widgets_created'])
+            game.show_settings()
+            game.return_to_startup()
+            game.start_game()
+            game.player1_name, game.player1_chosen = "Ash", game.filtered_pokemon_list[0]
+            game.setup_player(2)
+            game.player2_name, game.player2_chosen = "Gary", game.filtered_pokemon_list[1]
+            game.create_game_screen()
+            game.end_game("Ash Wins!", "Ash guessed it!")
+            game.new_game()
+
+        assert game.screens.stats()['widgets_created'] == round_starts[1]
+    finally:
+        game.root.destroy()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Ranking tests for the prebuilt autocomplete search index
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data.search_index import PokemonSearchIndex
+
+POKEMON_NAMES = [
+    "Caterpie", "Pikachu", "Pidgey", "Pikachu-Rock-Star", "Raichu", "Pichu",
+    "Mew", "Mewtwo", "Mewtwo-Mega-X", "Pikipek", "Spinda", "Pi"
+]
+
+
+def tiered_scan(query, items, limit=8):
+    """Reference ranking: exact > prefix > substring > subsequence, roster order within a tier"""
+    query = query.lower()
+    tiers = ([], [], [], [])
+    for item in items:
+        item_lower = item.lower()
+        if item_lower == query:
+            tiers[0].append(item)
+        elif item_lower.startswith(query):
+            tiers[1].append(item)
+        elif query in item_lower:
+            tiers[2].append(item)
+        else:
+            remaining = iter(item_lower)
+            if all(char in remaining for char in query):
+                tiers[3].append(item)
+    return [item for tier in tiers for item in tier][:limit]
+
+
+def test_ranking_tiers():
+    index = PokemonSearchIndex(POKEMON_NAMES)
+    assert index.search("pi") == ["Pi", "Pikachu", "Pidgey", "Pikachu-Rock-Star", "Pichu", "Pikipek", "Caterpie", "Spinda"]
+    assert index.search("MEW") == ["Mew", "Mewtwo", "Mewtwo-Mega-X"]
+    assert index.search("pkc") == ["Pikachu", "Pikachu-Rock-Star"]
+
+
+def test_matches_reference_scan():
+    index = PokemonSearchIndex(POKEMON_NAMES)
+    for name in POKEMON_NAMES:
+        for end in range(1, len(name) + 1):
+            query = name[:end]
+            assert index.search(query) == tiered_scan(query, POKEMON_NAMES), query
+    assert index.search("") == []
+    assert index.search("zzz") == []
+
+
+def test_allowed_subset():
+    index = PokemonSearchIndex(POKEMON_NAMES)
+    allowed = {"Pichu", "Caterpie", "Mew"}
+    assert index.search("pi", allowed=allowed) == ["Pichu", "Caterpie"]
+    assert index.search("pi", limit=1) == ["Pi"]
+
+
+if __name__ == "__main__":
+    test_ranking_tiers()
+    test_matches_reference_scan()
+    test_allowed_subset()
+    print("✅ Search index tests passed")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for the python -m src.sim tournament command
+"""
+
+import json
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import sim
+from src.engine import turn_percentile
+
+
+def test_tournament_streams_progress_and_saves_statistics(tmp_path, capsys):
+    output = tmp_path / "stats.json"
+    code = sim.main(["--games", "300", "--player1", "questions", "--player2", "halving", "--workers", "1",
+                     "--seed", "7", "--chunk-size", "100", "--generations", "1,2", "--unique-species",
+                     "--json", str(output)])
+    assert code == 0
+
+    printed = capsys.readouterr().out
+    assert printed.count("📊") == 3
+    assert "questions (Player 1) vs halving (Player 2): 300 games, seed 7" in printed
+
+    stats = json.loads(output.read_text())
+    assert stats['games'] == 300 and sum(stats['wins']) == 300
+    assert sum(stats['turn_counts'].values()) == 300
+    assert stats['pokemon'] > 24
+
+
+def test_tournament_reports_settings_that_cannot_fill_a_grid(capsys):
+    assert sim.main(["--games", "10", "--generations", "42", "--workers", "1"]) == 1
+    assert "Need at least 24 Pokémon" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("games", ["0", "-5"])
+def test_tournament_rejects_game_counts_below_one(games, capsys):
+    assert sim.main(["--games", games, "--workers", "1"]) == 1
+    assert "--games: must be a positive number" in capsys.readouterr().out
+
+
+def test_every_strategy_is_offered_and_described():
+    assert set(sim.STRATEGY_NAMES) == set(sim.STRATEGY_HELP)
+
+
+def test_turn_percentile_reads_the_histogram():
+    stats = {'games': 10, 'turn_counts': {3: 5, 7: 4, 20: 1}}
+    assert turn_percentile(stats, 0.5) == 3
+    assert turn_percentile(stats, 0.9) == 7
+    assert turn_percentile(stats, 1.0) == 20
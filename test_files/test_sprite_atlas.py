@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Round-trip test for the packed sprite atlas
+"""
+
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PIL import Image
+from src.utils.sprite_atlas import SpriteAtlas, build_sprite_atlas
+
+
+def test_atlas_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        image_dir = os.path.join(tmp, 'pokemon_images')
+        os.makedirs(image_dir)
+        Image.new('RGBA', (96, 96), (255, 0, 0, 255)).save(os.path.join(image_dir, 'Pikachu.png'))
+        Image.new('P', (96, 96)).save(os.path.join(image_dir, 'Mr-Mime.png'))
+
+        atlas_path = os.path.join(tmp, 'sprite_atlas.bin')
+        assert build_sprite_atlas(image_dir, atlas_path) == 2
+
+        atlas = SpriteAtlas(atlas_path)
+        try:
+            assert atlas.sprite_count((96, 96)) == 2
+            assert atlas.sprite_count((64, 64)) == 2
+
+            sprite = atlas.get_image('Pikachu', (64, 64))
+            assert sprite.size == (64, 64)
+            assert sprite.mode == 'RGBA'
+            assert sprite.getpixel((32, 32)) == (255, 0, 0, 255)
+
+            # Lookups are case-insensitive, like the local file probes
+            assert atlas.get_image('MR-MIME', (96, 96)).size == (96, 96)
+            assert atlas.get_image('Missingno', (96, 96)) is None
+            assert atlas.get_image('Pikachu', (32, 32)) is None
+        finally:
+            atlas.close()
+
+
+if __name__ == "__main__":
+    test_atlas_round_trip()
+    print("✅ Sprite atlas test passed")
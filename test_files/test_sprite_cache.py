@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded sprite cache
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.sprite_cache import SpriteCache, sprite_bytes
+
+GRID = (96, 96)
+SUGGESTION = (64, 64)
+
+
+def make_cache(grid_sprites=3, suggestion_sprites=3):
+    return SpriteCache({
+        GRID: grid_sprites * sprite_bytes(GRID),
+        SUGGESTION: suggestion_sprites * sprite_bytes(SUGGESTION)
+    })
+
+
+def test_least_recently_used_sprite_is_evicted():
+    cache = make_cache()
+    for name in ["Bulbasaur", "Ivysaur", "Venusaur"]:
+        cache.put(name, GRID, object())
+
+    cache.get("Bulbasaur", GRID)  # Ivysaur is now the oldest
+    cache.put("Charmander", GRID, object())
+
+    assert ("Ivysaur", GRID) not in cache
+    assert ("Bulbasaur", GRID) in cache
+    assert cache.memory_usage(GRID) == 3 * sprite_bytes(GRID)
+    assert cache.stats(GRID)['evictions'] == 1
+
+
+def test_tiers_have_separate_budgets():
+    cache = make_cache(grid_sprites=2, suggestion_sprites=2)
+    cache.put("Pikachu", GRID, object())
+    for name in ["Pichu", "Raichu", "Eevee", "Vaporeon"]:
+        cache.put(name, SUGGESTION, object())
+
+    # Browsing suggestions never evicts grid sprites
+    assert ("Pikachu", GRID) in cache
+    assert len(cache) == 3
+    assert cache.stats(SUGGESTION)['evictions'] == 2
+
+
+def test_pinned_sprites_are_never_evicted():
+    cache = make_cache(grid_sprites=2)
+    cache.set_pinned(["Mew", "Mewtwo"], GRID)
+    cache.put("Mew", GRID, object())
+    cache.put("Mewtwo", GRID, object())
+    cache.put("Ditto", GRID, object())
+
+    assert ("Mew", GRID) in cache
+    assert ("Mewtwo", GRID) in cache
+    assert ("Ditto", GRID) not in cache
+
+    # Dealing a new grid releases the old pins
+    cache.set_pinned(["Ditto"], GRID)
+    cache.put("Ditto", GRID, object())
+    assert ("Ditto", GRID) in cache
+    assert ("Mew", GRID) not in cache
+    assert cache.memory_usage(GRID) == 2 * sprite_bytes(GRID)
+
+
+def test_pinned_sprites_may_overflow_the_budget():
+    cache = make_cache(grid_sprites=1)
+    cache.set_pinned(["Mew", "Mewtwo"], GRID)
+    cache.put("Mew", GRID, object())
+    cache.put("Mewtwo", GRID, object())
+    assert cache.memory_usage(GRID) == 2 * sprite_bytes(GRID)
+
+    cache.unpin(["Mew"], GRID)
+    assert ("Mew", GRID) not in cache
+    assert cache.memory_usage(GRID) == sprite_bytes(GRID)
+
+
+def test_hit_and_miss_statistics():
+    cache = make_cache()
+    image = object()
+    cache.put("Snorlax", GRID, image)
+
+    assert cache.get("Snorlax", GRID) is image
+    assert cache.get("Snorlax", SUGGESTION) is None
+    assert cache.get("Munchlax", GRID) is None
+
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 2
+    assert stats['entries'] == 1
+
+
+def test_every_match_pins_its_grids_including_hand_picked_ones():
+    from src.data import PokemonDataManager
+    from src.game.pokemon_game import PokemonGuessGame
+
+    class PinningLoader:
+        image_size = GRID
+        image_cache = make_cache()
+
+        def pin_grid_sprites(self, names):
+            self.image_cache.set_pinned(names, self.image_size)
+
+    # No window: just the state start_match reads
+    game = PokemonGuessGame.__new__(PokemonGuessGame)
+    game.data_manager = PokemonDataManager()
+    game.image_loader = PinningLoader()
+    game.record_matches = False
+    names = game.data_manager.pokemon_list
+
+    game.image_loader.image_cache.set_pinned(names[100:148], GRID)  # The previous game's grids
+    game.player1_grid, game.player2_grid = names[:24], names[24:48]
+    game.player1_chosen, game.player2_chosen = names[0], names[24]
+    game.start_match()
+
+    assert game.image_loader.image_cache.tiers[GRID].pinned == set(names[:48])
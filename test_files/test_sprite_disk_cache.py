@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent resized-sprite cache
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PIL import Image
+from src.utils.sprite_disk_cache import SpriteDiskCache
+
+
+def write_sprite(path, color):
+    Image.new('RGBA', (120, 120), color).save(path)
+
+
+def test_resized_sprite_round_trips(tmp_path):
+    cache = SpriteDiskCache(str(tmp_path / 'cache'))
+    image = Image.new('RGBA', (64, 64), (255, 0, 0, 255))
+
+    cache.put('abc123', (64, 64), image)
+    loaded = cache.get('abc123', (64, 64))
+
+    assert loaded.size == (64, 64)
+    assert loaded.tobytes() == image.tobytes()
+    assert cache.get('abc123', (96, 96)) is None
+
+
+def test_file_key_follows_content(tmp_path):
+    sprite = tmp_path / 'pikachu.png'
+    write_sprite(sprite, (255, 255, 0, 255))
+    cache = SpriteDiskCache(str(tmp_path / 'cache'))
+
+    first = cache.file_key(str(sprite))
+    assert cache.file_key(str(sprite)) == first
+
+    write_sprite(sprite, (0, 0, 255, 255))
+    os.utime(sprite, ns=(1, 1))  # Make sure the stat no longer matches
+    assert cache.file_key(str(sprite)) != first
+
+
+def test_manifest_reuses_hash_without_reading(tmp_path):
+    sprite = tmp_path / 'eevee.png'
+    write_sprite(sprite, (150, 100, 50, 255))
+    cache = SpriteDiskCache(str(tmp_path / 'cache'))
+    key = cache.file_key(str(sprite))
+    cache.save()
+
+    # A new launch trusts the stored hash while mtime and size still match
+    relaunched = SpriteDiskCache(str(tmp_path / 'cache'))
+    stat = os.stat(sprite)
+    relaunched._sources[str(sprite)] = [stat.st_mtime_ns, stat.st_size, 'stored-hash']
+    assert relaunched.file_key(str(sprite)) == 'stored-hash'
+
+    relaunched = SpriteDiskCache(str(tmp_path / 'cache'))
+    assert relaunched.file_key(str(sprite)) == key
+
+
+def test_url_keys_are_stable(tmp_path):
+    cache = SpriteDiskCache(str(tmp_path / 'cache'))
+    url = 'https://example.com/sprites/1.png'
+    assert cache.url_key(url) == SpriteDiskCache(str(tmp_path / 'other')).url_key(url)
+    assert cache.url_key(url) != cache.url_key(url + '?v=2')
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming sprite downloader against a local HTTP server
+"""
+
+import sys
+import os
+import json
+
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'data_sources'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fake_pokeapi import FakePokeApi
+from sprite_downloader import SpriteDownloader, SpriteManifest, file_sha256
+
+SPRITE_PATHS = {'Bulbasaur': '/sprites/1.png', 'Venusaur': '/sprites/3.png', 'Pikachu': '/sprites/25.png'}
+
+
+def make_downloader(output_dir, **kwargs):
+    downloader = SpriteDownloader(str(output_dir), download_workers=3, encode_workers=2, queue_size=2, **kwargs)
+    downloader.client.retries = 0
+    return downloader
+
+
+def sprites_for(api):
+    return {name: api.sprite_url(os.path.basename(path)) for name, path in SPRITE_PATHS.items()}
+
+
+def run(output_dir, sprites, **kwargs):
+    downloader = make_downloader(output_dir, **kwargs)
+    try:
+        return downloader.run(sprites)
+    finally:
+        downloader.close()
+
+
+def test_downloads_normalize_sprites_and_fill_the_manifest(tmp_path):
+    with FakePokeApi() as api:
+        outcomes = run(tmp_path, sprites_for(api))
+
+    assert outcomes == {'Bulbasaur': 'downloaded', 'Venusaur': 'downloaded', 'Pikachu': 'downloaded'}
+    with Image.open(tmp_path / 'Pikachu.png') as image:
+        assert image.size == (96, 96) and image.mode == 'RGBA'
+
+    manifest = SpriteManifest(str(tmp_path / 'sprite_manifest.jsonl'))
+    for name in SPRITE_PATHS:
+        entry = manifest.get(name)
+        assert (entry['sha256'], entry['size']) == file_sha256(str(tmp_path / f"{name}.png"))
+        assert entry['etag'] and entry['url'].endswith(SPRITE_PATHS[name])
+
+
+def test_second_run_and_verify_run_make_no_requests(tmp_path):
+    with FakePokeApi() as api:
+        run(tmp_path, sprites_for(api))
+        api.requests.clear()
+        assert set(run(tmp_path, sprites_for(api)).values()) == {'cached'}
+        assert set(run(tmp_path, sprites_for(api), verify=True).values()) == {'cached'}
+
+    assert sum(api.requests.values()) == 0
+
+
+def test_verify_redownloads_only_corrupt_files(tmp_path):
+    with FakePokeApi() as api:
+        run(tmp_path, sprites_for(api))
+        # Same size, different bytes: only a hash check catches it
+        path = tmp_path / 'Venusaur.png'
+        data = bytearray(path.read_bytes())
+        data[-20] ^= 0xFF
+        path.write_bytes(bytes(data))
+
+        api.requests.clear()
+        assert run(tmp_path, sprites_for(api))['Venusaur'] == 'cached'
+        outcomes = run(tmp_path, sprites_for(api), verify=True)
+
+    assert outcomes['Venusaur'] == 'downloaded'
+    assert dict(api.requests) == {'/sprites/3.png': 1}
+
+
+def test_interrupted_download_resumes_with_only_the_missing_sprites(tmp_path):
+    with FakePokeApi() as api:
+        api.fail_next['/sprites/25.png'] = 1
+        first = run(tmp_path, sprites_for(api))
+        assert first['Pikachu'] == 'failed'
+
+        api.requests.clear()
+        second = run(tmp_path, sprites_for(api))
+
+    assert second == {'Bulbasaur': 'cached', 'Venusaur': 'cached', 'Pikachu': 'downloaded'}
+    assert dict(api.requests) == {'/sprites/25.png': 1}
+
+
+def test_revalidate_uses_conditional_requests_and_local_only_entries(tmp_path):
+    with FakePokeApi() as api:
+        run(tmp_path, sprites_for(api))
+        # Localized entries no longer carry a URL; the manifest supplies it
+        sprites = dict(sprites_for(api), Bulbasaur=None)
+        outcomes = run(tmp_path, sprites, revalidate=True)
+
+    assert set(outcomes.values()) == {'unchanged'}
+    assert sum(api.not_modified.values()) == 3
+
+
+def test_manifest_ignores_torn_last_line(tmp_path):
+    path = tmp_path / 'sprite_manifest.jsonl'
+    entry = {'name': 'Mew', 'file': 'Mew.png', 'url': None, 'etag': None, 'sha256': 'ab', 'size': 1}
+    path.write_text(json.dumps(entry) + '\n{"name": "Me', encoding='utf-8')
+    manifest = SpriteManifest(str(path))
+    assert manifest.entries == {'Mew': entry}
+
+    manifest.record(dict(entry, name='Mewtwo'))
+    manifest.close()
+    assert set(SpriteManifest(str(path)).entries) == {'Mew', 'Mewtwo'}
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Cold-start budget tests: import time, deferred imports and time to the first mainloop
+"""
+
+import sys
+import os
+import subprocess
+
+import pytest
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, REPO_ROOT)
+
+# Generous enough for a slow CI machine, tight enough to catch `requests` creeping back (~230 ms alone)
+IMPORT_BUDGET_MS = 200
+FIRST_MAINLOOP_BUDGET_MS = 1500
+DEFERRED_MODULES = ('requests', 'urllib3', 'src.screens.game_screen', 'src.screens.player_setup_screen',
+                    'src.screens.game_settings_screen', 'src.screens.pokemon_grid_setup_screen')
+
+FIRST_MAINLOOP_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import tkinter
+try:
+    tkinter.Tk().destroy()
+except tkinter.TclError:
+    sys.exit(3)
+from src import PokemonGuessGame
+game = PokemonGuessGame()
+def first_idle():
+    print(f"first-mainloop-ms {(time.perf_counter() - start) * 1000:.1f}")
+    print("screens", sorted(game.screens.screens))
+    game.root.destroy()
+game.root.after_idle(first_idle)
+game.run()
+"""
+
+
+def run_python(*args):
+    return subprocess.run([sys.executable, *args], cwd=REPO_ROOT, capture_output=True, text=True, timeout=120)
+
+
+def import_times(module):
+    """{module: cumulative import time in ms} from python -X importtime"""
+    result = run_python('-X', 'importtime', '-c', f'import {module}')
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def test_heavy_modules_stay_off_the_import_path():
+    times = import_times('src')
+    assert not [module for module in DEFERRED_MODULES if module in times]
+
+
+def test_package_import_fits_budget():
+    # Best of three so a cold disk cache doesn't fail the run
+    best = min(import_times('src')['src'] for _ in range(3))
+    assert best < IMPORT_BUDGET_MS, f"import src took {best:.0f} ms"
+
+
+def test_first_mainloop_fits_budget():
+    result = run_python('-c', FIRST_MAINLOOP_SCRIPT)
+    if result.returncode == 3:
+        pytest.skip("no display available")
+    assert result.returncode == 0, result.stderr
+
+    lines = dict(line.split(' ', 1) for line in result.stdout.splitlines() if line.startswith(('first-mainloop-ms', 'screens')))
+    assert float(lines['first-mainloop-ms']) < FIRST_MAINLOOP_BUDGET_MS
+    # Only the startup screen is built before the first frame
+    assert lines['screens'] == "['startup']"
+
+
+def test_background_catalog_load_is_waited_for():
+    from src.data import PokemonDataManager
+
+    manager = PokemonDataManager(load_in_background=True)
+    filtered = manager.filter_pokemon_by_settings({'1'}, set())
+
+    assert manager.is_loaded()
+    assert 'Bulbasaur' in filtered
+    assert manager.get_pokemon_generation('Bulbasaur') == 1
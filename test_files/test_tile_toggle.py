@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Game screen tiles: indexed lookup, restoring the stored sprite and turn-checked clicks
+"""
+
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+
+@pytest.fixture
+def game():
+    import tkinter
+    try:
+        tkinter.Tk().destroy()
+    except tkinter.TclError:
+        pytest.skip("no display available")
+
+    from src import PokemonGuessGame
+    game = PokemonGuessGame()
+    game.ensure_data_ready()
+    game.player1_name, game.player1_chosen = "Ash", game.filtered_pokemon_list[0]
+    game.player2_name, game.player2_chosen = "Gary", game.filtered_pokemon_list[1]
+    game.start_main_game()
+    yield game
+    game.root.destroy()
+
+
+def test_toggle_draws_and_restores_only_the_clicked_tile(game):
+    screen = game.game_screen
+    pokemon = next(name for name in game.player2_grid if name != game.player2_chosen)
+    tile = screen.tile_for(2, pokemon)
+    assert tile.pokemon_name == pokemon
+    sprite = tile.image_label.image
+
+    screen.on_tile_click(tile)
+    assert pokemon in game.player1_eliminated
+    assert tile.image_label.image is game.image_loader.get_x_icon()
+
+    screen.on_tile_click(tile)
+    assert pokemon not in game.player1_eliminated
+    assert tile.image_label.image is sprite
+
+
+def test_clicks_on_the_current_players_own_grid_are_ignored(game):
+    screen = game.game_screen
+    own_tile = screen.tile_for(1, game.player1_grid[0])
+
+    screen.on_tile_click(own_tile)
+    assert not game.player1_eliminated
+
+    game.end_turn()
+    screen.on_tile_click(own_tile)
+    assert game.player2_eliminated == {game.player1_grid[0]}
+    assert str(screen.grid_frames[1].cget('cursor')) == 'hand2'
+    assert str(screen.grid_frames[2].cget('cursor')) == ''
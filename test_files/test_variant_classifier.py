@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Property tests for the compiled variant classifier
+"""
+
+import sys
+import os
+import json
+import random
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'data_sources'))
+
+from variant_classifier import (FORM_MARKERS, SIZE_MARKERS, VARIANT_PATTERNS,
+                                VariantClassifier, classify_variant)
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data_sources', 'pokemon_data.json')
+
+
+def reference_classify(pokemon_name):
+    """The ordered substring checks the compiled classifier replaces"""
+    name_lower = pokemon_name.lower()
+    for variant_type, patterns in VARIANT_PATTERNS.items():
+        for pattern in patterns:
+            if pattern in name_lower:
+                return variant_type
+    if any(form in name_lower for form in FORM_MARKERS):
+        return "Form Variants"
+    if any(size in name_lower for size in SIZE_MARKERS):
+        return "Size Variants"
+    return None
+
+
+def test_agrees_with_reference_on_whole_roster():
+    with open(DATA_FILE, 'r', encoding='utf-8') as f:
+        roster = list(json.load(f))
+
+    mismatches = [name for name in roster if classify_variant(name) != reference_classify(name)]
+    assert mismatches == []
+
+
+def test_agrees_with_reference_on_random_pattern_mixes():
+    rng = random.Random(2024)
+    patterns = [pattern for group in VARIANT_PATTERNS.values() for pattern in group]
+    fragments = patterns + FORM_MARKERS + SIZE_MARKERS + ["-", "pikachu", "iron", "a", "Mr", "-cap", "x"]
+
+    for _ in range(20000):
+        name = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 4)))
+        if rng.random() < 0.5:
+            name = name.title()
+        assert classify_variant(name) == reference_classify(name), name
+
+
+def test_priority_holds_when_a_shorter_pattern_is_a_prefix():
+    classifier = VariantClassifier([("ab", "High"), ("abc", "Low"), ("c", "Lowest")])
+    assert classifier("xabcx") == "High"
+    assert classifier("xcabx") == "High"
+    assert classifier("xc") == "Lowest"
+    assert classifier("xyz") is None